@@ -11,8 +11,13 @@ action is run.
 From that point forward flow control of the application is handled
 by each action in the action stack, control returned here when
 ``:quit`` is requested by the user.
+
+When enabled, a long-lived execution environment container is started
+before the first action and removed when the application loop exits.
 """
 
+import os
+
 from typing import TYPE_CHECKING
 
 from distronode_navigator.actions import kegexes
@@ -23,6 +28,8 @@ from .configuration_subsystem.definitions import ApplicationConfiguration
 from .constants import GRAMMAR_DIR
 from .constants import TERMINAL_COLORS_PATH
 from .constants import THEME_PATH
+from .runner.warm_container import WarmContainer
+from .runner.warm_container import is_safe_to_mount
 from .steps import Steps
 from .ui_framework import Interaction
 from .ui_framework import UIConfig
@@ -98,7 +105,67 @@ class ActionRunner(ActionBase):
                 content=None,
                 ui=self._ui._ui,
             )
-            self._run_app(interaction)
+            self._start_warm_container()
+            try:
+                self._run_app(interaction)
+            finally:
+                self._close_introspection_cache()
+                self._stop_warm_container()
+
+    def _start_warm_container(self) -> None:
+        """Start the long-lived execution environment container, if enabled.
+
+        The container has the user's volume mounts, the navigator cache and utilities
+        and the current and playbook directories mounted, as the actions would request.
+        """
+        if not (self._args.execution_environment and self._args.execution_environment_warm):
+            return
+        volume_mounts = []
+        if isinstance(self._args.execution_environment_volume_mounts, list):
+            volume_mounts.extend(self._args.execution_environment_volume_mounts)
+        cache_path = self._args.internals.cache_path
+        utils_lib = os.path.join(os.path.dirname(__file__), "utils")
+        volume_mounts.append(f"{cache_path}:{cache_path}")
+        volume_mounts.append(f"{utils_lib}:/opt/distronode_navigator_utils")
+
+        host_dirs = [os.getcwd()]
+        if isinstance(self._args.playbook, str):
+            host_dirs.append(os.path.dirname(os.path.abspath(self._args.playbook)))
+        destinations = {volume_mount.split(":")[1] for volume_mount in volume_mounts}
+        for host_dir in host_dirs:
+            if host_dir not in destinations and is_safe_to_mount(host_dir):
+                volume_mounts.append(f"{host_dir}:{host_dir}")
+                destinations.add(host_dir)
+
+        container = WarmContainer(
+            container_engine=self._args.container_engine,
+            image=self._args.execution_environment_image,
+            volume_mounts=volume_mounts,
+            container_options=(
+                self._args.container_options
+                if isinstance(self._args.container_options, list)
+                else None
+            ),
+        )
+        if container.start():
+            self._logger.debug("Warm execution environment started as %s", container.name)
+            self._args.internals.warm_container = container
+
+    def _stop_warm_container(self) -> None:
+        """Remove the long-lived execution environment container."""
+        container = self._args.internals.warm_container
+        if container is not None:
+            self._logger.debug("Removing warm execution environment %s", container.name)
+            container.stop()
+            self._args.internals.warm_container = None
+
+    def _close_introspection_cache(self) -> None:
+        """Stop introspecting images in the background and close the introspection cache."""
+        cache = self._args.internals.introspection_cache
+        if cache is not None:
+            self._logger.debug("Closing the image introspection cache")
+            cache.close()
+            self._args.internals.introspection_cache = None
 
     def _run_app(self, initial_interaction: Interaction) -> None:
         """Enter the endless app loop.
@@ -1,7 +1,14 @@
-"""Helper functions for the ``actions`` package."""
+"""Helper functions for the ``actions`` package.
+
+Actions are matched against user input without importing them. The name and
+``KEGEX`` of each action is read from the source of the action modules, kept in
+the startup cache until an action module changes, and only the action matched is
+imported.
+"""
 
 from __future__ import annotations
 
+import ast
 import functools
 import importlib
 import importlib.resources as importlib_resources
@@ -15,7 +22,12 @@ from typing import Any
 from typing import Callable
 
 from distronode_navigator.action_defs import RunStdoutReturn
+from distronode_navigator.configuration_subsystem.navigator_configuration import APP_NAME
 from distronode_navigator.ui_framework import error_notification
+from distronode_navigator.utils.compatibility import Traversable
+from distronode_navigator.utils.functions import generate_cache_path
+from distronode_navigator.utils.startup_cache import StartupCache
+from distronode_navigator.utils.startup_cache import environment_key
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +40,9 @@ Kegex = namedtuple("Kegex", ("name", "kegex"))
 # Dictionary with information about all registered actions
 _ACTIONS: dict[str, dict] = {}
 
+# The name and compiled kegex of each action, by package
+_MANIFESTS: dict[str, tuple[Kegex, ...]] = {}
+
 
 def _import(package: str, action: str) -> None:
     """Import the given action from a package.
@@ -38,14 +53,114 @@ def _import(package: str, action: str) -> None:
     importlib.import_module(f"{package}.{action}")
 
 
+def _action_files(package: str) -> list[Traversable]:
+    """List the modules of the actions in a package.
+
+    :param package: The name of the package
+    :returns: The action modules, by name
+    """
+    files = (
+        entry
+        for entry in importlib_resources.files(package).iterdir()
+        if entry.is_file() and entry.name.endswith(".py") and not entry.name.startswith("_")
+    )
+    return sorted(files, key=lambda entry: entry.name)
+
+
 def _import_all(package: str) -> None:
     """Import all actions in a package.
 
     :param package: The name of the package
     """
-    for entry in importlib_resources.files(package).iterdir():
-        if entry.is_file() and entry.name.endswith(".py") and not entry.name.startswith("_"):
-            _import(package, entry.name[0:-3])
+    for entry in _action_files(package):
+        _import(package, entry.name[0:-3])
+
+
+def _is_register(decorator: ast.expr) -> bool:
+    """Determine if a class decorator registers an action.
+
+    :param decorator: The decorator
+    :returns: True if the decorator is ``register`` or ``actions.register``
+    """
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr == "register"
+    return isinstance(decorator, ast.Name) and decorator.id == "register"
+
+
+def _static_kegex(source: str) -> str | None:
+    """Read the ``KEGEX`` of the action registered in the source of a module.
+
+    :param source: The source of the module
+    :returns: The ``KEGEX``, or None if it is not a string literal of a registered class
+    """
+    try:
+        module = ast.parse(source)
+    except SyntaxError:
+        return None
+    for node in module.body:
+        if not isinstance(node, ast.ClassDef) or not any(
+            _is_register(decorator) for decorator in node.decorator_list
+        ):
+            continue
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "KEGEX"
+                for target in statement.targets
+            ):
+                try:
+                    kegex = ast.literal_eval(statement.value)
+                except ValueError:
+                    return None
+                return kegex if isinstance(kegex, str) else None
+    return None
+
+
+def _build_manifest(package: str, files: list[Traversable]) -> dict[str, str]:
+    """Determine the ``KEGEX`` of each action in a package.
+
+    A module is only imported if the ``KEGEX`` cannot be read from its source.
+
+    :param package: The name of the package
+    :param files: The action modules
+    :returns: The ``KEGEX`` of each action, by action name
+    """
+    manifest = {}
+    for entry in files:
+        name = entry.name[0:-3]
+        kegex = _static_kegex(entry.read_text(encoding="utf-8"))
+        if kegex is None:
+            _import(package, name)
+            action = _ACTIONS.get(package, {}).get(name)
+            if action is None:
+                continue
+            kegex = action.kegex.pattern
+        manifest[name] = kegex
+    return manifest
+
+
+def manifest(package: str) -> tuple[Kegex, ...]:
+    """Return the name and compiled ``KEGEX`` of each action in a package.
+
+    :param package: The name of the package
+    :returns: The name and ``kegex`` of each action, by action name
+    """
+    kegexes = _MANIFESTS.get(package)
+    if kegexes is None:
+        files = _action_files(package)
+        cache = StartupCache(generate_cache_path(APP_NAME.replace("_", "-")))
+        key = environment_key(
+            paths=[str(importlib_resources.files(package)), *(str(entry) for entry in files)],
+            values=[package],
+        )
+        patterns = cache.get("action_kegexes", key)
+        if patterns is None:
+            patterns = _build_manifest(package, files)
+            cache.set("action_kegexes", key, patterns)
+        kegexes = tuple(
+            Kegex(name=name, kegex=re.compile(patterns[name])) for name in sorted(patterns)
+        )
+        _MANIFESTS[package] = kegexes
+    return kegexes
 
 
 def register(cls: Any) -> Any:
@@ -92,13 +207,12 @@ def kegex(package: str, action: str) -> tuple:
 
 
 def kegexes(package: str) -> Generator:
-    """Return a tuple of tuples, name, ``kegex`` for all actions.
+    """Return a tuple of tuples, name, ``kegex`` for all actions, without importing them.
 
     :param package: The name of the package
     :returns: A generator for all ``kegexes``
     """
-    _import_all(package)
-    return (kegex(package, name) for name in names(package))
+    return (kegex for kegex in manifest(package))
 
 
 def kegexes_factory(package: str) -> Callable:
@@ -116,8 +230,7 @@ def names(package: str) -> list:
     :param package: The name of the package
     :returns: All packages
     """
-    _import_all(package)
-    return sorted(_ACTIONS[package])
+    return [kegex.name for kegex in manifest(package)]
 
 
 def names_factory(package: str) -> Callable:
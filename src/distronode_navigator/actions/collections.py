@@ -296,9 +296,10 @@ class Action(ActionBase):
         selected_collection = self._collections[self.steps.current.index]
         collection_name = f"__{selected_collection['known_as']}"
         collection_contents = []
+        plugin_docs = self._collection_cache.get_many(selected_collection["plugin_checksums"])
         for plugin_checksum, details in selected_collection["plugin_checksums"].items():
             try:
-                plugin_json = self._collection_cache[plugin_checksum]
+                plugin_json = plugin_docs[plugin_checksum]
                 loaded = json.loads(plugin_json)
 
                 plugin = loaded["plugin"]
@@ -409,6 +410,7 @@ class Action(ActionBase):
             "private_data_dir": self._args.distronode_runner_artifact_dir,
             "rotate_artifacts": self._args.distronode_runner_rotate_artifacts_count,
             "timeout": self._args.distronode_runner_timeout,
+            "warm_container": self._args.internals.warm_container,
         }
 
         if isinstance(self._args.playbook, str):
@@ -603,13 +605,14 @@ class Action(ActionBase):
         :returns: The plugin details like full-name, type and short description.
         """
         plugins_details: dict = {}
+        plugin_jsons = self._collection_cache.get_many(selected_collection["plugin_checksums"])
 
         for plugin_checksum, plugin_info in selected_collection["plugin_checksums"].items():
             plugin_type = plugin_info.get("type")
             if plugin_type not in plugins_details:
                 plugins_details[plugin_type] = []
 
-            plugin_json = self._collection_cache[plugin_checksum]
+            plugin_json = plugin_jsons[plugin_checksum]
             loaded = json.loads(plugin_json)
 
             plugin = loaded.get("plugin")
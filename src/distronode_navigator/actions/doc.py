@@ -160,6 +160,7 @@ class Action(ActionBase):
             "private_data_dir": self._args.distronode_runner_artifact_dir,
             "rotate_artifacts": self._args.distronode_runner_rotate_artifacts_count,
             "timeout": self._args.distronode_runner_timeout,
+            "warm_container": self._args.internals.warm_container,
         }
 
         if isinstance(self._args.execution_environment_volume_mounts, list):
@@ -5,6 +5,7 @@ from __future__ import annotations
 import curses
 import json
 import shlex
+import sqlite3
 
 from copy import deepcopy
 from functools import partial
@@ -13,10 +14,14 @@ from typing import Any
 from distronode_navigator.action_base import ActionBase
 from distronode_navigator.action_defs import RunStdoutReturn
 from distronode_navigator.app_public import AppPublic
+from distronode_navigator.command_runner import CommandRunner
 from distronode_navigator.configuration_subsystem import Constants
 from distronode_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from distronode_navigator.content_defs import ContentFormat
+from distronode_navigator.image_manager import IntrospectionCache
+from distronode_navigator.image_manager import image_digest
 from distronode_navigator.image_manager import inspect_all
+from distronode_navigator.image_manager.inspector import ImagesInspect
 from distronode_navigator.runner import Command
 from distronode_navigator.steps import Step
 from distronode_navigator.ui_framework import CursesLine
@@ -161,14 +166,20 @@ class Action(ActionBase):
         """
         image_name = self._args.execution_environment_image
 
-        output, error, return_code = self._run_runner(image_name=image_name)
-        if error or return_code:
-            return RunStdoutReturn(message=error, return_code=return_code)
-
-        details = self._parse(output)
+        cache = self._cache()
+        digest = self._inspect_digest(image_name) if cache else ""
+        details = cache.get(digest) if cache else None
         if details is None:
-            message = "Image introspection failed, please check the logs and log an issue."
-            return RunStdoutReturn(message=message, return_code=1)
+            output, error, return_code = self._run_runner(image_name=image_name)
+            if error or return_code:
+                return RunStdoutReturn(message=error, return_code=return_code)
+
+            details = self._parse(output)
+            if details is None:
+                message = "Image introspection failed, please check the logs and log an issue."
+                return RunStdoutReturn(message=message, return_code=1)
+            if cache:
+                cache.set(digest, details)
 
         details.pop("errors")
         sections = self._args.entry("images_details").value.current
@@ -222,6 +233,9 @@ class Action(ActionBase):
             self._logger.error(messages[0])
             return None
 
+        if self._args.images_prewarm is True:
+            self._prewarm()
+
         self.steps.append(self._images)
 
         while True:
@@ -467,7 +481,7 @@ class Action(ActionBase):
         self._images.value = sorted(images, key=lambda i: i["name"])
 
     def _introspect_image(self) -> bool:
-        """Use the runner subsystem to introspect an image.
+        """Introspect the selected image, unless its introspection is cached.
 
         :returns: An indication of image introspection success
         """
@@ -477,44 +491,109 @@ class Action(ActionBase):
 
         self._images.selected["__introspected"] = True
 
-        output, error, _return_code = self._run_runner(
-            image_name=self._images.selected["__full_name"],
-        )
+        cache = self._cache()
+        digest = image_digest(self._images.selected)
+        parsed = cache.get(digest) if cache else None
+        if parsed is None:
+            parsed = self._introspect(image_name=self._images.selected["__full_name"])
+            if parsed is None:
+                self.notify_failed()
+                return False
+            if cache:
+                cache.set(digest, parsed)
+
+        self._images.selected.update(self._introspection_details(parsed))
+        return True
+
+    def _introspect(self, image_name: str) -> dict | None:
+        """Use the runner subsystem to introspect an image.
+
+        :param image_name: The full image name
+        :returns: The parsed introspection, or None if introspection failed
+        """
+        output, error, _return_code = self._run_runner(image_name=image_name)
 
         if error:
             self._logger.error(
                 "Image introspection failed (runner), the return value was: %s",
                 error,
             )
-            self.notify_failed()
-            return False
+            return None
         parsed = self._parse(output)
         if parsed is None:
-            self.notify_failed()
-            return False
+            return None
 
         try:
-            self._images.selected["general"] = {
+            self._introspection_details(parsed)
+        except KeyError:
+            self._logger.exception(
+                "Image introspection failed (keys), the return value was: %s",
+                output[0:1000],
+            )
+            return None
+        return parsed
+
+    @staticmethod
+    def _introspection_details(parsed: dict) -> dict:
+        """Build the image details shown from the parsed introspection.
+
+        :param parsed: The parsed introspection
+        :returns: The general, distronode, python and system details of the image
+        """
+        return {
+            "general": {
                 "os": parsed["os_release"],
                 "friendly": parsed["redhat_release"],
                 "python": parsed["python_version"],
-            }
-            self._images.selected["distronode"] = {
+            },
+            "distronode": {
                 "distronode": {
                     "collections": parsed["distronode_collections"],
                     "version": parsed["distronode_version"],
                 },
-            }
-            self._images.selected["python"] = parsed["python_packages"]
-            self._images.selected["system"] = parsed["system_packages"]
-        except KeyError:
-            self._logger.exception(
-                "Image introspection failed (keys), the return value was: %s",
-                output[0:1000],
-            )
-            self.notify_failed()
-            return False
-        return True
+            },
+            "python": parsed["python_packages"],
+            "system": parsed["system_packages"],
+        }
+
+    def _cache(self) -> IntrospectionCache | None:
+        """Open the introspection cache in the cache path, once for the session.
+
+        :returns: The introspection cache, or None if it is not available
+        """
+        internals = self._args.internals
+        if internals.introspection_cache is None:
+            try:
+                internals.introspection_cache = IntrospectionCache(internals.cache_path)
+            except sqlite3.Error:
+                self._logger.exception("Unable to open the image introspection cache")
+                return None
+        return internals.introspection_cache
+
+    def _inspect_digest(self, image_name: str) -> str:
+        """Inspect an image to determine its digest.
+
+        :param image_name: The full image name
+        :returns: The image digest, or an empty string if the image could not be inspected
+        """
+        inspector = ImagesInspect(container_engine=self._args.container_engine, ids=[image_name])
+        (inspect,) = CommandRunner.run_single_process(commands=inspector.commands)
+        if not inspect.details:
+            self._logger.debug("Unable to inspect image %s", image_name)
+            return ""
+        return image_digest({"inspect": {"details": inspect.details[0]}})
+
+    def _prewarm(self) -> None:
+        """Introspect the execution environment images not yet cached in the background."""
+        cache = self._cache()
+        if cache is None:
+            return
+        images = {
+            image_digest(image): image["__full_name"]
+            for image in self._images.value
+            if image["execution_environment"]
+        }
+        cache.prewarm(images=images, introspect=self._introspect)
 
     def _parse(self, output) -> dict | None:
         """Load and process the ``json`` output from the image introspection process.
@@ -561,6 +640,7 @@ class Action(ActionBase):
             "execution_environment_image": image_name,
             "execution_environment": True,
             "navigator_mode": "interactive",
+            "warm_container": self._args.internals.warm_container,
         }
 
         if isinstance(self._args.container_options, list):
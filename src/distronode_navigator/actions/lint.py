@@ -234,6 +234,7 @@ class Action(ActionBase):
             "rotate_artifacts": self._args.distronode_runner_rotate_artifacts_count,
             "timeout": self._args.distronode_runner_timeout,
             "host_cwd": os.getcwd(),
+            "warm_container": self._args.internals.warm_container,
         }
 
         if isinstance(self._args.execution_environment_volume_mounts, list):
@@ -9,13 +9,12 @@ import os
 import re
 import shlex
 import shutil
-import time
 import uuid
 
+from collections.abc import Sequence
 from math import floor
 from operator import itemgetter
 from pathlib import Path
-from queue import Queue
 from typing import Any
 from typing import Callable
 
@@ -28,6 +27,7 @@ from distronode_navigator.configuration_subsystem.definitions import Application
 from distronode_navigator.content_defs import ContentView
 from distronode_navigator.content_defs import SerializationFormat
 from distronode_navigator.runner import CommandAsync
+from distronode_navigator.runner import EventChannel
 from distronode_navigator.steps import Step
 from distronode_navigator.ui_framework import CursesLine
 from distronode_navigator.ui_framework import CursesLinePart
@@ -37,6 +37,9 @@ from distronode_navigator.ui_framework import dict_to_form
 from distronode_navigator.ui_framework import form_to_dict
 from distronode_navigator.ui_framework import nonblocking_notification
 from distronode_navigator.ui_framework import warning_notification
+from distronode_navigator.utils.compression import compression_from_content
+from distronode_navigator.utils.compression import compression_from_name
+from distronode_navigator.utils.compression import open_text
 from distronode_navigator.utils.functions import abs_user_path
 from distronode_navigator.utils.functions import check_playbook_type
 from distronode_navigator.utils.functions import human_time
@@ -44,7 +47,15 @@ from distronode_navigator.utils.functions import is_jinja
 from distronode_navigator.utils.functions import now_iso
 from distronode_navigator.utils.functions import remove_ansi
 from distronode_navigator.utils.functions import round_half_up
+from distronode_navigator.utils.line_buffer import DEFAULT_MEMORY_LINES
+from distronode_navigator.utils.line_buffer import LineBuffer
+from distronode_navigator.utils.playbook_artifact import ArtifactWriter
+from distronode_navigator.utils.playbook_artifact import is_line_delimited
+from distronode_navigator.utils.playbook_artifact import is_line_delimited_name
+from distronode_navigator.utils.playbook_artifact import read_records
 from distronode_navigator.utils.serialize import serialize_write_file
+from distronode_navigator.utils.spill_store import SpillStore
+from distronode_navigator.utils.wakeup import Wakeup
 
 from . import _actions as actions
 from . import run_action
@@ -60,6 +71,28 @@ RESULT_TO_COLOR = [
 ]
 
 
+HANDLED_EVENTS = (
+    "error",
+    "playbook_on_play_start",
+    "playbook_on_task_start",
+    "runner_on_failed",
+    "runner_on_ok",
+    "runner_on_skipped",
+    "runner_on_start",
+    "runner_on_unreachable",
+    "verbose",
+)
+
+
+def stdout_only(message: dict[str, Any]) -> bool:
+    """Determine if only the standard out of a runner message is used.
+
+    :param message: The message from runner
+    :returns: True if the message can be reduced to its standard out
+    """
+    return "event" in message and message["event"] not in HANDLED_EVENTS
+
+
 def get_color(word):
     """Retrieve color value matching the keyword.
 
@@ -177,6 +210,20 @@ PLAY_COLUMNS = [
     "__progress",
 ]
 
+PLAY_RESULT_COUNTERS = (
+    "__ok",
+    "__skipped",
+    "__failed",
+    "__unreachable",
+    "__ignored",
+    "__in progress",
+)
+
+TASK_INDEX_KEY = ("play_uuid", "task_uuid", "host")
+
+WAKEUP_TIMEOUT = 1.0
+"""The most seconds to sleep waiting for runner, in case a wakeup is missed"""
+
 TASK_LIST_COLUMNS = [
     "__result",
     "__host",
@@ -188,6 +235,133 @@ TASK_LIST_COLUMNS = [
 ]
 
 
+class TaskRow:
+    """A compact row for a task, holding only what is needed for the task list.
+
+    The row can be read like the task's event data for the keys it holds. The full
+    event data for the task is kept out of line, in a spill store, using the payload key.
+    """
+
+    __slots__ = (
+        "changed",
+        "duration",
+        "host",
+        "number",
+        "payload",
+        "play",
+        "play_uuid",
+        "result",
+        "row_version",
+        "task",
+        "task_action",
+        "task_name",
+        "task_uuid",
+    )
+
+    KEYS = {
+        "__changed": "changed",
+        "__duration": "duration",
+        "__host": "host",
+        "__number": "number",
+        "__result": "result",
+        "__task": "task_name",
+        "__task_action": "task_action",
+        "host": "host",
+        "play": "play",
+        "play_uuid": "play_uuid",
+        "task": "task",
+        "task_uuid": "task_uuid",
+    }
+
+    def __init__(self, event_data: dict[str, Any], payload: int) -> None:
+        """Initialize the task row.
+
+        :param event_data: The event data for the task
+        :param payload: The key for the full event data in the spill store
+        """
+        for attribute in self.KEYS.values():
+            setattr(self, attribute, None)
+        self.payload = payload
+        self.row_version = 0
+        """Incremented with each update, so the menu can tell when the row changed"""
+        self.update(event_data)
+
+    def __contains__(self, key: object) -> bool:
+        """Determine if the row holds a key.
+
+        :param key: The key
+        :returns: True if the row holds the key
+        """
+        return key in self.KEYS
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value for a key.
+
+        :param key: The key
+        :returns: The value
+        """
+        return getattr(self, self.KEYS[key])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value for a key.
+
+        :param key: The key
+        :param default: The value returned when the row does not hold the key
+        :returns: The value
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Get the keys and values held by the row.
+
+        :returns: The keys and values
+        """
+        return [(key, getattr(self, attribute)) for key, attribute in self.KEYS.items()]
+
+    def update(self, event_data: dict[str, Any]) -> None:
+        """Update the row from event data, keys the row does not hold are ignored.
+
+        :param event_data: The event data for the task
+        """
+        for key, attribute in self.KEYS.items():
+            if key in event_data:
+                setattr(self, attribute, event_data[key])
+        self.row_version += 1
+
+
+class TaskPayloads(Sequence):
+    """The full event data for a list of tasks, loaded from the spill store when accessed."""
+
+    def __init__(self, rows: list[TaskRow], store: SpillStore) -> None:
+        """Initialize the task payloads.
+
+        :param rows: The rows of the tasks
+        :param store: The spill store holding the event data for the tasks
+        """
+        self._rows = rows
+        self._store = store
+
+    def __len__(self) -> int:
+        """Return the number of tasks.
+
+        :returns: The number of tasks
+        """
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        """Get the event data for one or more tasks.
+
+        :param index: The index or slice of the tasks
+        :returns: The event data for the task or a list of event data for the tasks
+        """
+        if isinstance(index, slice):
+            return [self._store.get(row.payload) for row in self._rows[index]]
+        return self._store.get(self._rows[index].payload)
+
+
 @actions.register
 class Action(ActionBase):
     # pylint: disable=too-many-instance-attributes
@@ -208,7 +382,9 @@ class Action(ActionBase):
 
         self._subaction_type: str
         self._msg_from_plays: tuple[str | None, int | None] = (None, None)
-        self._queue: Queue = Queue()
+        self._wakeup = Wakeup()
+        """Set by the event channel when runner posts an event or finishes"""
+        self._queue = EventChannel(coalescible=stdout_only, wakeup=self._wakeup)
         self.runner: CommandAsync
         self._runner_finished: bool
         self._auto_scroll = False
@@ -220,7 +396,6 @@ class Action(ActionBase):
             step_type="menu",
             columns=PLAY_COLUMNS,
             value=[],
-            show_func=self._play_stats,
             select_func=self._task_list_for_play,
         )
         self._task_list_columns: list[str] = TASK_LIST_COLUMNS
@@ -228,6 +403,15 @@ class Action(ActionBase):
         self._playbook_type: str = check_playbook_type(self._args.playbook)
         self._task_cache: dict[str, str] = {}
         """Task name storage from playbook_on_start using the task uuid as the key"""
+        self._play_index: dict[str, dict[str, Any]] = {}
+        """Play storage using the play uuid as the key, for parent play lookups"""
+        self._task_index: dict[tuple[str, str, str], TaskRow] = {}
+        """Task storage using the play uuid, task uuid and host as the key, for finished tasks"""
+        self._task_payloads = SpillStore()
+        """The full event data for each task, held out of line from the task rows"""
+        self._artifact_writer: ArtifactWriter | None = None
+        """The line-delimited artifact written to while the playbook runs"""
+        self.stdout: LineBuffer = self._new_stdout()
 
     @property
     def mode(self):
@@ -270,9 +454,9 @@ class Action(ActionBase):
                     self.write_artifact()
                 self._logger.debug("runner finished")
                 break
-            # Sleep briefly to prevent 100% CPU utilization
+            # Sleep until runner posts an event or finishes
             # in mode stdout, the delay introduced by the curses key read is not present
-            time.sleep(0.01)
+            self._wakeup.wait(WAKEUP_TIMEOUT)
         return_code = self.runner.distronode_runner_instance.rc
         if return_code != 0:
             return RunStdoutReturn(
@@ -316,8 +500,12 @@ class Action(ActionBase):
             notification = nonblocking_notification(messages=messages)
             interaction.ui.show_form(notification)
             while not self._first_message_received:
+                self._wakeup.wait(WAKEUP_TIMEOUT)
                 self.update()
 
+        # Refresh the screen as events arrive, rather than at each refresh time
+        interaction.ui.add_wakeup(self._wakeup)
+
         while True:
             self.update()
 
@@ -416,13 +604,19 @@ class Action(ActionBase):
                 return False
             artifact_file = populated_form["fields"]["artifact_file"]["value"]
 
+        if is_line_delimited(artifact_file):
+            return self._replay_line_delimited(artifact_file)
+
         try:
-            with open(artifact_file, encoding="utf-8") as fh:
+            with open_text(artifact_file, "r", compression_from_content(artifact_file)) as fh:
                 data = json.load(fh)
         except json.JSONDecodeError as exc:
             self._logger.debug("json decode error: %s", str(exc))
             self._logger.error("Unable to parse artifact file")
             return False
+        except (EOFError, OSError, ValueError) as exc:
+            self._logger.error("Unable to read artifact file: %s", str(exc))
+            return False
 
         version = data.get("version", "")
         if version.startswith("1.") or version.startswith("2."):
@@ -430,8 +624,9 @@ class Action(ActionBase):
                 stdout = data["stdout"]
                 if self.mode == "interactive":
                     self._plays.value = data["plays"]
+                    self._index_plays()
                     self._interaction.ui.update_status(data["status"], data["status_color"])
-                    self.stdout = stdout
+                    self.stdout = self._new_stdout(stdout)
                 else:
                     for line in data["stdout"]:
                         if self._args.display_color is True:
@@ -453,6 +648,63 @@ class Action(ActionBase):
         self._logger.debug("Completed replay artifact request with mode %s", self.mode)
         return True
 
+    def _replay_line_delimited(self, artifact_file: str) -> bool:
+        """Replay a line-delimited artifact, one record at a time.
+
+        The plays and tasks are indexed as they are read, the event data for each task
+        is held out of line until the task is shown.
+
+        :param artifact_file: The path to the artifact file
+        :returns: True if replay completes, False if there is an error
+        """
+        status, status_color = "unknown", 0
+        self._plays.value = []
+        self._index_plays()
+        self.stdout = self._new_stdout()
+        for record in read_records(artifact_file):
+            if "stdout" in record:
+                if self.mode == "interactive":
+                    self.stdout.extend(record["stdout"])
+                else:
+                    for line in record["stdout"]:
+                        print(line if self._args.display_color is True else remove_ansi(line))
+            elif "play" in record and self.mode == "interactive":
+                play = record["play"]
+                play["tasks"] = []
+                self._plays.value.append(play)
+                self._play_index.setdefault(play["uuid"], play)
+            elif "task" in record and self.mode == "interactive":
+                self._replay_task(record["task"])
+            elif "status" in record:
+                status, status_color = record["status"], record["status_color"]
+
+        if self.mode == "interactive":
+            self._index_plays()
+            self._interaction.ui.update_status(status, status_color)
+        self._runner_finished = True
+        self._logger.debug("Completed replay artifact request with mode %s", self.mode)
+        return True
+
+    def _replay_task(self, event_data: dict[str, Any]) -> None:
+        """Add or replace a task read from a line-delimited artifact.
+
+        :param event_data: The event data for the task
+        """
+        key = itemgetter(*TASK_INDEX_KEY)(event_data)
+        task = self._task_index.get(key)
+        if task is not None:
+            self._task_payloads.replace(task.payload, event_data)
+            task.update(event_data)
+            return
+        try:
+            play = self._play_index[event_data["play_uuid"]]
+        except KeyError:
+            self._logger.warning("Artifact task without parent play")
+            return
+        task = TaskRow(event_data, payload=self._task_payloads.add(event_data))
+        play["tasks"].append(task)
+        self._task_index[key] = task
+
     def _prompt_for_artifact(self, artifact_file: str) -> dict[Any, Any]:
         """Prompt for a valid artifact file.
 
@@ -621,21 +873,29 @@ class Action(ActionBase):
             write_job_events=self._args.distronode_runner_write_job_events,
             **kwargs,
         )
+        self._start_artifact()
         self.runner.run()
         self._runner_finished = False
         self._logger.debug("runner requested to start")
 
     def _dequeue(self) -> None:
-        """Drain the runner queue."""
-        drain_count = 0
-        while not self._queue.empty():
-            if not self._first_message_received:
-                self._first_message_received = True
-            message = self._queue.get()
+        """Drain the runner event channel."""
+        messages = self._queue.drain()
+        if not messages:
+            return
+        self._first_message_received = True
+        for message in messages:
             self._handle_message(message)
-            drain_count += 1
-        if drain_count:
-            self._logger.debug("Drained %s events", drain_count)
+        if self._artifact_writer is not None:
+            self._artifact_writer.flush()
+        stats = self._queue.stats
+        self._logger.debug(
+            "Drained %s events, max depth %s, coalesced %s, dropped %s",
+            len(messages),
+            stats.max_depth,
+            stats.coalesced,
+            stats.dropped,
+        )
 
     def _handle_message(self, message: dict) -> None:
         # pylint: disable=too-many-locals
@@ -646,7 +906,9 @@ class Action(ActionBase):
         """
         # Collect any stdout
         if message.get("stdout"):
-            self.stdout.extend(message["stdout"].splitlines())
+            lines = message["stdout"].splitlines()
+            self.stdout.extend(lines)
+            self._write_artifact_record({"stdout": lines})
             if self.mode == "stdout_w_artifact":
                 print(message["stdout"])
 
@@ -671,8 +933,11 @@ class Action(ActionBase):
 
         if event == "playbook_on_play_start":
             event_data["__play_name"] = event_data["name"]
+            self._write_artifact_record({"play": event_data})
             event_data["tasks"] = []
+            self._reset_play_stats(event_data)
             self._plays.value.append(event_data)
+            self._play_index.setdefault(event_data["uuid"], event_data)
             return
 
         if event == "playbook_on_task_start":
@@ -689,8 +954,8 @@ class Action(ActionBase):
 
         # Find the parent play of the task
         try:
-            play = next(p for p in self._plays.value if p["uuid"] == event_data["play_uuid"])
-        except StopIteration:
+            play = self._play_index[event_data["play_uuid"]]
+        except KeyError:
             self._logger.warning("Playbook event without parent play")
             return
 
@@ -713,16 +978,19 @@ class Action(ActionBase):
                     "__task": previous_name if use_previous else event_data["task"],
                 },
             )
-            play["tasks"].append(event_data)
+            task = TaskRow(event_data, payload=self._task_payloads.add(event_data))
+            play["tasks"].append(task)
+            self._task_index.setdefault(itemgetter(*TASK_INDEX_KEY)(task), task)
+            self._write_artifact_record({"task": event_data})
+            play["__task_count"] += 1
+            self._count_task(play, task, 1)
+            self._update_play_progress(play)
             return
 
         # The runner event indicates a task has finished, find the task in the play
-        match = ("task_uuid", "host")
         try:
-            task = next(
-                t for t in play["tasks"] if itemgetter(*match)(t) == itemgetter(*match)(event_data)
-            )
-        except StopIteration:
+            task = self._task_index[itemgetter(*TASK_INDEX_KEY)(event_data)]
+        except KeyError:
             self._logger.warning("Task event without parent task")
             return
 
@@ -755,31 +1023,91 @@ class Action(ActionBase):
         if no_longer_templated or changed_and_not_templated:
             event_data["__task"] = event_data["task"]
 
+        # The event carries the full event data, what was added when the task started is in the row
+        for key, value in task.items():
+            event_data.setdefault(key, value)
+        self._task_payloads.replace(task.payload, event_data)
+        self._write_artifact_record({"task": event_data})
+        self._count_task(play, task, -1)
         task.update(event_data)
+        self._count_task(play, task, 1)
+        self._update_play_progress(play)
 
-    def _play_stats(self) -> None:
-        """Calculate the play's stats based on it's tasks."""
-        for idx, play in enumerate(self._plays.value):
-            total = ["__ok", "__skipped", "__failed", "__unreachable", "__ignored", "__in progress"]
-            self._plays.value[idx].update(
-                {
-                    tot: len([t for t in play["tasks"] if t["__result"].lower() == tot[2:]])
-                    for tot in total
-                },
-            )
-            self._plays.value[idx]["__changed"] = len(
-                [t for t in play["tasks"] if t["__changed"] is True],
-            )
-            task_count = len(play["tasks"])
-            self._plays.value[idx]["__task_count"] = task_count
-            completed = task_count - self._plays.value[idx]["__in progress"]
-            if completed:
-                new = floor(completed / task_count * 100)
-                current = self._plays.value[idx].get("__percent_complete", 0)
-                self._plays.value[idx]["__percent_complete"] = max(new, current)
-                self._plays.value[idx]["__progress"] = str(max(new, current)) + "%"
-            else:
-                self._plays.value[idx]["__progress"] = "0%"
+    def _new_stdout(self, lines: list[str] | None = None) -> LineBuffer:
+        """Create a buffer for the playbook output, holding only the most recent lines in memory.
+
+        :param lines: Initial lines
+        :returns: The buffer
+        """
+        memory_lines = self._args.stdout_memory_lines
+        if not isinstance(memory_lines, int):
+            memory_lines = DEFAULT_MEMORY_LINES
+        return LineBuffer(memory_lines=memory_lines, lines=lines or ())
+
+    def _index_plays(self) -> None:
+        """Rebuild the play and task indexes and play stats from the current plays.
+
+        Tasks not yet held as rows, as when loaded from an artifact, are converted to rows.
+        The first play or task for a given key wins, matching the order in which
+        they were originally received from runner.
+        """
+        self._play_index = {}
+        self._task_index = {}
+        if not self._plays.value:
+            self._task_payloads.clear()
+        for play in self._plays.value:
+            self._play_index.setdefault(play["uuid"], play)
+            self._reset_play_stats(play)
+            play["tasks"] = [
+                (
+                    task
+                    if isinstance(task, TaskRow)
+                    else TaskRow(task, payload=self._task_payloads.add(task))
+                )
+                for task in play["tasks"]
+            ]
+            for task in play["tasks"]:
+                self._task_index.setdefault(itemgetter(*TASK_INDEX_KEY)(task), task)
+                self._count_task(play, task, 1)
+            play["__task_count"] = len(play["tasks"])
+            self._update_play_progress(play)
+
+    @staticmethod
+    def _reset_play_stats(play: dict[str, Any]) -> None:
+        """Set the play's stats to zero.
+
+        :param play: The play
+        """
+        play.update(dict.fromkeys(PLAY_RESULT_COUNTERS, 0))
+        play.update({"__changed": 0, "__progress": "0%", "__task_count": 0})
+
+    @staticmethod
+    def _count_task(play: dict[str, Any], task: TaskRow, count: int) -> None:
+        """Add or remove a task's result from the play's stats.
+
+        :param play: The parent play of the task
+        :param task: The task
+        :param count: 1 to add the task's result, -1 to remove it
+        """
+        play[f"__{task['__result'].lower()}"] += count
+        if task["__changed"] is True:
+            play["__changed"] += count
+
+    @staticmethod
+    def _update_play_progress(play: dict[str, Any]) -> None:
+        """Update the play's progress from it's stats, progress never decreases.
+
+        :param play: The play
+        """
+        task_count = play["__task_count"]
+        completed = task_count - play["__in progress"]
+        if completed:
+            new = floor(completed / task_count * 100)
+            current = play.get("__percent_complete", 0)
+            play["__percent_complete"] = max(new, current)
+            play["__progress"] = str(max(new, current)) + "%"
+        else:
+            play["__progress"] = "0%"
 
     def _prepare_to_quit(self, interaction: Interaction) -> bool:
         """Pre-quit tasks.
@@ -792,8 +1120,10 @@ class Action(ActionBase):
             if interaction.action.match.groupdict()["exclamation"]:
                 self._logger.debug("shutting down runner")
                 self.runner.cancelled = True
+                # Release the runner thread if it is waiting on a full event channel
+                self._queue.close()
                 while not self.runner.finished:
-                    pass
+                    self._wakeup.wait(WAKEUP_TIMEOUT)
                 self.write_artifact()
                 return True
             self._logger.warning("Quit requested but playbook running, try q! or quit!")
@@ -801,6 +1131,14 @@ class Action(ActionBase):
         self._logger.debug("runner not running")
         return True
 
+    def _prepare_to_exit(self, interaction: Interaction) -> None:
+        """Stop refreshing the screen as events arrive, then prepare for exit.
+
+        :param interaction: The current interaction from the UI
+        """
+        interaction.ui.remove_wakeup(self._wakeup)
+        super()._prepare_to_exit(interaction)
+
     def _task_list_for_play(self) -> Step:
         """Generate a menu of tasks for the currently selected play.
 
@@ -821,11 +1159,21 @@ class Action(ActionBase):
 
         :returns: Content which shows a task
         """
-        value = self.steps.current.value
+        value = TaskPayloads(self.steps.current.value, self._task_payloads)
         index = self.steps.current.index
         step = Step(name="task", step_type="content", index=index, value=value)
         return step
 
+    def _plays_with_payloads(self) -> list[dict[str, Any]]:
+        """Get the plays with the full event data for each task.
+
+        :returns: The plays, each with a list of the event data for its tasks
+        """
+        return [
+            {**play, "tasks": list(TaskPayloads(play["tasks"], self._task_payloads))}
+            for play in self._plays.value
+        ]
+
     def update(self) -> None:
         """Drain the queue, set the status and write the artifact if needed."""
         # let the calling app update as well
@@ -870,53 +1218,141 @@ class Action(ActionBase):
         status, status_color = self._get_status()
         self._interaction.ui.update_status(status, status_color)
 
+    def _format_artifact_filename(self, filename: str, status: str, time_stamp: str) -> str:
+        """Format and resolve the artifact file name.
+
+        :param filename: The artifact file name, possibly with placeholders
+        :param status: The status of the playbook run
+        :param time_stamp: The time stamp
+        :returns: The full path of the artifact file
+        """
+        playbook = self._args.playbook
+        if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
+            playbook = next(k["playbook"] for k in self._plays.value)
+        filename = filename.format(
+            playbook_dir=os.path.dirname(playbook),
+            playbook_name=os.path.splitext(os.path.basename(playbook))[0],
+            playbook_status=status,
+            time_stamp=time_stamp,
+        )
+        self._logger.debug("Formatted artifact file name set to %s", filename)
+        filename = abs_user_path(filename)
+        self._logger.debug("Resolved artifact file name set to %s", filename)
+        return filename
+
+    def _start_artifact(self) -> None:
+        """Start writing a line-delimited artifact for the playbook run, if enabled.
+
+        Only an artifact file name with the line-delimited suffix is written as the playbook
+        runs, any other is written as a single JSON document when the run is complete.
+        The records are written to a temporary file in the directory of the artifact, unless
+        the directory depends on the status or time the playbook run finished.
+        """
+        if self._artifact_writer is not None:
+            self._artifact_writer.discard()
+            self._artifact_writer = None
+        save_as = self._args.playbook_artifact_save_as
+        if self._args.playbook_artifact_enable is not True or not is_line_delimited_name(save_as):
+            return
+
+        directory = None
+        if not any(field in os.path.dirname(save_as) for field in ("{playbook_status", "{time_")):
+            directory = os.path.dirname(self._format_artifact_filename(save_as, "", ""))
+        header = {
+            "settings_entries": to_effective(self._args),
+            "settings_sources": to_sources(self._args),
+        }
+        try:
+            self._artifact_writer = ArtifactWriter(
+                header=header,
+                directory=directory,
+                compression=compression_from_name(save_as),
+            )
+        except (OSError, ValueError) as exc:
+            self._logger.error("Starting the artifact file failed: %s", str(exc))
+
+    def _write_artifact_record(self, record: dict[str, Any]) -> None:
+        """Append a record to the line-delimited artifact, if one is being written.
+
+        :param record: The record
+        """
+        if self._artifact_writer is None:
+            return
+        try:
+            self._artifact_writer.write(record)
+        except OSError as exc:
+            self._logger.error("Writing to the artifact file failed, stopped: %s", str(exc))
+            self._artifact_writer.discard()
+            self._artifact_writer = None
+
     def write_artifact(self, filename: str | None = None) -> None:
         """Write the artifact.
 
+        When the artifact for the playbook run has been written as the playbook ran, it
+        is finished and moved into place. Otherwise, the complete artifact is written.
+
         :param filename: The file to write to
         :type filename: str
         """
-        if filename or self._args.playbook_artifact_enable is True:
-            status, status_color = self._get_status()
-            playbook = self._args.playbook
-            if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
-                playbook = next(k["playbook"] for k in self._plays.value)
-            filename = filename or self._args.playbook_artifact_save_as
-            filename = filename.format(
-                playbook_dir=os.path.dirname(playbook),
-                playbook_name=os.path.splitext(os.path.basename(playbook))[0],
-                playbook_status=status,
-                time_stamp=now_iso(self._args.time_zone),
-            )
-            self._logger.debug("Formatted artifact file name set to %s", filename)
-            filename = abs_user_path(filename)
-            self._logger.debug("Resolved artifact file name set to %s", filename)
+        if not (filename or self._args.playbook_artifact_enable is True):
+            return
+
+        status, status_color = self._get_status()
+        time_stamp = now_iso(self._args.time_zone)
 
+        if filename is None and self._artifact_writer is not None:
+            filename = self._format_artifact_filename(
+                self._args.playbook_artifact_save_as,
+                status,
+                time_stamp,
+            )
             try:
-                os.makedirs(os.path.dirname(filename), exist_ok=True)
-                artifact = {
-                    "version": "2.0.0",
-                    "plays": self._plays.value,
-                    "stdout": self.stdout,
-                    "status": status,
-                    "status_color": status_color,
-                    "settings_entries": to_effective(self._args),
-                    "settings_sources": to_sources(self._args),
-                }
-                serialize_write_file(
-                    content=artifact,
-                    content_view=ContentView.NORMAL,
-                    file_mode="w",
-                    file=Path(filename),
-                    serialization_format=SerializationFormat.JSON,
+                self._artifact_writer.finish(
+                    footer={"status": status, "status_color": status_color},
+                    filename=filename,
                 )
                 self._logger.info("Saved artifact as %s", filename)
-
             except OSError as exc:
                 error = (
                     f"Saving the artifact file failed, resulted in the following error: f{exc!s}"
                 )
                 self._logger.error(error)
+                self._artifact_writer.discard()
+            self._artifact_writer = None
+            return
+
+        filename = self._format_artifact_filename(
+            filename or self._args.playbook_artifact_save_as,
+            status,
+            time_stamp,
+        )
+
+        compression = compression_from_name(filename)
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            artifact = {
+                "version": "2.0.0",
+                "plays": self._plays_with_payloads(),
+                "stdout": list(self.stdout),
+                "status": status,
+                "status_color": status_color,
+                "settings_entries": to_effective(self._args),
+                "settings_sources": to_sources(self._args),
+            }
+            serialize_write_file(
+                content=artifact,
+                content_view=ContentView.NORMAL,
+                file_mode="w",
+                file=Path(filename),
+                serialization_format=SerializationFormat.JSON,
+                compact=compression is not None,
+                compression=compression,
+            )
+            self._logger.info("Saved artifact as %s", filename)
+
+        except (OSError, ValueError) as exc:
+            error = f"Saving the artifact file failed, resulted in the following error: f{exc!s}"
+            self._logger.error(error)
 
     def rerun(self) -> None:
         """Rerun the current playbook.
@@ -928,9 +1364,10 @@ class Action(ActionBase):
             if self.runner.finished:
                 self._plays.value = []
                 self._plays.index = None
+                self._index_plays()
                 self._msg_from_plays = (None, None)
-                self._queue.queue.clear()
-                self.stdout = []
+                self._queue.clear()
+                self.stdout = self._new_stdout()
                 self._run_runner()
                 self.steps.clear()
                 self.steps.append(self._plays)
@@ -4,6 +4,7 @@ from distronode_navigator.action_base import ActionBase
 from distronode_navigator.app_public import AppPublic
 from distronode_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from distronode_navigator.content_defs import ContentFormat
+from distronode_navigator.ui_framework import Content
 from distronode_navigator.ui_framework import Interaction
 
 from . import _actions as actions
@@ -39,12 +40,16 @@ class Action(ActionBase):
             new_scroll = len(self._calling_app.stdout)
             if auto_scroll:
                 interaction.ui.scroll(new_scroll)
-            obj = "\n".join(app.stdout)
+            # The lines are shown a window at a time, without joining them
             next_interaction: Interaction = interaction.ui.show(
-                obj=obj,
+                obj=app.stdout,
                 content_format=ContentFormat.ANSI,
             )
             if next_interaction.name != "refresh":
+                if next_interaction.content is not None:
+                    # Other actions, such as :write or :open, expect the text
+                    content = Content(showing="\n".join(app.stdout))
+                    next_interaction = next_interaction._replace(content=content)
                 break
 
             if interaction.ui.scroll() < new_scroll and auto_scroll:
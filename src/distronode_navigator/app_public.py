@@ -13,6 +13,8 @@ from .steps import Steps
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .configuration_subsystem.definitions import ApplicationConfiguration
 
 
@@ -26,7 +28,7 @@ class AppPublic(NamedTuple):
     args: ApplicationConfiguration
     name: str
     rerun: Callable
-    stdout: list[str]
+    stdout: Sequence[str]
     steps: Steps
     update: Callable
     write_artifact: Callable
@@ -35,6 +35,8 @@ from .utils.definitions import LogMessage
 from .utils.functions import clear_screen
 from .utils.functions import generate_cache_path
 from .utils.packaged_data import path_to_file
+from .utils.startup_cache import StartupCache
+from .utils.startup_cache import environment_key
 
 
 __version__: Constants | str
@@ -69,14 +71,13 @@ def cache_scripts() -> None:
         logger.log(level=logging.DEBUG, msg=message)
 
 
-def log_dependencies() -> list[LogMessage]:
-    """Retrieve installed packages and log as debug.
+def _installed_packages() -> list[str]:
+    """Retrieve the installed packages.
 
-    :returns: All packages, version and location
+    :returns: All packages, with version and location
     """
     pkgs = []
     found = []
-    messages: list[LogMessage] = []
     for pkg_names in importlib_metadata.packages_distributions().values():
         for pkg_name in pkg_names:
             if pkg_name not in found:
@@ -84,16 +85,30 @@ def log_dependencies() -> list[LogMessage]:
                 try:
                     spec = find_spec(pkg_name)
                 except ModuleNotFoundError:
-                    message = f"Package '{pkg_name}' is missing"
-                    messages.append(LogMessage(level=logging.DEBUG, message=message))
                     continue
                 _location = spec.origin if spec else ""
                 _version = version(pkg_name)
                 pkgs.append(f"{pkg_name}=={_version} {_location}")
 
     pkgs.sort()
-    messages = [LogMessage(level=logging.DEBUG, message=pkg) for pkg in pkgs]
-    return messages
+    return pkgs
+
+
+def log_dependencies() -> list[LogMessage]:
+    """Retrieve installed packages and log as debug.
+
+    Finding every installed package takes a while, so the packages are kept in the
+    startup cache until the installed packages change.
+
+    :returns: All packages, version and location
+    """
+    cache = StartupCache(generate_cache_path(app_name=APP_NAME))
+    key = environment_key()
+    pkgs = cache.get("dependencies", key)
+    if pkgs is None:
+        pkgs = _installed_packages()
+        cache.set("dependencies", key, pkgs)
+    return [LogMessage(level=logging.DEBUG, message=pkg) for pkg in pkgs]
 
 
 def pull_image(args):
@@ -143,7 +158,7 @@ def run(args: ApplicationConfiguration) -> ActionReturn:
 
 def main():
     """Start application here."""
-    messages: list[LogMessage] = log_dependencies()
+    messages: list[LogMessage] = []
     exit_messages: list[ExitMessage] = []
 
     args = deepcopy(NavigatorConfiguration)
@@ -181,6 +196,9 @@ def main():
         exit_messages.append(ExitMessage(message=exit_msg))
         error_and_exit_early(exit_messages=exit_messages)
 
+    if logger.isEnabledFor(logging.DEBUG):
+        messages[:0] = log_dependencies()
+
     for entry in messages:
         logger.log(level=entry.level, msg=entry.message)
 
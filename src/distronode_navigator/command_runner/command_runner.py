@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import logging
 import multiprocessing
+import os
 import subprocess
+import time
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
-from queue import Queue
 from typing import Callable
 
 from distronode_navigator.utils.definitions import LogMessage
 
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
+# Commands wait on subprocesses, releasing the GIL, so more threads than processors help
+THREADS = min(32, (os.cpu_count() or 1) + 4)
+TIMEOUT_RETURN_CODE = -1
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=False)
@@ -34,6 +43,10 @@ class Command:
     details: list = field(default_factory=list)
     errors: str = ""
     messages: list[LogMessage] = field(default_factory=list)
+    #: The most seconds the command may run, or None to wait for it to finish
+    timeout: float | None = None
+    #: The seconds the command ran
+    duration: float = 0.0
 
     @property
     def stderr_lines(self):
@@ -57,6 +70,7 @@ def run_command(command: Command) -> None:
 
     :param command: Command to be run
     """
+    start = time.perf_counter()
     try:
         proc_out = subprocess.run(
             command.command,
@@ -64,6 +78,7 @@ def run_command(command: Command) -> None:
             check=True,
             text=True,
             shell=True,
+            timeout=command.timeout,
         )
         command.return_code = proc_out.returncode
         command.stdout = proc_out.stdout
@@ -71,30 +86,43 @@ def run_command(command: Command) -> None:
         command.return_code = exc.returncode
         command.stdout = str(exc.stdout)
         command.stderr = str(exc.stderr)
+    except subprocess.TimeoutExpired:
+        command.return_code = TIMEOUT_RETURN_CODE
+        command.errors = f"Command timed out after {command.timeout} seconds: {command.command}"
+    finally:
+        command.duration = time.perf_counter() - start
+
+
+def post_process(command: Command) -> Command:
+    """Post process the output of a command that was run.
+
+    :param command: Command that was run
+    :returns: The post processed command
+    """
+    command.post_process(command)
+    return command
 
 
-def worker(pending_queue: multiprocessing.Queue, completed_queue: multiprocessing.Queue) -> None:
-    """Read pending, run, post process, and place in completed.
+def run_and_post_process(command: Command) -> Command:
+    """Run a command and post process its output.
 
-    :param pending_queue: All pending commands
-    :param completed_queue: All completed commands
+    :param command: Command to be run
+    :returns: The post processed command
     """
-    while True:
-        command = pending_queue.get()
-        if command is None:
-            break
-        run_command(command)
-        command.post_process(command)
-        completed_queue.put(command)
+    run_command(command)
+    return post_process(command)
 
 
 class CommandRunner:
     """Functionality for running commands."""
 
-    def __init__(self):
-        """Initialize the command runner."""
-        self._completed_queue: Queue | None = None
-        self._pending_queue: Queue | None = None
+    def __init__(self, workers: int | None = None):
+        """Initialize the command runner.
+
+        :param workers: The most commands to run at once, by default based on the processors
+        """
+        self.workers = workers
+        self.wall_time = 0.0
 
     @staticmethod
     def run_single_process(commands: list[Command]):
@@ -110,44 +138,62 @@ class CommandRunner:
             results.append(command)
         return results
 
-    def run_multi_process(self, commands: list[Command]) -> list[Command]:
-        """Run commands with multiple processes.
+    def run_multi_thread(self, commands: list[Command]) -> list[Command]:
+        """Run commands with a pool of threads.
 
-        Workers are started to read from pending queue.
-        Exit when the number of results is equal to the number
-        of commands needing to be run.
+        Each command is post processed by the thread that ran it, which suits post
+        processing that takes little time compared to running the command.
 
         :param commands: All commands to be run
-        :returns: The results from running all commands
+        :returns: The results from running all commands, in the order given
         """
-        if self._completed_queue is None:
-            self._completed_queue = multiprocessing.Manager().Queue()
-        if self._pending_queue is None:
-            self._pending_queue = multiprocessing.Manager().Queue()
+        if not commands:
+            return []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self._worker_count(commands, THREADS)) as executor:
+            results = list(executor.map(run_and_post_process, commands))
+        self._record(start, results)
+        return results
 
-        self.start_workers(commands)
-        results: list[Command] = []
-        while len(results) != len(commands):
-            results.append(self._completed_queue.get())
+    def run_multi_process(self, commands: list[Command]) -> list[Command]:
+        """Run commands with a pool of threads, then post process them with a pool of processes.
+
+        This is only worthwhile for post processing that keeps a processor busy,
+        the post processing functions must be picklable.
+
+        :param commands: All commands to be run
+        :returns: The results from running all commands, in the order given
+        """
+        if not commands:
+            return []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self._worker_count(commands, THREADS)) as executor:
+            for _ in executor.map(run_command, commands):
+                pass
+        with ProcessPoolExecutor(max_workers=self._worker_count(commands, PROCESSES)) as executor:
+            results = list(executor.map(post_process, commands))
+        self._record(start, results)
         return results
 
-    def start_workers(self, jobs):
-        """Start the workers.
+    def _worker_count(self, commands: list[Command], default: int) -> int:
+        """Determine the number of workers for a pool.
 
-        :param jobs: List of commands to be run
+        :param commands: All commands to be run
+        :param default: The number of workers if not configured
+        :returns: The number of workers, no more than the number of commands
         """
-        worker_count = min(len(jobs), PROCESSES)
-        processes = []
-        for _proc in range(worker_count):
-            proc = multiprocessing.Process(
-                target=worker,
-                args=(self._pending_queue, self._completed_queue),
-            )
-            processes.append(proc)
-            proc.start()
-        for job in jobs:
-            self._pending_queue.put(job)
-        for _proc in range(worker_count):
-            self._pending_queue.put(None)
-        for proc in processes:
-            proc.join()
+        return max(1, min(len(commands), self.workers or default))
+
+    def _record(self, start: float, commands: list[Command]) -> None:
+        """Record the wall time for running commands.
+
+        :param start: The performance counter when the commands were started
+        :param commands: The commands that were run
+        """
+        self.wall_time = time.perf_counter() - start
+        logger.debug(
+            "Ran %s commands in %.3fs, %.3fs running the commands",
+            len(commands),
+            self.wall_time,
+            sum(command.duration for command in commands),
+        )
@@ -433,7 +433,10 @@ class Configurator:
         determine where the distronode.cfg file should be pulled from
         """
         ee_enabled = str(self._config.execution_environment).lower() == "true"
-        parsed_distronode_cfg = parse_distronode_cfg(ee_enabled=ee_enabled)
+        parsed_distronode_cfg = parse_distronode_cfg(
+            ee_enabled=ee_enabled,
+            cache_path=self._config.internals.cache_path,
+        )
         self._messages.extend(parsed_distronode_cfg.messages)
         self._exit_messages.extend(parsed_distronode_cfg.exit_messages)
         self._config.internals.distronode_configuration = parsed_distronode_cfg.config
@@ -8,6 +8,7 @@ import os
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from distronode_navigator.utils.definitions import ExitMessage
 from distronode_navigator.utils.definitions import LogMessage
@@ -27,6 +28,11 @@ from .navigator_post_processor import NavigatorPostProcessor
 from .utils import DistronodeConfiguration
 
 
+if TYPE_CHECKING:
+    from distronode_navigator.image_manager import IntrospectionCache
+    from distronode_navigator.runner.warm_container import WarmContainer
+
+
 APP_NAME = "distronode_navigator"
 
 initialization_messages: list[LogMessage] = []
@@ -97,8 +103,12 @@ class Internals:
     """This is an initial run (app starting for the first time)."""
     initialization_exit_messages = initialization_exit_messages
     initialization_messages = initialization_messages
+    introspection_cache: IntrospectionCache | None = None
+    """The image introspection cache, opened by the images action for the session."""
     settings_file_path: str | None = None
     settings_source: C = C.NOT_SET
+    warm_container: WarmContainer | None = None
+    """The long-lived execution environment container, when enabled."""
 
 
 navigator_subcommands = [
@@ -403,6 +413,18 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="execution_environment_warm",
+            choices=[True, False],
+            cli_parameters=CliParameters(short="--eew"),
+            settings_file_path_override="execution-environment.warm",
+            short_description=(
+                "Run commands other than playbooks in one execution environment container,"
+                " started for the session, in interactive mode"
+            ),
+            value=SettingsEntryValue(default=False),
+            version_added="v2.4",
+        ),
         SettingsEntry(
             name="format",
             choices=["json", "yaml"],
@@ -488,6 +510,19 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default=["everything"]),
             version_added="v2.0",
         ),
+        SettingsEntry(
+            name="images_prewarm",
+            choices=[True, False],
+            cli_parameters=CliParameters(short="--ip"),
+            settings_file_path_override="images.prewarm",
+            short_description=(
+                "Collect and cache the details of all local execution environment images in"
+                " the background, in mode interactive"
+            ),
+            subcommands=["images"],
+            value=SettingsEntryValue(default=False),
+            version_added="v2.4",
+        ),
         SettingsEntry(
             name="inventory",
             cli_parameters=CliParameters(action="append", nargs="*", short="-i"),
@@ -754,6 +789,17 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default=False),
             version_added="v2.0",
         ),
+        SettingsEntry(
+            name="stdout_memory_lines",
+            cli_parameters=CliParameters(short="--sml"),
+            short_description=(
+                "Specify the number of recent lines of playbook output to keep in memory,"
+                " older lines are kept on disk"
+            ),
+            subcommands=["run", "replay"],
+            value=SettingsEntryValue(default=10000),
+            version_added="v2.4",
+        ),
         SettingsEntry(
             name="time_zone",
             cli_parameters=CliParameters(short="--tz"),
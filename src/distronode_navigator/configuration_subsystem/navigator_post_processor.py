@@ -18,6 +18,8 @@ from itertools import repeat
 from pathlib import Path
 from string import Formatter
 
+from distronode_navigator.utils.compression import HAS_ZSTANDARD
+from distronode_navigator.utils.compression import compression_from_name
 from distronode_navigator.utils.definitions import ExitMessage
 from distronode_navigator.utils.definitions import ExitPrefix
 from distronode_navigator.utils.definitions import LogMessage
@@ -447,6 +449,9 @@ class NavigatorPostProcessor:
 
         return messages, exit_messages
 
+    # Post process for execution_environment_warm
+    execution_environment_warm = _true_or_false
+
     @staticmethod
     @_post_processor
     def container_options(
@@ -561,6 +566,9 @@ class NavigatorPostProcessor:
             messages.append(LogMessage(level=logging.DEBUG, message=message))
         return messages, exit_messages
 
+    # Post process for images_prewarm
+    images_prewarm = _true_or_false
+
     @staticmethod
     @_post_processor
     def inventory(entry: SettingsEntry, config: ApplicationConfiguration) -> PostProcessorReturn:
@@ -1020,6 +1028,15 @@ class NavigatorPostProcessor:
         available.update(non_defaults_also_available)
         unknown = found - available
         if not unknown:
+            if compression_from_name(entry.value.current) == "zstd" and not HAS_ZSTANDARD:
+                exit_msg = (
+                    f"The playbook artifact file name '{entry.value.current}', set by"
+                    f" {entry.value.source.value.lower()}, requires the 'zstandard' package"
+                    " for compression"
+                )
+                exit_messages.append(ExitMessage(message=exit_msg))
+                exit_msg = "Try again after installing 'zstandard' or with a '.gz' or '.xz' suffix"
+                exit_messages.append(ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT))
             return messages, exit_messages
         exit_msg = (
             f"The playbook artifact file name '{entry.value.current}', set by"
@@ -1115,6 +1132,31 @@ class NavigatorPostProcessor:
             entry.value.current = {k: str(v) for k, v in entry.value.current.items()}
         return messages, exit_messages
 
+    @staticmethod
+    @_post_processor
+    def stdout_memory_lines(
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process stdout_memory_lines.
+
+        :param entry: The current settings entry
+        :param config: The full application configuration
+        :returns: An instance of the standard post process return object
+        """
+        messages: list[LogMessage] = []
+        exit_messages: list[ExitMessage] = []
+        try:
+            entry.value.current = int(entry.value.current)
+        except ValueError as exc:
+            exit_msg = f"Value should be valid integer. Failed with error {exc!s}"
+            exit_messages.append(ExitMessage(message=exit_msg))
+            return messages, exit_messages
+        if entry.value.current < 1:
+            exit_msg = f"Value should be at least 1, got {entry.value.current}"
+            exit_messages.append(ExitMessage(message=exit_msg))
+        return messages, exit_messages
+
     @staticmethod
     @_post_processor
     def time_zone(
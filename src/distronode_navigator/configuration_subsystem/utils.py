@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 
 from configparser import ConfigParser
 from configparser import ParsingError
@@ -15,6 +17,8 @@ from distronode_navigator.command_runner import Command
 from distronode_navigator.command_runner import CommandRunner
 from distronode_navigator.utils.definitions import ExitMessage
 from distronode_navigator.utils.definitions import LogMessage
+from distronode_navigator.utils.startup_cache import StartupCache
+from distronode_navigator.utils.startup_cache import environment_key
 
 from .definitions import Constants
 from .definitions import SettingsFileType
@@ -91,7 +95,10 @@ class ParseDistronodeCfgResponse:
     """An distronode configuration"""
 
 
-def parse_distronode_cfg(ee_enabled: bool) -> ParseDistronodeCfgResponse:
+def parse_distronode_cfg(
+    ee_enabled: bool,
+    cache_path: Path | None = None,
+) -> ParseDistronodeCfgResponse:
     """Find the distronode.cfg file and parse it.
 
     If running without an EE, use distronode to get it.
@@ -99,6 +106,7 @@ def parse_distronode_cfg(ee_enabled: bool) -> ParseDistronodeCfgResponse:
     In the future user-specified volume mounts might be considered as locations.
 
     :param ee_enabled: Indicates if EE support is enabled
+    :param cache_path: The directory holding the startup cache, or None to not cache
     :returns: The distronode.cfg contents
     """
     response = ParseDistronodeCfgResponse(messages=[], exit_messages=[])
@@ -124,7 +132,9 @@ def parse_distronode_cfg(ee_enabled: bool) -> ParseDistronodeCfgResponse:
     else:
         msg = "EE support disabled: using 'distronode --version' for 'distronode.cfg'"
         response.messages.append(LogMessage(level=logging.DEBUG, message=msg))
-        new_messages, new_exit_messages, version_details = parse_distronode_verison()
+        new_messages, new_exit_messages, version_details = parse_distronode_verison(
+            cache_path=cache_path,
+        )
         response.messages.extend(new_messages)
         response.exit_messages.extend(new_exit_messages)
         if response.exit_messages or version_details is None:
@@ -160,14 +170,42 @@ def parse_distronode_cfg(ee_enabled: bool) -> ParseDistronodeCfgResponse:
     return response
 
 
-def parse_distronode_verison() -> tuple[list[LogMessage], list[ExitMessage], dict[str, Any] | None]:
+def _distronode_version_key() -> str:
+    """Digest the environment the output of the distronode --version command depends on.
+
+    :returns: The digest of the environment
+    """
+    paths = [
+        shutil.which("distronode") or "",
+        Path.cwd() / "distronode.cfg",
+        Path.home() / ".distronode.cfg",
+        "/etc/distronode/distronode.cfg",
+    ]
+    config = os.environ.get("DISTRONODE_CONFIG", "")
+    if config:
+        paths.append(config)
+    return environment_key(paths=paths, values=[str(Path.cwd()), config])
+
+
+def parse_distronode_verison(
+    cache_path: Path | None = None,
+) -> tuple[list[LogMessage], list[ExitMessage], dict[str, Any] | None]:
     """Parse the output of the distronode --version command.
 
+    :param cache_path: The directory holding the startup cache, or None to not cache
     :returns: Log messages, exit messages, and the stdout as a dictionary
     """
     messages: list[LogMessage] = []
     exit_messages: list[ExitMessage] = []
 
+    cache = None if cache_path is None else StartupCache(cache_path)
+    key = "" if cache is None else _distronode_version_key()
+    cached = None if cache is None else cache.get("distronode_version", key)
+    if cached is not None:
+        msg = f"distronode --version stdout (cached): '{cached['stdout']}'"
+        messages.append(LogMessage(level=logging.DEBUG, message=msg))
+        return messages, exit_messages, cached["details"]
+
     command = Command(
         identity="distronode_version",
         command="distronode --version",
@@ -183,4 +221,7 @@ def parse_distronode_verison() -> tuple[list[LogMessage], list[ExitMessage], dic
 
     msg = f"distronode --version stdout: '{command.stdout}'"
     messages.append(LogMessage(level=logging.DEBUG, message=msg))
+    if cache is not None:
+        cached = {"stdout": command.stdout, "details": command.details[0]}
+        cache.set("distronode_version", key, cached)
     return messages, exit_messages, command.details[0]
@@ -7,6 +7,7 @@ import hashlib
 import json
 import multiprocessing
 import os
+import queue
 import re
 import subprocess
 import sys
@@ -14,6 +15,7 @@ import sys
 from collections import Counter
 from collections import OrderedDict
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timezone
 from json.decoder import JSONDecodeError
@@ -47,20 +49,33 @@ except ImportError:
 
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
+BATCH_SIZE = 200
 
 
 class CollectionCatalog:
     """A collection cataloger."""
 
-    def __init__(self, directories: list[Path]):
+    def __init__(
+        self,
+        directories: list[Path],
+        checksum_cache: KeyValueStore | None = None,
+        catalog_cache: KeyValueStore | None = None,
+    ):
         """Initialize the collection cataloger.
 
         :param directories: A list of directories that may contain collections
+        :param checksum_cache: Checksums of plugin files, keyed by path
+        :param catalog_cache: Previous catalog entries and their fingerprints, keyed by path
         """
         self._directories: list[Path] = directories
+        self._checksum_cache = checksum_cache
+        self._catalog_cache = catalog_cache
         self._collections: OrderedDict[str, dict] = OrderedDict()
         self._errors: list[dict[str, str]] = []
         self._messages: list[str] = []
+        self._plugins: list[tuple[dict, str, Path, str | None]] = []
+        self._uncached: dict[str, tuple[str, list[dict[str, str]]]] = {}
+        self.reused = 0
 
     def _catalog_plugins(self, collection: dict) -> None:
         """Catalog the plugins within a collection.
@@ -202,25 +217,17 @@ class CollectionCatalog:
                 collection["roles"].append(role)
 
     @staticmethod
-    def _generate_checksum(file_path: Path, relative_path: Path) -> dict:
-        """Generate a standard checksum for a file.
+    def _hash_file(file_path: Path) -> str:
+        """Generate a sha256 checksum for a file.
 
         :param file_path: The path to the file to generate a checksum for
-        :param relative_path: The relative path within the collection directory structure
-        :returns: Details about the file, including the checksum
+        :returns: The hex digest of the checksum
         """
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as fh:
-            for byte_block in iter(lambda: fh.read(4096), b""):
+            for byte_block in iter(lambda: fh.read(65536), b""):
                 sha256_hash.update(byte_block)
-        res = {
-            "name": relative_path,
-            "ftype": "file",
-            "chksum_type": "sha256",
-            "chksum_sha256": sha256_hash.hexdigest(),
-            "format": 1,
-        }
-        return res
+        return sha256_hash.hexdigest()
 
     def _process_plugin_dir(
         self,
@@ -231,6 +238,9 @@ class CollectionCatalog:
     ) -> None:
         """Process each plugin within one plugin directory.
 
+        Plugins without a checksum in the file manifest are checksummed later,
+        all at once, by ``_checksum_plugins``.
+
         :param plugin_type: The type of plugins
         :param filenames: The filenames of the plugins
         :param file_checksums: The checksums for the plugin files
@@ -242,21 +252,133 @@ class CollectionCatalog:
 
             relative_path = Path(filename).relative_to(collection["path"])
             checksum_dict = file_checksums.get(str(relative_path))
-            if not checksum_dict:
-                checksum_dict = self._generate_checksum(filename, relative_path)
-            checksum = checksum_dict[f"chksum_{checksum_dict['chksum_type']}"]
-            collection["plugin_checksums"][checksum] = {
+            checksum = None
+            if checksum_dict:
+                checksum = checksum_dict[f"chksum_{checksum_dict['chksum_type']}"]
+            self._plugins.append((collection, plugin_type, filename, checksum))
+
+    def _checksum_plugins(self) -> None:
+        """Checksum the plugins not in a file manifest and add all plugins to their collections.
+
+        A checksum is reused from the checksum cache while the size, modification
+        time and inode of the file are unchanged, the rest are computed in a thread pool.
+        """
+        signatures = {}
+        for _collection, _plugin_type, filename, checksum in self._plugins:
+            if checksum is None:
+                stat = filename.stat()
+                signatures[str(filename)] = f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}"
+
+        cached = self._checksum_cache.get_many(signatures) if self._checksum_cache else {}
+        checksums = {}
+        for path, signature in signatures.items():
+            cached_signature, _, checksum = cached.get(path, "").rpartition(":")
+            if cached_signature == signature:
+                checksums[path] = checksum
+
+        unhashed = [path for path in signatures if path not in checksums]
+        if unhashed:
+            with ThreadPoolExecutor() as executor:
+                checksums.update(zip(unhashed, executor.map(self._hash_file, unhashed)))
+            if self._checksum_cache is not None:
+                self._checksum_cache.set_many(
+                    (path, f"{signatures[path]}:{checksums[path]}") for path in unhashed
+                )
+
+        for collection, plugin_type, filename, checksum in self._plugins:
+            relative_path = filename.relative_to(collection["path"])
+            collection["plugin_checksums"][checksum or checksums[str(filename)]] = {
                 "path": str(relative_path),
                 "type": plugin_type,
             }
+        self._plugins = []
+
+    @staticmethod
+    def _fingerprint(path: Path, include_files: bool, extra: str = "") -> str:
+        """Fingerprint a collection directory.
+
+        The fingerprint covers the content of the metadata files and the modification
+        time of every directory, which changes when a file is added, removed or renamed.
+        Files modified in place only change the fingerprint when ``include_files`` is set.
+
+        :param path: The path to the collection
+        :param include_files: Include the size and modification time of every file
+        :param extra: Additional details to include
+        :returns: The fingerprint
+        """
+        sha256_hash = hashlib.sha256(extra.encode())
+        for name in ("MANIFEST.json", "galaxy.yml", "FILES.json"):
+            try:
+                sha256_hash.update(Path(path, name).read_bytes())
+            except OSError:
+                sha256_hash.update(b"\0")
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            sha256_hash.update(f"{root}:{os.stat(root).st_mtime_ns}\n".encode())
+            if include_files:
+                for name in sorted(files):
+                    stat = os.stat(os.path.join(root, name))
+                    sha256_hash.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return sha256_hash.hexdigest()
+
+    def _reuse(self, path: str, fingerprint: str, cached: str | None) -> bool:
+        """Reuse the previous catalog entry for a collection if the fingerprint is unchanged.
+
+        :param path: The path to the collection
+        :param fingerprint: The current fingerprint of the collection
+        :param cached: The previous catalog entry
+        :returns: An indication the previous entry was reused
+        """
+        if cached:
+            entry = json.loads(cached)
+            if entry["fingerprint"] == fingerprint:
+                self._collections[path] = entry["collection"]
+                self._errors.extend(entry["errors"])
+                self.reused += 1
+                return True
+        self._uncached[path] = (fingerprint, [])
+        return False
+
+    def _store_catalog(self) -> None:
+        """Store the catalog entries of the collections cataloged during this run."""
+        if self._catalog_cache is None or not self._uncached:
+            return
+        self._catalog_cache.set_many(
+            (
+                path,
+                json.dumps(
+                    {
+                        "fingerprint": fingerprint,
+                        "collection": self._collections[path],
+                        "errors": errors,
+                    },
+                    default=str,
+                ),
+            )
+            for path, (fingerprint, errors) in self._uncached.items()
+            if path in self._collections
+        )
 
     def _one_path(self, directory: Path) -> None:
         """Process the contents of an <...>/distronode_collections/ directory.
 
         :param directory: The path to collections directory to walk and load
         """
-        for directory_path in directory.glob("*/*/"):
+        directory_paths = list(directory.glob("*/*/"))
+        cached = {}
+        if self._catalog_cache is not None:
+            cached = self._catalog_cache.get_many(str(path) for path in directory_paths)
+        for directory_path in directory_paths:
             manifest_file = directory_path / "MANIFEST.json"
+            # An installed collection is only changed by replacing it, which changes its
+            # MANIFEST.json, files in a development collection may be edited in place
+            fingerprint = self._fingerprint(
+                directory_path,
+                include_files=not manifest_file.exists(),
+            )
+            if self._reuse(str(directory_path), fingerprint, cached.get(str(directory_path))):
+                continue
+            errors_start = len(self._errors)
             galaxy_file = directory_path / "galaxy.yml"
             collection = None
             if manifest_file.exists():
@@ -298,6 +420,7 @@ class CollectionCatalog:
                             self._errors.append({"path": str(runtime_file), "error": str(exc)})
 
                 self._collections[collection["path"]] = collection
+                self._uncached[collection["path"]][1].extend(self._errors[errors_start:])
             else:
                 msg = (
                     f"collection path '{directory_path}' is ignored as it does not"
@@ -331,23 +454,36 @@ class CollectionCatalog:
             if collection_directory.exists():
                 self._one_path(collection_directory)
         self.add_pseudo_builtin()
-        for collection in self._collections.values():
+        for path, (_fingerprint, errors) in self._uncached.items():
+            collection = self._collections.get(path)
+            if collection is None:
+                continue
+            errors_start = len(self._errors)
             self._catalog_plugins(collection)
             self._catalog_roles(collection)
+            errors.extend(self._errors[errors_start:])
+        self._checksum_plugins()
+        self._store_catalog()
         self._find_shadows()
         return self._collections, self._errors
 
     def add_pseudo_builtin(self) -> None:
         """Add the pseudo builtin collection."""
+        path = str(Path(plugins.__file__).parents[1])
+        fingerprint = self._fingerprint(Path(path), include_files=True, extra=distronode_version)
+        cached = self._catalog_cache.get(path) if self._catalog_cache is not None else None
+        msg = f"Added distronode.builtin from: {path}"
+        if self._reuse(path, fingerprint, cached):
+            self._messages.append(msg)
+            return
         collection: dict[str, str | list | dict] = {}
         collection["known_as"] = "distronode.builtin"
         collection["plugin_checksums"] = {}
-        collection["path"] = str(Path(plugins.__file__).parents[1])
+        collection["path"] = path
         collection["runtime"] = {}
         collection["meta_source"] = "None"
         collection["collection_info"] = {"version": distronode_version}
-        self._collections[str(collection["path"])] = collection
-        msg = f"Added distronode.builtin from: {collection['path']}"
+        self._collections[path] = collection
         self._messages.append(msg)
 
 
@@ -412,11 +548,18 @@ def identify_missing(collections: dict, collection_cache: KeyValueStore) -> tupl
     handled = set()
     missing = []
     plugin_count = 0
+    cached = collection_cache.contains_many(
+        {
+            checksum
+            for collection in collections.values()
+            for checksum in collection["plugin_checksums"]
+        },
+    )
     for collection in collections.values():
         for checksum, details in collection["plugin_checksums"].items():
             plugin_count += 1
             if checksum not in handled:
-                if checksum not in collection_cache:
+                if checksum not in cached:
                     missing.append(
                         (
                             collection["known_as"],
@@ -450,6 +593,12 @@ def parse_args() -> tuple[argparse.Namespace, list[Path]]:
         help="path to collection cache",
         required=True,
     )
+    parser.add_argument(
+        "-p",
+        dest="progress",
+        action="store_true",
+        help="report progress to stderr",
+    )
     parsed_args = parser.parse_args()
 
     adjacent = vars(parsed_args).get("adjacent")
@@ -491,17 +640,23 @@ def retrieve_docs(
     errors: list,
     missing: list,
     stats: dict,
+    progress: bool = False,
 ) -> None:
     # pylint: disable=too-many-locals
     """Extract the docs from the plugins.
 
+    Docs are written to the collection cache in batches as the workers complete
+    them, so an interrupted run keeps what was completed and the next run only
+    processes the plugins still missing.
+
     :param collection_cache: The key value interface to a sqlite database
     :param errors: Previous errors encountered
     :param missing: Plugins missing from the collection cache
     :param stats: Statistics related to the collection cataloging process
+    :param progress: Report progress to stderr after each batch
     """
-    pending_queue = multiprocessing.Manager().Queue()
-    completed_queue = multiprocessing.Manager().Queue()
+    pending_queue: multiprocessing.Queue = multiprocessing.Queue()
+    completed_queue: multiprocessing.Queue = multiprocessing.Queue()
     processes = []
     for _proc in range(PROCESSES):
         proc = multiprocessing.Process(target=worker, args=(pending_queue, completed_queue))
@@ -512,20 +667,39 @@ def retrieve_docs(
         pending_queue.put(entry)
     for _proc in range(PROCESSES):
         pending_queue.put(None)
-    for proc in processes:
-        proc.join()
-
-    while not completed_queue.empty():
-        message_type, message = completed_queue.get()
-        if message_type == "plugin":
-            checksum, plugin = message
-            collection_cache[checksum] = plugin
-            stats["cache_added_success"] += 1
-        elif message_type == "error":
-            checksum, plugin_path, error = message
-            collection_cache[checksum] = json.dumps({"error": error})
-            errors.append({"path": str(plugin_path), "error": error})
-            stats["cache_added_errors"] += 1
+
+    batch: list[tuple[str, str]] = []
+    received = 0
+    try:
+        while received < len(missing):
+            try:
+                message_type, message = completed_queue.get(timeout=1)
+            except queue.Empty:
+                if any(proc.is_alive() for proc in processes):
+                    continue
+                # The workers have exited without completing every plugin
+                break
+            received += 1
+            if message_type == "plugin":
+                checksum, plugin = message
+                batch.append((checksum, plugin))
+                stats["cache_added_success"] += 1
+            elif message_type == "error":
+                checksum, plugin_path, error = message
+                batch.append((checksum, json.dumps({"error": error})))
+                errors.append({"path": str(plugin_path), "error": error})
+                stats["cache_added_errors"] += 1
+            if len(batch) == BATCH_SIZE:
+                collection_cache.set_many(batch)
+                batch = []
+                if progress:
+                    print(f"Cached {received} of {len(missing)} plugins", file=sys.stderr)
+    finally:
+        collection_cache.set_many(batch)
+        for proc in processes:
+            proc.join(timeout=1)
+            if proc.is_alive():
+                proc.terminate()
 
 
 def run_command(cmd: list) -> dict:
@@ -558,12 +732,31 @@ def main() -> dict:
     stats["cache_added_success"] = 0
     stats["cache_added_errors"] = 0
 
-    cc_obj = CollectionCatalog(directories=parent_directories)
+    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
+    # Only the database file may be mounted into the execution environment,
+    # so avoid the write-ahead log, which is kept in files beside it
+    collection_cache = KeyValueStore(collection_cache_path, journal_mode="delete")
+    checksum_cache = KeyValueStore(
+        collection_cache_path,
+        journal_mode="delete",
+        table="file_checksums",
+    )
+    catalog_cache = KeyValueStore(
+        collection_cache_path,
+        journal_mode="delete",
+        table="collection_catalog",
+    )
+
+    cc_obj = CollectionCatalog(
+        directories=parent_directories,
+        checksum_cache=checksum_cache,
+        catalog_cache=catalog_cache,
+    )
     collections, errors = cc_obj.process_directories()
+    checksum_cache.close()
+    catalog_cache.close()
     stats["collection_count"] = len(collections)
-
-    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
-    collection_cache = KeyValueStore(collection_cache_path)
+    stats["collections_reused"] = cc_obj.reused
 
     handled, missing, plugin_count = identify_missing(collections, collection_cache)
     stats["plugin_count"] = plugin_count
@@ -571,13 +764,13 @@ def main() -> dict:
     stats["processed"] = len(missing)
 
     if missing:
-        retrieve_docs(collection_cache, errors, missing, stats)
+        retrieve_docs(collection_cache, errors, missing, stats, args.progress)
 
-    cached_checksums = collection_cache.keys()
-    stats["cache_length"] = len(collection_cache.keys())
+    cached_checksums = collection_cache.contains_many(handled)
+    stats["cache_length"] = len(collection_cache)
 
     for collection in collections.values():
-        for no_doc in set(collection["plugin_checksums"].keys()) - set(cached_checksums):
+        for no_doc in set(collection["plugin_checksums"].keys()) - cached_checksums:
             del collection["plugin_checksums"][no_doc]
 
     collection_cache.close()
@@ -7,9 +7,8 @@ import os
 import re
 import subprocess
 import sys
-import threading
 
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from typing import Any
 from typing import Callable
@@ -18,6 +17,9 @@ from typing import Union
 
 JSONTypes = Union[bool, int, str, dict, list]
 
+# The most commands run at once, each waits on a subprocess
+WORKERS = 4
+
 
 class Command(SimpleNamespace):
     """Abstraction for a details about a shell command."""
@@ -29,6 +31,7 @@ class Command(SimpleNamespace):
     stderr: str = ""
     details: list | dict | str = ""
     errors: list = []
+    timeout: float | None = None
 
 
 def run_command(command: Command) -> None:
@@ -43,86 +46,54 @@ def run_command(command: Command) -> None:
             check=True,
             text=True,
             shell=True,
+            timeout=command.timeout,
         )
         command.stdout = proc_out.stdout
     except subprocess.CalledProcessError as exc:
         command.stderr = str(exc.stderr)
         command.errors = [str(exc.stderr)]
+    except subprocess.TimeoutExpired:
+        command.errors = [f"Command timed out after {command.timeout} seconds"]
 
 
-def worker(pending_queue: Queue, completed_queue: Queue) -> None:
-    """Run a command from pending, parse, and place in completed.
+def run_and_parse(command: Command) -> Command:
+    """Run a command and parse its output.
 
-    :param pending_queue: A queue with plugins to process
-    :param completed_queue: The queue in which extracted documentation will be placed
+    :param command: Details of the command to run
+    :returns: The command, with its output parsed
     """
-    while True:
-        command = pending_queue.get()
-        if command is None:
-            break
-        run_command(command)
-        try:
-            command.parse(command)
-        except Exception as exc:  # noqa: BLE001
-            command.errors = command.errors + [str(exc)]
-        completed_queue.put(command)
+    run_command(command)
+    try:
+        command.parse(command)
+    except Exception as exc:  # noqa: BLE001
+        command.errors = command.errors + [str(exc)]
+    return command
 
 
 class CommandRunner:
     """A command runner.
 
-    Run commands using single or multiple processes.
+    Run commands using a bounded pool of threads.
     """
 
-    def __init__(self):
-        """Initialize the command runner."""
-        self._completed_queue: Queue | None = None
-        self._pending_queue: Queue | None = None
+    def __init__(self, workers: int = WORKERS):
+        """Initialize the command runner.
+
+        :param workers: The most commands to run at once
+        """
+        self.workers = workers
 
     def run_multi_thread(self, command_classes):
         """Run commands with multiple threads.
 
-        Workers are started to read from pending queue.
-        Exit when the number of results is equal to the number
-        of commands needing to be run.
-
         :param command_classes: All command classes to be run
         :returns: The results from running all commands
         """
-        if self._completed_queue is None:
-            self._completed_queue = Queue()
-        if self._pending_queue is None:
-            self._pending_queue = Queue()
-        results = {}
         all_commands = tuple(
             command for command_class in command_classes for command in command_class.commands
         )
-        self.start_workers(all_commands)
-        results = []
-        while len(results) != len(all_commands):
-            results.append(self._completed_queue.get())
-        return results
-
-    def start_workers(self, jobs):
-        """Start workers and submit jobs to pending queue.
-
-        :param jobs: The jobs to be run
-        """
-        worker_count = len(jobs)
-        processes = []
-        for _proc in range(worker_count):
-            proc = threading.Thread(
-                target=worker,
-                args=(self._pending_queue, self._completed_queue),
-            )
-            processes.append(proc)
-            proc.start()
-        for job in jobs:
-            self._pending_queue.put(job)
-        for _proc in range(worker_count):
-            self._pending_queue.put(None)
-        for proc in processes:
-            proc.join()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(run_and_parse, all_commands))
 
 
 class CmdParser:
@@ -1,10 +1,14 @@
 """Image manager."""
 
 from .inspector import inspect_all
+from .introspection_cache import IntrospectionCache
+from .introspection_cache import image_digest
 from .puller import ImagePuller
 
 
 __all__ = (
     "ImagePuller",
+    "IntrospectionCache",
+    "image_digest",
     "inspect_all",
 )
@@ -3,13 +3,57 @@
 from __future__ import annotations
 
 import json
-import re
+import shlex
+
+from collections.abc import Iterable
+from collections.abc import Iterator
 
 from distronode_navigator.command_runner import Command
 from distronode_navigator.command_runner import CommandRunner
 from distronode_navigator.utils.functions import pascal_to_snake
 
 
+# The command is run by the shell as a single argument, which is limited to 128KiB
+INSPECT_COMMAND_LENGTH = 65_536
+
+# The columns of the image list, the same fields for both container engines
+IMAGES_FORMAT = (
+    '{"repository": {{json .Repository}}, "tag": {{json .Tag}}, "image_id": {{json .ID}},'
+    ' "created": {{json .CreatedSince}}, "size": {{json .Size}}}'
+)
+
+SHORT_ID_LENGTH = 12
+
+
+def short_id(image_id: str) -> str:
+    """Shorten an image id to the length listed by the container engines.
+
+    :param image_id: A full or short image id, with or without the algorithm
+    :returns: The short image id
+    """
+    return image_id.removeprefix("sha256:")[:SHORT_ID_LENGTH]
+
+
+def _chunked(ids: Iterable[str], length: int) -> Iterator[list[str]]:
+    """Split image ids into lists short enough for a single command.
+
+    :param ids: The image ids
+    :param length: The most characters of image ids in a list
+    :yields: Lists of image ids
+    """
+    chunk: list[str] = []
+    chunk_length = 0
+    for image_id in ids:
+        if chunk and chunk_length + len(image_id) + 1 > length:
+            yield chunk
+            chunk = []
+            chunk_length = 0
+        chunk.append(image_id)
+        chunk_length += len(image_id) + 1
+    if chunk:
+        yield chunk
+
+
 class ImagesInspect:
     """Functionality for inspecting container images."""
 
@@ -24,28 +68,34 @@ class ImagesInspect:
 
     @property
     def commands(self) -> list[Command]:
-        """Generate image inspection commands.
+        """Generate image inspection commands, each inspecting many images.
 
         :returns: List of image inspection command objects
         """
         return [
             Command(
-                identity=image_id,
-                command=f"{self._container_engine} inspect {image_id}",
+                identity=" ".join(chunk),
+                command=f"{self._container_engine} inspect {' '.join(chunk)}",
                 post_process=self.parse,
             )
-            for image_id in self._image_ids
+            for chunk in _chunked(self._image_ids, INSPECT_COMMAND_LENGTH)
         ]
 
     @staticmethod
     def parse(command: Command):
         """Parse the image inspection command output.
 
+        An image that could not be inspected is missing from the output, and the
+        output of the others is still parsed.
+
         :param command: Image inspection command object
         """
-        obj = json.loads(command.stdout)
-        snake = pascal_to_snake(obj[0])
-        command.details = snake
+        try:
+            objs = json.loads(command.stdout or "[]")
+        except ValueError as exc:
+            command.errors = f"Unable to parse the image inspection: {exc}"
+            objs = []
+        command.details = [pascal_to_snake(obj) for obj in objs or []]
 
 
 class ImagesList:
@@ -67,24 +117,32 @@ class ImagesList:
         return [
             Command(
                 identity="images",
-                command=f"{self._container_engine} images",
+                command=f"{self._container_engine} images --format {shlex.quote(IMAGES_FORMAT)}",
                 post_process=self.parse,
             ),
         ]
 
     @staticmethod
     def parse(command: Command):
-        """Parse the image lister command output.
+        """Parse the image lister command output, one image per line.
 
         :param command: Image lister command object
         """
-        if command.stdout:
-            images = command.stdout.splitlines()
-            re_2omo = re.compile(r"\s{2,}")
-            headers = [key.lower().replace(" ", "_") for key in re_2omo.split(images.pop(0))]
-            local_images = [dict(zip(headers, re_2omo.split(line))) for line in images]
-            valid_images = [image for image in local_images if image["tag"] != "<none>"]
-            command.details = valid_images
+        valid_images = []
+        unparsed = []
+        for line in command.stdout_lines:
+            if not line.strip():
+                continue
+            try:
+                image = json.loads(line)
+            except ValueError:
+                unparsed.append(line)
+                continue
+            if image["tag"] != "<none>":
+                valid_images.append(image)
+        if unparsed and not valid_images:
+            command.errors = f"Unable to parse the image list: {unparsed[0]}"
+        command.details = valid_images
 
 
 def inspect_all(container_engine: str) -> tuple[list, str]:
@@ -102,9 +160,19 @@ def inspect_all(container_engine: str) -> tuple[list, str]:
     if images_list.stderr and not images_list.details:
         return [], images_list.stderr
     images = {image["image_id"]: image for image in images_list.details}
-    image_ids = [image["image_id"] for image in images.values()]
-    images_inspect_class = ImagesInspect(container_engine=container_engine, ids=image_ids)
-    inspects = cmd_runner.run_single_process(commands=images_inspect_class.commands)
+    images_inspect_class = ImagesInspect(container_engine=container_engine, ids=list(images))
+    inspects = cmd_runner.run_multi_thread(commands=images_inspect_class.commands)
+    inspected: dict[str, dict] = {}
+    errors: dict[str, str] = {}
     for inspect in inspects:
-        images[inspect.identity]["inspect"] = {"details": inspect.details, "errors": inspect.errors}
+        for details in inspect.details:
+            inspected[short_id(details.get("id", ""))] = details
+        for image_id in inspect.identity.split():
+            errors[image_id] = inspect.errors or inspect.stderr
+    for image_id, image in images.items():
+        details = inspected.get(short_id(image_id))
+        if details is None:
+            image["inspect"] = {"details": {}, "errors": errors.get(image_id, "")}
+        else:
+            image["inspect"] = {"details": details, "errors": ""}
     return list(images.values()), images_list.stderr
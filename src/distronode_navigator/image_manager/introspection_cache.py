@@ -0,0 +1,187 @@
+"""Keep the results of image introspection, so an image is only introspected once.
+
+Introspecting an image runs a container, which takes seconds. The introspection of
+an image does not change as long as the image and the introspection script do not,
+so results are kept in a key-value store keyed by the image id, the digest of the
+image content, and a digest of the introspection script. Images not yet cached
+can be introspected in the background, once per image for the whole session.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from distronode_navigator.utils.key_value_store import KeyValueStore
+
+
+INTROSPECTION_CACHE_FILE = "image_introspection.db"
+INTROSPECTION_SCRIPT = "image_introspect.py"
+PREWARM_WORKERS = 4
+
+logger = logging.getLogger(__name__)
+
+
+def image_digest(image: dict[str, Any]) -> str:
+    """Determine the digest identifying the content of an image.
+
+    :param image: An image as returned by ``inspect_all``
+    :returns: The image id from the image inspection, otherwise the one listed
+    """
+    try:
+        digest = image["inspect"]["details"]["id"]
+    except (KeyError, TypeError):
+        digest = None
+    return digest or image.get("image_id", "")
+
+
+class IntrospectionCache:
+    """The results of image introspection, keyed by image digest."""
+
+    def __init__(self, cache_path: str | Path) -> None:
+        """Initialize the introspection cache.
+
+        :param cache_path: The directory holding the introspection script and the cache
+        """
+        cache_dir = Path(cache_path)
+        try:
+            script = (cache_dir / INTROSPECTION_SCRIPT).read_bytes()
+        except OSError:
+            script = b""
+        self._script_digest = hashlib.sha256(script).hexdigest()
+        self._store = KeyValueStore(cache_dir / INTROSPECTION_CACHE_FILE)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._in_flight: set[str] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def _key(self, digest: str) -> str:
+        """Build the key for an image digest.
+
+        :param digest: The image digest
+        :returns: The key, including the digest of the introspection script
+        """
+        return f"{digest}:{self._script_digest}"
+
+    def get(self, digest: str) -> dict[str, Any] | None:
+        """Get the introspection of an image.
+
+        :param digest: The image digest
+        :returns: The introspection of the image, or None if not cached
+        """
+        if not digest:
+            return None
+        try:
+            introspection = json.loads(self._store[self._key(digest)])
+        except (KeyError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return introspection
+
+    def set(self, digest: str, introspection: dict[str, Any]) -> None:
+        """Keep the introspection of an image.
+
+        An introspection with errors is not kept, the errors may be transient and the
+        image is introspected again the next time.
+
+        :param digest: The image digest
+        :param introspection: The introspection of the image
+        """
+        if introspection.get("errors"):
+            logger.debug("Introspection of image %s has errors, not kept", digest)
+            return
+        if digest:
+            self._store[self._key(digest)] = json.dumps(introspection)
+            self._store.commit()
+
+    def missing(self, digests: Iterable[str]) -> list[str]:
+        """Determine which image digests have no introspection cached.
+
+        :param digests: The image digests
+        :returns: The digests not cached, in the order given
+        """
+        keys = {digest: self._key(digest) for digest in digests if digest}
+        cached = self._store.contains_many(keys.values())
+        return [digest for digest, key in keys.items() if key not in cached]
+
+    def prewarm(
+        self,
+        images: dict[str, str],
+        introspect: Callable[[str], dict[str, Any] | None],
+        workers: int = PREWARM_WORKERS,
+    ) -> list[Future[None]]:
+        """Introspect images not yet cached in the background.
+
+        Images already being introspected in the background are not introspected again.
+
+        :param images: The image names to introspect, keyed by image digest
+        :param introspect: Introspect an image by name, returning None on failure
+        :param workers: The most images to introspect at once
+        :returns: The futures for the images now being introspected, empty if none are
+        """
+        if self._closed:
+            return []
+        missing = self.missing(images)
+        with self._lock:
+            missing = [digest for digest in missing if digest not in self._in_flight]
+            if self._closed or not missing:
+                return []
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="image-introspection",
+                )
+            self._in_flight.update(missing)
+            futures = [
+                self._executor.submit(self._introspect_one, digest, images[digest], introspect)
+                for digest in missing
+            ]
+        logger.debug("Introspecting %s images in the background", len(missing))
+        return futures
+
+    def _introspect_one(
+        self,
+        digest: str,
+        image_name: str,
+        introspect: Callable[[str], dict[str, Any] | None],
+    ) -> None:
+        """Introspect an image in the background and keep the introspection.
+
+        :param digest: The image digest
+        :param image_name: The image name
+        :param introspect: Introspect an image by name, returning None on failure
+        """
+        try:
+            introspection = introspect(image_name)
+            if introspection is not None:
+                self.set(digest, introspection)
+        except Exception:  # noqa: BLE001
+            logger.exception("Introspecting image %s in the background failed", image_name)
+        finally:
+            with self._lock:
+                self._in_flight.discard(digest)
+
+    def close(self) -> None:
+        """Stop introspecting in the background and close the cache.
+
+        Images waiting to be introspected are skipped, those being introspected are
+        waited for, so their containers are not left running and their introspection is kept.
+        """
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._store.close()
@@ -5,6 +5,8 @@ from .distronode_doc import DistronodeDoc
 from .distronode_inventory import DistronodeInventory
 from .command import Command
 from .command_async import CommandAsync
+from .event_channel import EventChannel
+from .event_channel import EventChannelStats
 
 
 __all__ = (
@@ -13,4 +15,6 @@ __all__ = (
     "DistronodeInventory",
     "Command",
     "CommandAsync",
+    "EventChannel",
+    "EventChannelStats",
 )
@@ -11,11 +11,16 @@ import shutil
 import sys
 import tempfile
 
+from typing import TYPE_CHECKING
 from typing import Any
 
 from distronode_runner import Runner
 
 
+if TYPE_CHECKING:
+    from .warm_container import WarmContainer
+
+
 class Base:
     """Base class for ansible-runner calls."""
 
@@ -36,6 +41,7 @@ class Base:
         host_cwd: str | None = None,
         rotate_artifacts: int | None = None,
         timeout: int | None = None,
+        warm_container: WarmContainer | None = None,
     ) -> None:
         """Handle the common argument for the ansible-runner interface class.
 
@@ -64,6 +70,8 @@ class Base:
             ``subprocess`` invocation (based on ``runner_mode`` selected) while
             executing command. It the timeout is triggered it will force cancel
             the execution.
+        :param warm_container: A long-lived execution environment container to run the
+            command in, used in place of ``ansible-runner`` when it has everything mounted
         """
         self._logger = logging.getLogger(__name__)
 
@@ -81,6 +89,7 @@ class Base:
         self._host_cwd = host_cwd
         self._rotate_artifacts = rotate_artifacts if isinstance(rotate_artifacts, int) else None
         self._timeout = timeout if isinstance(timeout, int) else None
+        self._warm_container = warm_container
         self.distronode_runner_instance: Runner
         self.cancelled: bool = False
         self.finished: bool = False
@@ -191,6 +200,38 @@ class Base:
         self.status = runner.status
         self.finished = True
 
+    def _warm_exec(self, cmd_parts: list[str], paths: list[str]) -> tuple[str, str, int] | None:
+        """Run a command in the warm container, if it can be run there.
+
+        :param cmd_parts: The command to run
+        :param paths: Host paths the command needs, beyond the working directory
+        :returns: The output, error and return code, or None if it was not run
+        """
+        if (
+            self._warm_container is None
+            or not self._ee
+            or self._eei != self._warm_container.image
+            or self._navigator_mode == "stdout"
+        ):
+            return None
+        host_cwd = self._runner_args.get("host_cwd")
+        volume_mounts = self._runner_args.get("container_volume_mounts") or []
+        needed = [host_cwd, *paths] if host_cwd else paths
+        if not self._warm_container.covers(volume_mounts, needed):
+            return None
+        if not self._warm_container.ensure_running():
+            return None
+        self._logger.debug("Running in warm execution environment: %s", cmd_parts)
+        workdir = self._runner_args.get("container_workdir")
+        if not workdir and host_cwd and os.path.exists(host_cwd):
+            workdir = host_cwd
+        return self._warm_container.exec(
+            cmd_parts,
+            envvars=self._runner_args["envvars"],
+            workdir=workdir,
+            timeout=self._timeout,
+        )
+
     def _add_env_vars_to_args(self):
         """Add environment variables to runner args."""
         self._runner_args["envvars"] = {
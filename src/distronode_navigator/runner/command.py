@@ -16,5 +16,12 @@ class Command(CommandBase):
         :returns: Output, error, and error code
         """
         self.generate_run_command_args()
+        # Any arguments that are paths on the host must be mounted in the warm container
+        warm = self._warm_exec(
+            [self._executable_cmd, *self._cmdline],
+            paths=[*self._inventory, *self._cmdline],
+        )
+        if warm is not None:
+            return warm
         out, err, ret_code = run_command(**self._runner_args)
         return out, err, ret_code
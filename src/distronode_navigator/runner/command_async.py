@@ -1,29 +1,34 @@
 """Implementation of the asynchronous invocation of ``ansible-runner``.
 
 Herein lies the ability to invoke ``ansible-runner`` in an async fashion.
-A queue is provided and ``ansible-runner`` uses ``pexpect`` to parse
+An event channel is provided and ``ansible-runner`` uses ``pexpect`` to parse
 standard out and error from the command run and populates the
-queue with messages.
+channel with messages.
 """
 
-from copy import deepcopy
-from queue import Queue
-
+from distronode_runner import Runner
 from distronode_runner import run_command_async
 
 from .command_base import CommandBase
+from .event_channel import EventChannel
 
 
 class CommandAsync(CommandBase):
     """A wrapper for the asynchronous runner."""
 
-    def __init__(self, executable_cmd: str, queue: Queue, write_job_events: bool, **kwargs):
+    def __init__(
+        self,
+        executable_cmd: str,
+        queue: EventChannel,
+        write_job_events: bool,
+        **kwargs,
+    ):
         """Initialize the arguments for the ``run_command_async`` interface of ``ansible-runner``.
 
         For common arguments refer to the documentation of the ``CommandBase`` class.
 
         :param executable_cmd: The command to be invoked
-        :param queue: The queue to post events from ``ansible-runner``
+        :param queue: The event channel to post events from ``ansible-runner``
         :param write_job_events: Allows job_events to be processed by ``ansible-runner``
         :param kwargs: The arguments for the async runner call
         """
@@ -38,10 +43,23 @@ class CommandAsync(CommandBase):
         :returns: The value of ``self._write_job_events``, a boolean
         """
         self._logger.debug("ansible-runner event handle: %s", event)
-        new_event = deepcopy(event)
-        self._queue.put(new_event)
+        if self._write_job_events:
+            # ansible-runner serializes the event after this returns, so hand off a copy
+            # of the levels the consumer modifies, the payload is shared read-only
+            event = {**event}
+            if isinstance(event.get("event_data"), dict):
+                event["event_data"] = {**event["event_data"]}
+        self._queue.put(event)
         return self._write_job_events
 
+    def runner_finished_callback(self, runner: Runner):
+        """Call when runner finishes, waking the consumer of the event channel.
+
+        :param runner: A runner instance
+        """
+        super().runner_finished_callback(runner)
+        self._queue.notify()
+
     def run(self):
         """Initiate the execution of the runner command in async mode.
 
@@ -36,6 +36,16 @@ class DistronodeConfig(Base):
             when ``action`` is set to ``dump``. Defaults to `None`.
         :returns: A tuple of response and error string (if any)
         """
+        cmd_parts = ["distronode-config", action]
+        if config_file:
+            cmd_parts.extend(["-c", config_file])
+        if only_changed:
+            cmd_parts.append("--only-changed")
+        warm = self._warm_exec(cmd_parts, paths=[config_file] if config_file else [])
+        if warm is not None:
+            response, error, _ret_code = warm
+            return response, error
+
         return get_distronode_config(
             action,
             config_file=config_file,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from typing import Any
 
 from distronode_runner import get_plugin_docs
@@ -40,6 +42,34 @@ class DistronodeDoc(Base):
         :returns: A tuple of response and error string. If the value of ``response_format`` is
             ``json`` it returns a python dictionary object.
         """
+        cmd_parts = ["distronode-doc"]
+        if response_format == "json":
+            cmd_parts.append("-j")
+        if snippet:
+            cmd_parts.append("-s")
+        if plugin_type:
+            cmd_parts.extend(["-t", plugin_type])
+        if playbook_dir:
+            cmd_parts.extend(["--playbook-dir", playbook_dir])
+        if module_path:
+            cmd_parts.extend(["-M", module_path])
+        cmd_parts.extend(plugin_names)
+        paths = [playbook_dir] if playbook_dir else []
+        if module_path:
+            paths.extend(module_path.split(":"))
+        warm = self._warm_exec(cmd_parts, paths=paths)
+        if warm is not None:
+            response: dict[Any, Any] | str
+            response, error, _ret_code = warm
+            if response_format == "json" and "{" in response:
+                # Remove any warnings emitted before the json
+                try:
+                    response = json.loads(response[response.index("{") :].strip())
+                except ValueError as exc:
+                    # Left as text, reported by the caller as output that could not be parsed
+                    self._logger.debug("Parsing distronode-doc output failed: %s", str(exc))
+            return response, error
+
         return get_plugin_docs(
             plugin_names,
             plugin_type=plugin_type,
@@ -36,6 +36,27 @@ class DistronodeInventory(Base):
         :param vault_password_file: The vault identity to use
         :returns: A tuple of response and error string (if any)
         """
+        cmd_parts = ["distronode-inventory", f"--{action}"]
+        if action == "host" and host:
+            cmd_parts.append(host)
+        for inventory in inventories:
+            cmd_parts.extend(["-i", inventory])
+        if response_format in ("yaml", "toml"):
+            cmd_parts.append(f"--{response_format}")
+        paths = list(inventories)
+        if playbook_dir:
+            cmd_parts.extend(["--playbook-dir", playbook_dir])
+            paths.append(playbook_dir)
+        if vault_ids:
+            cmd_parts.extend(["--vault-id", vault_ids])
+        if vault_password_file:
+            cmd_parts.extend(["--vault-password-file", vault_password_file])
+            paths.append(vault_password_file)
+        warm = self._warm_exec(cmd_parts, paths=paths)
+        if warm is not None:
+            response, error, _ret_code = warm
+            return response, error
+
         return get_inventory(
             action,
             inventories=inventories,
@@ -0,0 +1,157 @@
+"""A bounded, batched channel for events posted by ``ansible-runner``.
+
+The runner thread posts events with ``put`` and the consumer drains all
+pending events at once with ``drain``, typically once per UI refresh.
+When the number of pending events reaches the high-water mark, events the
+consumer only needs the standard out from are coalesced into the newest
+pending event if it is one too, all others block the runner thread until the
+consumer catches up.
+Once closed, the channel discards any further events. When given a wakeup, the
+channel sets it as events are posted, so the consumer can sleep until one arrives.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+
+from distronode_navigator.utils.wakeup import Wakeup
+
+
+DEFAULT_HIGH_WATER_MARK = 10_000
+
+
+@dataclass
+class EventChannelStats:
+    """Counters for the event channel."""
+
+    coalesced: int = 0
+    """The number of events merged into a pending event"""
+    depth: int = 0
+    """The current number of pending events"""
+    drained: int = 0
+    """The number of events handed to the consumer"""
+    dropped: int = 0
+    """The number of events discarded after the channel was closed"""
+    max_depth: int = 0
+    """The largest number of pending events seen"""
+    posted: int = 0
+    """The number of events posted to the channel"""
+
+
+class EventChannel:
+    """A bounded, batched channel for runner events."""
+
+    def __init__(
+        self,
+        high_water_mark: int = DEFAULT_HIGH_WATER_MARK,
+        coalescible: Callable[[dict[str, Any]], bool] | None = None,
+        wakeup: Wakeup | None = None,
+    ) -> None:
+        """Initialize the event channel.
+
+        :param high_water_mark: The number of pending events at which the channel is full
+        :param coalescible: Determine if an event may be merged into another when full
+        :param wakeup: Set when an event is posted, to wake the consumer
+        :raises ValueError: If the high-water mark is less than 1
+        """
+        if high_water_mark < 1:
+            msg = f"The high-water mark must be at least 1, got {high_water_mark}"
+            raise ValueError(msg)
+        self.high_water_mark = high_water_mark
+        self._coalescible = coalescible or (lambda _event: False)
+        self._events: deque[dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._wakeup = wakeup
+        self.stats = EventChannelStats()
+
+    @property
+    def closed(self) -> bool:
+        """Return if the channel has been closed.
+
+        :returns: True if closed
+        """
+        return self._closed
+
+    def empty(self) -> bool:
+        """Return if there are no pending events.
+
+        :returns: True if no events are pending
+        """
+        return not self._events
+
+    def put(self, event: dict[str, Any]) -> None:
+        """Post an event, the caller must not use the event afterwards.
+
+        :param event: The event to post
+        """
+        with self._condition:
+            self.stats.posted += 1
+            if self._closed:
+                self.stats.dropped += 1
+                return
+            if len(self._events) >= self.high_water_mark:
+                if not self._coalescible(event):
+                    self._condition.wait_for(
+                        lambda: len(self._events) < self.high_water_mark or self._closed,
+                    )
+                    if self._closed:
+                        self.stats.dropped += 1
+                        return
+                elif self._coalescible(self._events[-1]):
+                    self._coalesce(event)
+                    self.notify()
+                    return
+                # Otherwise appended past the mark, for the events that follow to merge into
+            self._events.append(event)
+            self.stats.depth = len(self._events)
+            self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+        self.notify()
+
+    def notify(self) -> None:
+        """Wake the consumer, if the channel has a wakeup, without posting an event."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _coalesce(self, event: dict[str, Any]) -> None:
+        """Merge the standard out of an event into the newest pending event.
+
+        :param event: The event to merge
+        """
+        stdout = event.get("stdout")
+        if stdout:
+            newest = self._events[-1]
+            newest["stdout"] = "\n".join(filter(None, (newest.get("stdout"), stdout)))
+        self.stats.coalesced += 1
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Remove and return all pending events.
+
+        :returns: The pending events, oldest first
+        """
+        with self._condition:
+            events = list(self._events)
+            self._events.clear()
+            self.stats.depth = 0
+            self.stats.drained += len(events)
+            self._condition.notify_all()
+        return events
+
+    def clear(self) -> None:
+        """Discard all pending events and reopen the channel."""
+        with self._condition:
+            self._events.clear()
+            self.stats.depth = 0
+            self._closed = False
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Close the channel, releasing a blocked producer and discarding further events."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
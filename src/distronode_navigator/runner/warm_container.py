@@ -0,0 +1,177 @@
+"""A long-lived execution environment container for commands that do not run a playbook.
+
+Rather than ``ansible-runner`` starting a new container for each command, one
+container is started for the session and each command is run within it using
+``exec``. A command is only run in the warm container if every path it needs is
+mounted within it, otherwise it is left to ``ansible-runner``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import uuid
+
+from pathlib import Path
+
+from distronode_navigator.utils.functions import shlex_join
+
+
+# ansible-runner refuses to mount these
+UNSAFE_MOUNTS = ("/", "/home/", "/usr/")
+
+
+def is_safe_to_mount(path: str) -> bool:
+    """Determine if a path may be mounted within the container.
+
+    :param path: The path to mount
+    :returns: True if the path may be mounted
+    """
+    if os.path.isfile(path):
+        path = os.path.dirname(path)
+    return os.path.join(path, "") not in UNSAFE_MOUNTS
+
+
+class WarmContainer:
+    """A long-lived execution environment container."""
+
+    def __init__(
+        self,
+        container_engine: str,
+        image: str,
+        volume_mounts: list[str],
+        container_options: list[str] | None = None,
+    ) -> None:
+        """Initialize the warm container.
+
+        :param container_engine: The container engine used to run the container
+        :param image: The execution environment image
+        :param volume_mounts: Bind mounts in the form ``host_dir:/container_dir:labels``
+        :param container_options: Additional options passed to the container engine
+        """
+        self._logger = logging.getLogger(__name__)
+        self._engine = container_engine
+        self.image = image
+        self._volume_mounts = volume_mounts
+        self._container_options = list(container_options or [])
+        # when the ce is podman, set the container user to root
+        if self._engine == "podman":
+            self._container_options.append("--user=root")
+        self.name = f"distronode-navigator-{uuid.uuid4().hex[:12]}"
+        self._started = False
+
+    def _run(self, cmd_parts: list[str], timeout: int | None = None) -> tuple[str, str, int]:
+        """Run a container engine command.
+
+        :param cmd_parts: The command to run
+        :param timeout: The timeout for the command in seconds
+        :returns: The output, error and return code
+        """
+        self._logger.debug("Command: %s", shlex_join(cmd_parts))
+        try:
+            proc_out = subprocess.run(
+                cmd_parts,
+                capture_output=True,
+                check=False,
+                text=True,
+                timeout=timeout,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            return "", str(exc), 1
+        return proc_out.stdout, proc_out.stderr, proc_out.returncode
+
+    def start(self) -> bool:
+        """Start the container.
+
+        :returns: True if the container was started
+        """
+        cmd_parts = [self._engine, "run", "--detach", "--rm", "--name", self.name]
+        for volume_mount in self._volume_mounts:
+            cmd_parts.extend(["--volume", volume_mount])
+        cmd_parts.extend(self._container_options)
+        cmd_parts.extend([self.image, "sleep", "infinity"])
+        _out, err, ret_code = self._run(cmd_parts)
+        self._started = ret_code == 0
+        if not self._started:
+            self._logger.warning("Warm execution environment failed to start: %s", err.strip())
+        return self._started
+
+    def running(self) -> bool:
+        """Check the container is running.
+
+        :returns: True if the container is running
+        """
+        if not self._started:
+            return False
+        cmd_parts = [self._engine, "container", "inspect", "--format", "{{.State.Running}}"]
+        out, _err, ret_code = self._run([*cmd_parts, self.name])
+        return ret_code == 0 and out.strip() == "true"
+
+    def ensure_running(self) -> bool:
+        """Check the container is running, replacing it once if it is not.
+
+        :returns: True if the container is running
+        """
+        if self.running():
+            return True
+        if self._started:
+            self._logger.warning("Warm execution environment %s stopped, restarting", self.name)
+            self.stop()
+            self.name = f"distronode-navigator-{uuid.uuid4().hex[:12]}"
+            return self.start()
+        return False
+
+    def covers(self, volume_mounts: list[str], paths: list[str]) -> bool:
+        """Determine if the volume mounts and paths a command needs are mounted in the container.
+
+        :param volume_mounts: Bind mounts in the form ``host_dir:/container_dir:labels``
+        :param paths: Host paths, mounted at the same path in the container
+        :returns: True if everything needed is mounted
+        """
+        mounted = []
+        for volume_mount in self._volume_mounts:
+            src, dest = volume_mount.split(":")[:2]
+            mounted.append((Path(os.path.abspath(src)), Path(dest)))
+
+        needed = [tuple(volume_mount.split(":")[:2]) for volume_mount in volume_mounts]
+        needed.extend((path, path) for path in paths if os.path.exists(path))
+        for src, dest in needed:
+            src_path = Path(os.path.abspath(src))
+            if not any(
+                src_path.is_relative_to(m_src)
+                and Path(dest) == m_dest / src_path.relative_to(m_src)
+                for m_src, m_dest in mounted
+            ):
+                self._logger.debug("%s:%s not mounted in the warm container", src, dest)
+                return False
+        return True
+
+    def exec(
+        self,
+        cmd_parts: list[str],
+        envvars: dict[str, str],
+        workdir: str | None,
+        timeout: int | None = None,
+    ) -> tuple[str, str, int]:
+        """Run a command within the container.
+
+        :param cmd_parts: The command to run
+        :param envvars: Environment variables to set for the command
+        :param workdir: The working directory for the command
+        :param timeout: The timeout for the command in seconds
+        :returns: The output, error and return code
+        """
+        exec_parts = [self._engine, "exec"]
+        if workdir:
+            exec_parts.extend(["--workdir", workdir])
+        for key, value in envvars.items():
+            exec_parts.extend(["--env", f"{key}={value}"])
+        return self._run([*exec_parts, self.name, *cmd_parts], timeout=timeout)
+
+    def stop(self) -> None:
+        """Stop and remove the container."""
+        if not self._started:
+            return
+        self._run([self._engine, "rm", "--force", self.name])
+        self._started = False
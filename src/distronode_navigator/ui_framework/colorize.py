@@ -10,11 +10,15 @@ import functools
 import json
 import logging
 import re
+import weakref
 
+from bisect import bisect_left
+from collections.abc import Sequence
 from itertools import chain
 
 from distronode_navigator.tm_tokenize.grammars import Grammars
 from distronode_navigator.tm_tokenize.region import Regions
+from distronode_navigator.tm_tokenize.state import State
 from distronode_navigator.tm_tokenize.tokenize import tokenize
 from distronode_navigator.utils.compatibility import Traversable
 
@@ -27,6 +31,9 @@ from .ui_constants import Color
 from .ui_constants import Decoration
 
 
+LINE_CACHE_SIZE = 50_000
+CHECKPOINT_INTERVAL = 256
+
 CURSES_STYLES = {
     0: None,
     1: getattr(curses, "A_BOLD", None),
@@ -51,7 +58,7 @@ class ColorSchema:
         self._logger = logging.getLogger(__name__)
         self._schema = schema
 
-    @functools.lru_cache(maxsize=128)
+    @functools.lru_cache(maxsize=1024)
     def get_color_and_style(self, scope: str) -> tuple[RgbTuple | None, str | None]:
         """Get a color from the schema, traverse all to aggregate color and style.
 
@@ -95,6 +102,10 @@ class Colorize:
         self._schema: ColorSchema
         self._grammars = Grammars(str(grammar_dir))
         self._theme_path = theme_path
+        self._checkpoints: weakref.WeakKeyDictionary[
+            Sequence[str],
+            dict[str, list[State]],
+        ] = weakref.WeakKeyDictionary()
         self._load()
 
     def _load(self):
@@ -133,7 +144,7 @@ class Colorize:
                 line += "\n"
                 first_line = line_idx == 0
                 try:
-                    state, regions = tokenize(compiler, state, line, first_line)
+                    state, regions = self._tokenize_line(scope, state, line, first_line)
                 except Exception as exc:  # noqa: BLE001
                     self._logger.critical(
                         (
@@ -157,11 +168,92 @@ class Colorize:
                     assembled = strip_markdown(assembled)
                 return assembled
 
-        res = [
-            [SimpleLinePart(column=0, chars=doc_line, color=None, style=None)]
-            for doc_line in doc.splitlines()
-        ]
-        return res
+        return no_color(doc.splitlines())
+
+    def render_window(
+        self,
+        lines: Sequence[str],
+        scope: str,
+        start: int,
+        stop: int,
+    ) -> list[list[SimpleLinePart]]:
+        """Render a window of lines into lines of columns and colors.
+
+        The tokenizer state at the start of every ``CHECKPOINT_INTERVAL`` lines is kept for
+        the lines, so a window can be tokenized starting from the nearest preceding checkpoint
+        rather than the first line. The lines should support weak references and must not
+        change once rendered.
+
+        :param lines: All lines of the document
+        :param scope: The scope, aka the format of the lines
+        :param start: The index of the first line of the window
+        :param stop: The index after the last line of the window
+        :returns: A list of lines, each a list of dicts
+        """
+        try:
+            compiler = self._grammars.compiler_for_scope(scope)
+        except KeyError:
+            compiler = None
+
+        if not compiler or scope == "no_color":
+            return no_color(lines[start:stop])
+
+        checkpoints = self._checkpoints.setdefault(lines, {}).setdefault(
+            scope,
+            [compiler.root_state],
+        )
+        first = min(start // CHECKPOINT_INTERVAL, len(checkpoints) - 1) * CHECKPOINT_INTERVAL
+        state = checkpoints[first // CHECKPOINT_INTERVAL]
+        window = []
+        for line_idx in range(first, min(stop, len(lines))):
+            checkpoint, offset = divmod(line_idx, CHECKPOINT_INTERVAL)
+            if offset == 0 and checkpoint == len(checkpoints):
+                checkpoints.append(state)
+            line = lines[line_idx] + "\n"
+            try:
+                state, regions = self._tokenize_line(scope, state, line, line_idx == 0)
+            except Exception as exc:  # noqa: BLE001
+                self._logger.critical(
+                    "Tokenization failed for scope '%s' at line %s: %s",
+                    scope,
+                    line_idx,
+                    str(exc),
+                )
+                return no_color(lines[start:stop])
+            if line_idx >= start:
+                window.append((regions, line))
+        return columns_and_colors(window, self._schema)
+
+    @functools.lru_cache(maxsize=LINE_CACHE_SIZE)
+    def _tokenize_line(
+        self,
+        scope: str,
+        state: State,
+        line: str,
+        first_line: bool,
+    ) -> tuple[State, Regions]:
+        """Tokenize one line, given the tokenizer state at the start of the line.
+
+        Since the result depends only on the arguments, unchanged lines with an unchanged
+        starting state are not tokenized again when a document is rendered a second time.
+
+        :param scope: The scope, aka the format of the line
+        :param state: The tokenizer state at the start of the line
+        :param line: The line to tokenize
+        :param first_line: Indicates this is the first line of the document
+        :returns: The tokenizer state at the end of the line and the line's regions
+        """
+        compiler = self._grammars.compiler_for_scope(scope)
+        return tokenize(compiler, state, line, first_line)
+
+
+def no_color(lines: list[str]) -> list[list[SimpleLinePart]]:
+    """Convert lines of text into lines of parts without color.
+
+    :param lines: The lines of text
+    :returns: Lines of text, each as a single part
+    """
+    return [[SimpleLinePart(column=0, chars=line, color=None, style=None)] for line in lines]
 
 
 def scope_to_list(scope: str | list) -> list:
@@ -259,59 +351,111 @@ def columns_and_colors(
 ) -> list[list[SimpleLinePart]]:
     """Convert to colors and columns.
 
+    Each line is split at the region boundaries, later regions take precedence
+    over earlier regions for the characters they share. Adjacent spans with like
+    color and style are grouped into a single part.
+
     :param lines: Lines of text and their regions
     :param schema: An instance of the ColorSchema
     :returns: Lines of text, each broken into sections
     """
     results: list[list[SimpleLinePart]] = []
 
-    for line in lines:
-        # Break the into 1 character parts, temporarily set the column to 0
-        line_parts = [
-            SimpleLinePart(chars=character, color=None, column=0, style=None)
-            for character in line[1]
-        ]
+    for regions, text in lines:
+        if not text:
+            results.append([SimpleLinePart(chars=text, color=None, column=0, style=None)])
+            continue
 
-        # Replace the color with the RgbTuple
-        for region in line[0]:
-            color, style = schema.get_color_and_style(region.scope)
-            if color:
-                for idx in range(region.start, region.end):
-                    line_parts[idx].color = color
-            if style:
-                for idx in range(region.start, region.end):
-                    line_parts[idx].style = style
-
-        # Compress the line, grouping characters of like color and decoration
-        if line_parts:
-            grouped = [line_parts.pop(0)]
-            while line_parts:
-                entry = line_parts.pop(0)
-                if entry.color == grouped[-1].color and entry.style == grouped[-1].style:
-                    grouped[-1].chars += entry.chars
-                else:
-                    grouped.append(entry)
-            results.append(grouped)
-        else:
-            results.append([SimpleLinePart(chars=line[1], color=None, column=0, style=None)])
+        # The start of each span, where a span has a single color and style
+        boundaries = sorted(
+            {0, len(text)}.union(*((region.start, region.end) for region in regions)),
+        )
+        colors: list[RgbTuple | None] = [None] * (len(boundaries) - 1)
+        styles: list[str | None] = [None] * (len(boundaries) - 1)
 
-    # Update the column in each line part, based on the total of the preceding text lengths
-    for result in results:
-        column = 0
-        for line_part in result:
-            line_part.column = column
-            column += len(line_part.chars)
+        for region in regions:
+            color, style = schema.get_color_and_style(region.scope)
+            if not (color or style):
+                continue
+            first = bisect_left(boundaries, region.start)
+            last = bisect_left(boundaries, region.end, lo=first)
+            for span in range(first, last):
+                if color:
+                    colors[span] = color
+                if style:
+                    styles[span] = style
+
+        # Group spans of like color and style
+        grouped: list[SimpleLinePart] = []
+        for span, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
+            if grouped and colors[span] == grouped[-1].color and styles[span] == grouped[-1].style:
+                grouped[-1].chars += text[start:end]
+            else:
+                grouped.append(
+                    SimpleLinePart(
+                        chars=text[start:end],
+                        color=colors[span],
+                        column=start,
+                        style=styles[span],
+                    ),
+                )
+        results.append(grouped)
 
     return results
 
 
+ANSI_REGEX = re.compile(r"(\x1b\[[\d;]*m)")
+"""An ansi select graphic rendition sequence, captured so splitting a line keeps them."""
+
+COLOR_REGEX = re.compile(
+    r"""(?x)
+        \x1b\[                              # Control Sequence Introducer
+        (?P<fg_action>(38;5|39);)?          # optional FG color action
+        (?P<_bg_action>(48;5|49);)?         # optional BG color action
+        (?P<one>\d+)                        # required, one number
+        (;(?P<two>\d+))?                    # optional 2nd number
+        m
+    """,
+)
+"""The parts of an ansi color sequence used by the TUI."""
+
+ANSI_16 = {code: idx for idx, code in enumerate(chain(range(30, 38), range(90, 98)))}
+"""The ansi 16 color foreground codes, mapped to curses color numbers."""
+
+ANSI_CACHE_SIZE = 1_000
+
+
+@functools.lru_cache(maxsize=ANSI_CACHE_SIZE)
+def _ansi_sequence(sequence: str) -> tuple[int | None, int | None] | None:
+    """Determine the color and style set by an ansi sequence.
+
+    :param sequence: An ansi select graphic rendition sequence
+    :returns: The color and style, each None if unchanged, or None if the sequence
+        is not a color sequence and should be shown as text
+    """
+    match = COLOR_REGEX.match(sequence)
+    if not match:
+        return None
+    fg_action, one, two = match.group("fg_action", "one", "two")
+    if fg_action == "39;" or (one == "0" and two is None):
+        return None, None  # default color
+    if fg_action == "38;5;":
+        return int(one), (CURSES_STYLES.get(int(two)) or 0) if two else None
+    if two is None:
+        return ANSI_16.get(int(one), int(one)), None
+    return ANSI_16.get(int(two), int(two)), CURSES_STYLES.get(int(one)) or 0
+
+
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def ansi_to_curses(line: str) -> CursesLine:
     """Convert distronode color codes to curses colors.
 
+    Lines are memoized by their raw text, the same lines are converted each time
+    the content is redrawn.
+
     :param line: A string with ansi colors
     :returns: A line ready for presentation in the TUI
     """
-    # pylint: disable=too-many-locals
     if line == "":
         line_part = CursesLinePart(
             column=0,
@@ -322,53 +466,26 @@ def ansi_to_curses(line: str) -> CursesLine:
         return CursesLine((line_part,))
 
     printable = []
-    ansi_regex = re.compile(r"(\x1b\[[\d;]*m)")
-    color_regex = re.compile(
-        r"""(?x)
-            \x1b\[                              # Control Sequence Introducer
-            (?P<fg_action>(38;5|39);)?          # optional FG color action
-            (?P<_bg_action>(48;5|49);)?         # optional BG color action
-            (?P<one>\d+)                        # required, one number
-            (;(?P<two>\d+))?                    # optional 2nd number
-            m
-        """,
-    )
-    parts = ansi_regex.split(line)
     colno = 0
     color = 0
     style = 0
-    while parts:
-        part = parts.pop(0)
-        if part:
-            match = color_regex.match(part)
-            if match:
-                cap = match.groupdict()
-                one = cap["one"]
-                two = cap["two"]
-                if cap["fg_action"] == "39;" or (one == "0" and two is None):
-                    pass  # default color
-                elif cap["fg_action"] == "38;5;":
-                    color = int(one)
-                    if two:
-                        style = CURSES_STYLES.get(int(two), None) or 0
-                elif not cap["fg_action"]:
-                    ansi_16 = list(chain(range(30, 38), range(90, 98)))
-                    if two is None:
-                        color = ansi_16.index(int(one)) if int(one) in ansi_16 else int(one)
-                    else:
-                        color = ansi_16.index(int(two)) if int(two) in ansi_16 else int(two)
-                        style = CURSES_STYLES.get(int(one), None) or 0
-            else:
-                curses_line = CursesLinePart(
-                    column=colno,
-                    string=part,
-                    color=color,
-                    decoration=style,
-                )
-                printable.append(curses_line)
-                colno += len(part)
-                color = 0
-                style = 0
+    # Splitting on the captured sequence alternates text and sequences
+    for idx, part in enumerate(ANSI_REGEX.split(line)):
+        if not part:
+            continue
+        if idx % 2:
+            sequence = _ansi_sequence(part)
+            if sequence is not None:
+                new_color, new_style = sequence
+                if new_color is not None:
+                    color = new_color
+                if new_style is not None:
+                    style = new_style
+                continue
+        printable.append(CursesLinePart(column=colno, string=part, color=color, decoration=style))
+        colno += len(part)
+        color = 0
+        style = 0
     return CursesLine(tuple(printable))
 
 
@@ -0,0 +1,85 @@
+"""Track the rows drawn on the screen, so only rows that changed are drawn again.
+
+Each frame is described as the parts drawn on each row of the screen. The parts of
+the frame last drawn are kept, and comparing them with those of the next frame
+determines which rows need to be cleared and drawn again. Rows drawn by something
+else, a form or the input line, are forgotten so they are drawn with the next frame.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+from typing import Optional
+
+from .curses_defs import CursesLine
+
+
+RowPart = tuple[Optional[str], CursesLine]
+"""A prefix and line drawn on a row, the prefix is drawn in the prefix color."""
+
+Frame = dict[int, tuple[RowPart, ...]]
+"""The parts drawn on each row of the screen, by row number."""
+
+
+class Damage(NamedTuple):
+    """The rows of a frame to draw.
+
+    :param erase: Erase the screen before drawing, no rows are known to be drawn
+    :param rows: The parts to draw for each row that changed, no parts to clear the row
+    :param characters: The number of characters to draw
+    """
+
+    erase: bool
+    rows: Frame
+    characters: int
+
+
+class FrameTracker:
+    """Track the rows drawn on the screen."""
+
+    def __init__(self) -> None:
+        """Initialize the frame tracker."""
+        self._drawn: dict[int, tuple[RowPart, ...] | None] = {}
+        self._size: tuple[int, int] | None = None
+        self.frames = 0
+        self.rows = 0
+        self.characters = 0
+
+    def invalidate(self) -> None:
+        """Forget all rows drawn, the next frame is drawn in full."""
+        self._drawn = {}
+        self._size = None
+
+    def forget_row(self, row: int) -> None:
+        """Forget the parts drawn on one row, the row is drawn with the next frame.
+
+        :param row: The row number
+        """
+        self._drawn[row] = None
+
+    def damage(self, frame: Frame, size: tuple[int, int]) -> Damage:
+        """Determine the rows of a frame that differ from those drawn, and record them as drawn.
+
+        :param frame: The parts to draw on each row
+        :param size: The height and width of the screen
+        :returns: The rows to draw
+        """
+        erase = size != self._size
+        if erase:
+            self._drawn = {}
+            self._size = size
+        rows: Frame = {}
+        for row in sorted(frame.keys() | self._drawn.keys()):
+            parts = frame.get(row, ())
+            if self._drawn.get(row) != parts and (parts or not erase):
+                rows[row] = parts
+        characters = sum(
+            len(prefix or "") + sum(len(line_part.string) for line_part in line)
+            for parts in rows.values()
+            for prefix, line in parts
+        )
+        self._drawn = {row: parts for row, parts in frame.items() if parts}
+        self.frames += 1
+        self.rows += len(rows)
+        self.characters += characters
+        return Damage(erase=erase, rows=rows, characters=characters)
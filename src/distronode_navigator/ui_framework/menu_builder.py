@@ -1,4 +1,9 @@
-"""Build a menu."""
+"""Build a menu.
+
+The layout of a menu is kept between frames. Each row's cell widths and rendered
+line are reused while the row is unchanged, and column widths are recalculated
+from the cached cell widths, so only changed rows are converted to text again.
+"""
 
 from __future__ import annotations
 
@@ -6,8 +11,12 @@ import curses
 import enum
 import re
 
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 from typing import Callable
+from typing import NamedTuple
 
 from distronode_navigator.content_defs import ContentBase
 from distronode_navigator.content_defs import ContentTypeSequence
@@ -20,6 +29,63 @@ from .utils import convert_percentage
 from .utils import distribute
 
 
+MENU_CACHE_SIZE = 8
+"""The number of menus for which the layout is kept"""
+
+
+def row_version(row: Any) -> Any:
+    """Determine a value that changes whenever a menu row changes.
+
+    A row can provide a ``row_version`` attribute, a counter incremented whenever
+    the row is updated, otherwise the top level keys and values of the row are used.
+
+    :param row: The menu row
+    :returns: The version of the row, or None if the version can not be determined
+    """
+    version = getattr(row, "row_version", None)
+    if version is not None:
+        return version
+    if isinstance(row, dict):
+        return tuple(row.items())
+    try:
+        return tuple(vars(row).items())
+    except TypeError:
+        return None
+
+
+class RowLayout(NamedTuple):
+    """The cached layout of one menu row.
+
+    :param row: The row the layout is for
+    :param version: The version of the row when the layout was made
+    :param lengths: The length of the text in each column
+    :param layout: The column widths the line was rendered for
+    :param line: The rendered line, or None if not yet rendered
+    """
+
+    row: Any
+    version: Any
+    lengths: tuple[int, ...]
+    layout: tuple[int, ...] = ()
+    line: CursesLine | None = None
+
+
+@dataclass
+class MenuLayout:
+    """The cached layout of one menu."""
+
+    #: The rows of the menu
+    dicts: ContentTypeSequence
+    #: The length of each column heading
+    header_lengths: tuple[int, ...]
+    #: The column widths the heading was rendered for
+    layout: tuple[int, ...] = ()
+    #: The rendered heading
+    header: CursesLine | None = None
+    #: The cached layout of each row, by index
+    rows: dict[int, RowLayout] = field(default_factory=dict)
+
+
 class MenuBuilder:
     """Build a menu from list of dicts."""
 
@@ -45,6 +111,7 @@ class MenuBuilder:
         self._screen_width = screen_width
         self._color_menu_item = color_menu_item
         self._ui_config = ui_config
+        self._layouts: OrderedDict[tuple[int, tuple[str, ...]], MenuLayout] = OrderedDict()
 
     def build(
         self,
@@ -76,13 +143,14 @@ class MenuBuilder:
         """
         line_prefix_w = len(str(len(dicts))) + len("|")
 
-        for idx in indices:
-            convert_percentage(dicts[idx], cols, self._progress_bar_width)
-
-        lines = [[str(dicts[idx].get(c)) for c in cols] for idx in indices]
+        menu_layout_cache = self._menu_layout(dicts, cols)
+        row_layouts = [self._row_layout(menu_layout_cache, dicts, cols, idx) for idx in indices]
         column_widths = [
-            max(len(str(v)) for v in c)
-            for c in zip(*lines + [[re.sub("^__", "", col) for col in cols]])
+            max(lengths)
+            for lengths in zip(
+                *(row_layout.lengths for row_layout in row_layouts),
+                menu_layout_cache.header_lengths,
+            )
         ]
         # add a space
         column_widths = [c + 1 for c in column_widths]
@@ -94,12 +162,71 @@ class MenuBuilder:
         for idx, column_width in enumerate(adjusted_column_widths):
             col_starts.append(column_width + col_starts[idx])
 
-        menu_layout = tuple([col_starts, cols, adjusted_column_widths])
-        header = self._menu_header_line(menu_layout)
+        layout = tuple(adjusted_column_widths)
+        if menu_layout_cache.header is None or menu_layout_cache.layout != layout:
+            menu_layout_cache.header = self._menu_header_line(
+                tuple([col_starts, cols, adjusted_column_widths]),
+            )
+            menu_layout_cache.layout = layout
+        header = menu_layout_cache.header
 
         menu_layout = tuple([col_starts, cols, adjusted_column_widths, header])
-        menu_lines = self._menu_lines(dicts, menu_layout, indices)
-        return CursesLines(tuple([header])), menu_lines
+        menu_lines = []
+        for idx, row_layout in zip(indices, row_layouts):
+            line = row_layout.line
+            if line is None or row_layout.layout != layout:
+                line = self._menu_line(dicts[idx], menu_layout)
+                menu_layout_cache.rows[idx] = row_layout._replace(layout=layout, line=line)
+            menu_lines.append(line)
+        return CursesLines(tuple([header])), CursesLines(tuple(menu_lines))
+
+    def _menu_layout(self, dicts: ContentTypeSequence, cols: list[str]) -> MenuLayout:
+        """Get the cached layout for a menu, starting a new one if the menu is not cached.
+
+        :param dicts: A list of dicts
+        :param cols: The columns (keys) to use in the dicts
+        :returns: The cached layout for the menu
+        """
+        key = (id(dicts), tuple(cols))
+        menu_layout = self._layouts.get(key)
+        if menu_layout is None or menu_layout.dicts is not dicts:
+            header_lengths = tuple(len(re.sub("^__", "", col)) for col in cols)
+            menu_layout = MenuLayout(dicts=dicts, header_lengths=header_lengths)
+            self._layouts[key] = menu_layout
+            if len(self._layouts) > MENU_CACHE_SIZE:
+                self._layouts.popitem(last=False)
+        self._layouts.move_to_end(key)
+        return menu_layout
+
+    def _row_layout(
+        self,
+        menu_layout: MenuLayout,
+        dicts: ContentTypeSequence,
+        cols: list[str],
+        idx: int,
+    ) -> RowLayout:
+        """Get the cached layout for a row, converting the row again if it changed.
+
+        :param menu_layout: The cached layout for the menu
+        :param dicts: A list of dicts
+        :param cols: The columns (keys) to use in the dicts
+        :param idx: The index of the row
+        :returns: The cached layout for the row
+        """
+        row = dicts[idx]
+        row_layout = menu_layout.rows.get(idx)
+        if (
+            row_layout is not None
+            and row_layout.row is row
+            and row_layout.version is not None
+            and row_layout.version == row_version(row)
+        ):
+            return row_layout
+        convert_percentage(row, cols, self._progress_bar_width)
+        lengths = tuple(len(str(row.get(c))) for c in cols)
+        row_layout = RowLayout(row=row, version=row_version(row), lengths=lengths)
+        menu_layout.rows[idx] = row_layout
+        return row_layout
 
     def _menu_header_line(self, menu_layout: tuple[list, ...]) -> CursesLine:
         """Generate the menu header line.
@@ -148,26 +275,6 @@ class MenuBuilder:
             decoration=curses.A_UNDERLINE,
         )
 
-    def _menu_lines(
-        self,
-        dicts: ContentTypeSequence,
-        menu_layout: tuple[list, ...],
-        indices,
-    ) -> CursesLines:
-        """Generate all the menu lines.
-
-        :param dicts: A list of dicts from which the menu will be generated
-        :param indices: A range of what's showing in the UI
-        :param menu_layout: A tuple of menu details:
-
-            * ``menu_layout[0]``: ``List[int]``, the starting in for each column
-            * ``menu_layout[1]``: ``List[str]``, the columns of the menu
-            * ``menu_layout[2]``: ``List[int]``, the adjusted column widths
-            * ``menu_layout[3]``: ``CursesLine``, the menu header, used to determine justification
-        :returns: The menu lines
-        """
-        return CursesLines(tuple(self._menu_line(dicts[idx], menu_layout) for idx in indices))
-
     def _menu_line(
         self,
         menu_entry: dict[str, Any] | ContentBase,
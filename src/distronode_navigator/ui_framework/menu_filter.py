@@ -0,0 +1,129 @@
+"""Filter the rows of a menu, reusing the result for rows that did not change.
+
+The indices of the rows matching a filter are kept for each filter and menu. When
+the menu is filtered again, the filter is only evaluated for rows that changed or
+were added since, and the indices are extended rather than rebuilt when rows were
+only added, as they are to the task list of a running play.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from re import Pattern
+from typing import Any
+
+
+FILTER_CACHE_SIZE = 8
+"""The number of filtered menus for which the matching rows are kept"""
+
+
+def filter_version(row: Any, columns: tuple[str, ...]) -> Any:
+    """Determine a value that changes whenever the filtered columns of a row change.
+
+    :param row: The menu row
+    :param columns: The columns the filter is applied to
+    :returns: The ``row_version`` of the row if it has one, otherwise the column values
+    """
+    version = getattr(row, "row_version", None)
+    if version is not None:
+        return version
+    return tuple(row.get(column) for column in columns)
+
+
+@dataclass
+class FilteredMenu:
+    """The rows of one menu matching one filter."""
+
+    #: The rows of the menu
+    rows: Sequence[Any]
+    #: Each row when last filtered
+    seen: list[Any] = field(default_factory=list)
+    #: The version of each row when last filtered
+    versions: list[Any] = field(default_factory=list)
+    #: If each row matched the filter
+    matches: list[bool] = field(default_factory=list)
+    #: The indices of the rows matching the filter
+    indices: tuple[int, ...] = ()
+
+
+class MenuFilter:
+    """Filter the rows of menus, keeping the result for a limited number of menus."""
+
+    def __init__(self, cache_size: int = FILTER_CACHE_SIZE) -> None:
+        """Initialize the menu filter.
+
+        :param cache_size: The number of filtered menus to keep
+        """
+        self.cache_size = cache_size
+        self._filtered: OrderedDict[tuple[Any, ...], FilteredMenu] = OrderedDict()
+        self.evaluated = 0
+
+    def indices(
+        self,
+        regex: Pattern,
+        rows: Sequence[Any],
+        columns: list[str],
+    ) -> tuple[int, ...]:
+        """Determine the indices of the rows with a column matching a regular expression.
+
+        :param regex: The compiled regular expression
+        :param rows: The rows of the menu
+        :param columns: The columns of the rows to search
+        :returns: The indices of the matching rows
+        """
+        cols = tuple(columns)
+        key = (regex.pattern, regex.flags, id(rows), cols)
+        filtered = self._filtered.get(key)
+        if filtered is None or filtered.rows is not rows:
+            filtered = FilteredMenu(rows=rows)
+            self._filtered[key] = filtered
+            if len(self._filtered) > self.cache_size:
+                self._filtered.popitem(last=False)
+        self._filtered.move_to_end(key)
+
+        if len(rows) < len(filtered.matches):
+            del filtered.seen[len(rows) :]
+            del filtered.versions[len(rows) :]
+            del filtered.matches[len(rows) :]
+            filtered.indices = tuple(idx for idx in filtered.indices if idx < len(rows))
+
+        previous = len(filtered.matches)
+        first_changed = None
+        for idx, row in enumerate(rows):
+            version = filter_version(row, cols)
+            if idx < previous and filtered.seen[idx] is row and filtered.versions[idx] == version:
+                continue
+            matched = self._match(regex, row, cols)
+            if idx < previous:
+                changed = filtered.matches[idx] != matched
+                filtered.seen[idx] = row
+                filtered.versions[idx] = version
+                filtered.matches[idx] = matched
+                if changed and first_changed is None:
+                    first_changed = idx
+            else:
+                filtered.seen.append(row)
+                filtered.versions.append(version)
+                filtered.matches.append(matched)
+
+        if first_changed is not None:
+            filtered.indices = tuple(idx for idx, matched in enumerate(filtered.matches) if matched)
+        elif len(filtered.matches) > previous:
+            filtered.indices += tuple(
+                idx for idx in range(previous, len(filtered.matches)) if filtered.matches[idx]
+            )
+        return filtered.indices
+
+    def _match(self, regex: Pattern, row: Any, columns: tuple[str, ...]) -> bool:
+        """Determine if any column of a row matches a regular expression.
+
+        :param regex: The compiled regular expression
+        :param row: The menu row
+        :param columns: The columns of the row to search
+        :returns: True if a column matches
+        """
+        self.evaluated += 1
+        return any(regex.search(str(row.get(column))) for column in columns)
@@ -5,11 +5,14 @@ from __future__ import annotations
 import curses
 import logging
 import re
+import select
+import sys
+import time
 
+from collections import defaultdict
 from collections.abc import Mapping
 from collections.abc import Sequence
 from curses import ascii as curses_ascii
-from functools import cache
 from math import ceil
 from math import floor
 from re import Match
@@ -24,9 +27,12 @@ from distronode_navigator.content_defs import ContentType
 from distronode_navigator.content_defs import ContentTypeSequence
 from distronode_navigator.content_defs import ContentView
 from distronode_navigator.utils.functions import templar
-from distronode_navigator.utils.serialize import serialize
+from distronode_navigator.utils.serialize import SerializedLines
+from distronode_navigator.utils.serialize import serialize_lines
+from distronode_navigator.utils.wakeup import Wakeup
 
 from .colorize import Colorize
+from .colorize import ansi_to_curses
 from .colorize import rgb_to_ansi
 from .curses_defs import CursesLine
 from .curses_defs import CursesLinePart
@@ -39,7 +45,10 @@ from .field_text import FieldText
 from .form import Form
 from .form_handler_text import FormHandlerText
 from .form_utils import warning_notification
+from .frame import Frame
+from .frame import FrameTracker
 from .menu_builder import MenuBuilder
+from .menu_filter import MenuFilter
 from .ui_config import UIConfig
 from .ui_constants import Decoration
 
@@ -51,6 +60,11 @@ STANDARD_KEYS = {
     "esc": "back",
 }
 END_KEYS = {":help": "help"}
+WINDOW_LINES_LIMIT = 5_000
+IDLE_REFRESH = 1_000
+"""The screen refresh time in ms while waiting on wakeups, they wake the screen sooner"""
+MIN_FRAME_INTERVAL = 10
+"""The shortest time in ms between frames drawn for wakeups, doubled while they keep coming"""
 
 
 class Action(NamedTuple):
@@ -66,6 +80,44 @@ class Content(NamedTuple):
     showing: Any
 
 
+class SerializedContent(NamedTuple):
+    """content serialized for display, colored one window at a time."""
+
+    key: tuple[Any, ...]
+    source: Any
+    lines: Sequence[str]
+    scope: str
+    rendered: CursesLines | None = None
+
+    @property
+    def line_count(self) -> int:
+        """Return the number of lines to display.
+
+        :returns: The number of lines
+        """
+        return len(self.lines) if self.rendered is None else len(self.rendered)
+
+
+def content_fingerprint(obj: Any) -> tuple[Any, ...]:
+    """Identify content without serializing it.
+
+    A string is identified by its value. A mapping or sequence is identified by the
+    identities of its values, so a new container holding the same values, such as filtered
+    content, is identified the same. The content must be referenced for as long as the
+    fingerprint is in use, so the identities can not be reused.
+
+    :param obj: The content
+    :returns: The fingerprint for the content
+    """
+    if isinstance(obj, str):
+        return (str, obj)
+    if isinstance(obj, Mapping):
+        return (type(obj), tuple((key, id(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj), tuple(id(value) for value in obj))
+    return (type(obj), id(obj))
+
+
 class Menu(NamedTuple):
     """details about the currently showing menu."""
 
@@ -126,6 +178,8 @@ class Ui(NamedTuple):
     show_form: Callable[[Form], Form]
     update_status: Callable
     content_format: ContentFormatCallable
+    add_wakeup: Callable[[Wakeup], None]
+    remove_wakeup: Callable[[Wakeup], None]
 
 
 class Interaction(NamedTuple):
@@ -171,11 +225,15 @@ class UserInterface(CursesWindow):
         self._default_colors = None
         self._default_pairs = None
         self._default_content_format = ContentFormat.YAML
+        self._frame_tracker = FrameTracker()
         self._filter_content_keys: Callable[[Any], dict[Any, Any]]
         self._hide_keys = True
         self._kegexes = kegexes
         self._logger = logging.getLogger(__name__)
+        self._menu_builder: MenuBuilder | None = None
+        self._menu_builder_key: tuple[int, Callable] | None = None
         self._menu_filter: Pattern | None = None
+        self._filtered_menus = MenuFilter()
         self._menu_indices: tuple[int, ...] = tuple()
 
         self._progress_bar_width = progress_bar_width
@@ -188,6 +246,11 @@ class UserInterface(CursesWindow):
         self._content_format = self._default_content_format
         self._status = ""
         self._status_color = 0
+        self._serialized: SerializedContent | None = None
+        self._wakeups: list[Wakeup] = []
+        self._frame_interval = MIN_FRAME_INTERVAL
+        self._last_wake = 0.0
+        self._window_lines: dict[int, CursesLine] = {}
         self._screen: Window = curses.initscr()
         self._screen.timeout(refresh)
         self._one_line_input = FormHandlerText(screen=self._screen, ui_config=self._ui_config)
@@ -196,6 +259,7 @@ class UserInterface(CursesWindow):
         """Clear the screen."""
         self._screen.clear()
         self._screen.refresh()
+        self._frame_tracker.invalidate()
 
     def disable_refresh(self) -> None:
         """Disable the screen refresh."""
@@ -208,6 +272,22 @@ class UserInterface(CursesWindow):
         self._refresh.pop()
         self._screen.timeout(self._refresh.pop())
 
+    def add_wakeup(self, wakeup: Wakeup) -> None:
+        """Wake the screen to refresh when a wakeup is set, rather than at each refresh.
+
+        :param wakeup: The wakeup, set when there is something new to show
+        """
+        if wakeup not in self._wakeups:
+            self._wakeups.append(wakeup)
+
+    def remove_wakeup(self, wakeup: Wakeup) -> None:
+        """Stop waking the screen to refresh when a wakeup is set.
+
+        :param wakeup: The wakeup
+        """
+        if wakeup in self._wakeups:
+            self._wakeups.remove(wakeup)
+
     def update_status(self, status: str = "", status_color: int = 0) -> None:
         """Update the status.
 
@@ -279,6 +359,8 @@ class UserInterface(CursesWindow):
             show_form=self.show_form,
             update_status=self.update_status,
             content_format=self.content_format,
+            add_wakeup=self.add_wakeup,
+            remove_wakeup=self.remove_wakeup,
         )
         return res
 
@@ -341,33 +423,53 @@ class UserInterface(CursesWindow):
         menu_size: int,
         body_start: int,
         body_stop: int,
-    ) -> None:
-        """Add a scroll bar if the length of the content is longer than the viewport height.
+    ) -> dict[int, CursesLine]:
+        """Build a scroll bar if the length of the content is longer than the viewport height.
 
         :param viewport_height: The height of the viewport
         :param len_heading: The height of the heading
         :param menu_size: The number of lines in the content
         :param body_start: Where we are in the body
         :param body_stop: The end of the body
+        :returns: The scroll bar line for each row it is drawn on
         """
         start_scroll_bar = body_start / menu_size * viewport_height
         stop_scroll_bar = body_stop / menu_size * viewport_height
         len_scroll_bar = ceil(stop_scroll_bar - start_scroll_bar)
-        color = self._prefix_color
+        line_part = CursesLinePart(
+            column=self._screen_width - 1,
+            string="\u2592",
+            color=self._prefix_color,
+            decoration=0,
+        )
+        rows = {}
         for idx in range(int(start_scroll_bar), int(start_scroll_bar + len_scroll_bar)):
             lineno = idx + len_heading
-            line_part = CursesLinePart(
-                column=self._screen_width - 1,
-                string="\u2592",
-                color=color,
-                decoration=0,
-            )
-            self._add_line(
-                window=self._screen,
-                lineno=min(lineno, viewport_height + len_heading),
-                line=CursesLine(
-                    ((line_part,)),
-                ),
+            rows[min(lineno, viewport_height + len_heading)] = CursesLine((line_part,))
+        return rows
+
+    def _draw_frame(self, frame: Frame) -> None:
+        """Draw the rows of a frame that changed since the last frame was drawn.
+
+        :param frame: The parts to draw on each row
+        """
+        damage = self._frame_tracker.damage(frame, self._screen.getmaxyx())
+        if damage.erase:
+            self._screen.erase()
+        for lineno, parts in damage.rows.items():
+            if not damage.erase:
+                self._screen.move(lineno, 0)
+                self._screen.clrtoeol()
+            for prefix, line in parts:
+                self._add_line(window=self._screen, lineno=lineno, line=line, prefix=prefix)
+        self._screen.noutrefresh()
+        curses.doupdate()
+        if damage.rows:
+            self._logger.debug(
+                "Frame %s: drew %s rows, %s characters",
+                self._frame_tracker.frames,
+                len(damage.rows),
+                damage.characters,
             )
 
     def _get_input_line(self) -> str:
@@ -387,6 +489,7 @@ class UserInterface(CursesWindow):
             ),
         )
         self._screen.refresh()
+        self._frame_tracker.forget_row(input_at)
         self._one_line_input.win = curses.newwin(1, self._screen_width, input_at, 1)
         self._one_line_input.win.keypad(True)
         while True:
@@ -438,42 +541,39 @@ class UserInterface(CursesWindow):
         other_valid_keys = ["+", "-", "_", "KEY_F(5)", "^[", "\x1b"]
 
         while True:
-            self._screen.erase()
+            frame: Frame = defaultdict(tuple)
             prefix = " " * (index_width + len("|")) if indent_heading else None
 
             # Add the heading
             for idx, line in enumerate(heading):
-                self._add_line(window=self._screen, lineno=idx, line=line, prefix=prefix)
+                frame[idx] += ((prefix, line),)
 
             # Add the content
             for idx, line in enumerate(lines):
                 line_index = line_numbers[idx]
                 line_index_str = str(line_index).rjust(index_width)
                 prefix = f"{line_index_str}\u2502"
-                self._add_line(
-                    window=self._screen,
-                    lineno=idx + len(heading),
-                    line=line,
-                    prefix=prefix,
-                )
+                frame[idx + len(heading)] += ((prefix, line),)
 
             # Add the scroll bar
             if count > viewport_height:
-                self._scroll_bar(
+                scroll_bar = self._scroll_bar(
                     viewport_height=viewport_height,
                     len_heading=len(heading),
                     menu_size=count,
                     body_start=self._scroll - viewport_height,
                     body_stop=self._scroll,
                 )
+                for lineno, line in scroll_bar.items():
+                    frame[lineno] += ((None, line),)
 
             # Add the footer after the rest of the screen has been drawn
-            self._add_line(window=self._screen, lineno=footer_at, line=footer)
+            frame[footer_at] += ((None, footer),)
 
-            self._screen.refresh()
+            self._draw_frame(frame)
 
             if await_input:
-                char = self._screen.getch()
+                char = self._get_key()
                 key = "KEY_F(5)" if char == -1 else curses.keyname(char).decode()
             else:
                 key = "KEY_F(5)"
@@ -509,6 +609,45 @@ class UserInterface(CursesWindow):
             if return_value is not None:
                 return return_value
 
+    def _get_key(self) -> int:
+        """Wait for a key, or until the screen should be refreshed.
+
+        Without wakeups, the screen is refreshed each refresh time. With wakeups, the
+        screen is refreshed as soon as one is set, or after the idle refresh time.
+        While wakeups keep being set, the time between frames is doubled up to the
+        refresh time, so a burst of wakeups is drawn as fewer frames.
+
+        :returns: The key, or -1 to refresh the screen
+        """
+        if not self._wakeups or self._refresh[-1] < 0:
+            return self._screen.getch()
+
+        # curses may hold keys already read from the terminal
+        self._screen.timeout(0)
+        char = self._screen.getch()
+        self._screen.timeout(self._refresh[-1])
+        if char != -1:
+            return char
+
+        stdin = sys.stdin.fileno()
+        readable, _, _ = select.select([stdin, *self._wakeups], [], [], IDLE_REFRESH / 1000)
+        if stdin in readable:
+            return self._screen.getch()
+        if readable:
+            since_wake = (time.monotonic() - self._last_wake) * 1000
+            if since_wake < self._frame_interval:
+                remaining = (self._frame_interval - since_wake) / 1000
+                self._frame_interval = min(self._frame_interval * 2, self._refresh[-1])
+                readable, _, _ = select.select([stdin], [], [], remaining)
+                if readable:
+                    return self._screen.getch()
+            else:
+                self._frame_interval = MIN_FRAME_INTERVAL
+            for wakeup in self._wakeups:
+                wakeup.clear()
+            self._last_wake = time.monotonic()
+        return -1
+
     def _template_match_action(
         self,
         entry: str,
@@ -546,33 +685,92 @@ class UserInterface(CursesWindow):
         self._show_form(warning_notification(msgs))
         return None, None
 
-    def _serialize_color(self, obj: Any) -> CursesLines:
-        """Serialize, if necessary and color an obj.
+    def _serialize(self, obj: Any) -> SerializedContent:
+        """Serialize, if necessary, an obj and index its lines.
 
-        :param obj: the object to color
-        :returns: The generated lines
-        """
-        if self.content_format() is ContentFormat.ANSI:
-            return self._colorizer.render_ansi(doc=obj)
+        The most recently serialized content is reused when the same content is shown again
+        with the same format and view.
 
+        :param obj: the object to serialize
+        :returns: The serialized content
+        """
+        content_format = self.content_format()
         content_view = ContentView.NORMAL if self._hide_keys else ContentView.FULL
-        current_format = self.content_format()
-        if current_format.value.serialization:
-            string = serialize(
+
+        scope = "no_color"
+        if content_format is ContentFormat.ANSI or self._ui_config.color:
+            scope = content_format.value.scope
+
+        key = (content_format, content_view, scope, content_fingerprint(obj))
+        if self._serialized is not None and self._serialized.key == key:
+            return self._serialized
+
+        lines: Sequence[str]
+        if content_format.value.serialization:
+            lines = serialize_lines(
                 content_view=content_view,
                 content=obj,
-                serialization_format=current_format.value.serialization,
+                serialization_format=content_format.value.serialization,
             )
+        elif isinstance(obj, str):
+            lines = SerializedLines(obj)
         else:
-            string = obj
+            # Already a sequence of lines, such as standard out
+            lines = obj
+
+        rendered = None
+        if scope == ContentFormat.MARKDOWN.value.scope:
+            # Markdown is stripped across the whole document, so render it all at once
+            doc = lines.text if isinstance(lines, SerializedLines) else "\n".join(lines)
+            simple_lines = self._colorizer.render(doc=doc, scope=scope)
+            self._cache_init_colors(simple_lines)
+            rendered = self._color_decorate_lines(simple_lines)
+
+        self._serialized = SerializedContent(
+            key=key,
+            source=obj,
+            lines=lines,
+            scope=scope,
+            rendered=rendered,
+        )
+        self._window_lines = {}
+        return self._serialized
 
-        scope = "no_color"
-        if self._ui_config.color:
-            scope = self.content_format().value.scope
+    def _content_window(self, content: SerializedContent, start: int, stop: int) -> CursesLines:
+        """Color the lines of serialized content being shown.
+
+        One additional window of lines is colored before and after the lines being
+        shown, so scrolling does not require each new line to be colored individually.
+
+        :param content: The serialized content
+        :param start: The index of the first line being shown
+        :param stop: The index after the last line being shown
+        :returns: The lines being shown, colored
+        """
+        if content.rendered is not None:
+            return CursesLines(content.rendered[start:stop])
+
+        missing = [idx for idx in range(start, stop) if idx not in self._window_lines]
+        if missing:
+            read_ahead = stop - start
+            first = max(0, missing[0] - read_ahead)
+            last = min(len(content.lines), missing[-1] + 1 + read_ahead)
+            if content.scope == ContentFormat.ANSI.value.scope:
+                colored = [ansi_to_curses(line) for line in content.lines[first:last]]
+            else:
+                simple_lines = self._colorizer.render_window(
+                    content.lines,
+                    content.scope,
+                    first,
+                    last,
+                )
+                self._cache_init_colors(simple_lines)
+                colored = [self._color_decorate_line(line) for line in simple_lines]
+            if len(self._window_lines) > WINDOW_LINES_LIMIT:
+                self._window_lines = {}
+            self._window_lines.update(zip(range(first, last), colored))
 
-        rendered = self._colorizer.render(doc=string, scope=scope)
-        self._cache_init_colors(rendered)
-        return self._color_decorate_lines(rendered)
+        return CursesLines(tuple(self._window_lines[idx] for idx in range(start, stop)))
 
     def _cache_init_colors(self, lines: list):
         """Cache and init the unique colors for future use.
@@ -649,16 +847,16 @@ class UserInterface(CursesWindow):
             decoration=decoration,
         )
 
-    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, CursesLines]:
+    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, SerializedContent]:
         """Filter an obj and serialize.
 
         :param obj: the obj to serialize
-        :returns: the serialize lines ready for display
+        :returns: the heading and the serialized content ready for display
         """
         heading = self._content_heading(obj, self._screen_width)
         filtered_obj = self._filter_content_keys(obj) if self._hide_keys else obj
-        lines = self._serialize_color(filtered_obj)
-        return heading, lines
+        content = self._serialize(filtered_obj)
+        return heading, content
 
     def _show_form(self, obj: Form) -> Form:
         """Show a form on the display.
@@ -667,6 +865,8 @@ class UserInterface(CursesWindow):
         :returns: The form
         """
         res = obj.present(screen=self._screen, ui_config=self._ui_config)
+        # The form is drawn over the screen, so it is drawn in full afterwards
+        self._frame_tracker.invalidate()
         return res
 
     def _show_obj_from_list(
@@ -683,18 +883,19 @@ class UserInterface(CursesWindow):
         :param await_input: Should we wait for user input before returning
         :returns: interaction with the user
         """
-        heading, lines = self._filter_and_serialize(objs[index])
+        heading, content = self._filter_and_serialize(objs[index])
         while True:
             heading_len = len(heading) if heading is not None else 0
             footer_len = 1
+            line_count = content.line_count
 
             if self.scroll() == 0:
                 last_line_idx = min(
-                    len(lines) - 1,
+                    line_count - 1,
                     self._screen_height - heading_len - footer_len - 1,
                 )
             else:
-                last_line_idx = min(len(lines) - 1, self._scroll - 1)
+                last_line_idx = min(line_count - 1, self._scroll - 1)
 
             first_line_idx = max(
                 0,
@@ -706,13 +907,13 @@ class UserInterface(CursesWindow):
             line_numbers = tuple(range(first_line_idx, last_line_idx + 1))
 
             entry = self._display(
-                lines=CursesLines(lines[first_line_idx : last_line_idx + 1]),
+                lines=self._content_window(content, first_line_idx, last_line_idx + 1),
                 line_numbers=line_numbers,
                 heading=heading,
                 indent_heading=False,
                 key_dict=key_dict,
                 await_input=await_input,
-                count=len(lines),
+                count=line_count,
             )
             if entry in ["KEY_DOWN", "KEY_UP", "KEY_NPAGE", "KEY_PPAGE", "^F", "^B"]:
                 continue
@@ -724,7 +925,7 @@ class UserInterface(CursesWindow):
 
             if entry == "_":
                 self._hide_keys = not self._hide_keys
-                heading, lines = self._filter_and_serialize(objs[index])
+                heading, content = self._filter_and_serialize(objs[index])
                 continue
 
             # get the less or more, wrap, in case we jumped out of the menu indices
@@ -767,26 +968,6 @@ class UserInterface(CursesWindow):
                 content = Content(showing=filtered)
                 return Interaction(name=name, action=action, content=content, ui=self._ui)
 
-    def _obj_match_filter(self, obj: dict, columns: list) -> bool:
-        """Check columns in a dictionary against a regex.
-
-        :param obj: The dict to check
-        :param columns: The dicts keys to check
-        :returns: True if a match else False
-        """
-        return any(self._search_value(self.menu_filter(), obj.get(key)) for key in columns)
-
-    @staticmethod
-    @cache
-    def _search_value(regex: Pattern, value: str) -> Match | None:
-        """Check a str against a regex.
-
-        :param regex: the compiled regex
-        :param value: the string to check
-        :returns: the match if made
-        """
-        return regex.search(str(value))
-
     def _get_heading_menu_items(
         self,
         current: Sequence[Any],
@@ -800,14 +981,18 @@ class UserInterface(CursesWindow):
         :param indices: The indices associated with items
         :returns: The heading and menu items
         """
-        menu_builder = MenuBuilder(
-            progress_bar_width=self._progress_bar_width,
-            screen_width=self._screen_width,
-            number_colors=curses.COLORS,
-            color_menu_item=self._color_menu_item,
-            ui_config=self._ui_config,
-        )
-        menu_heading, menu_items = menu_builder.build(current, columns, indices)
+        # The menu builder keeps the menu layout between frames, while its settings are the same
+        builder_key = (self._screen_width, self._color_menu_item)
+        if self._menu_builder is None or self._menu_builder_key != builder_key:
+            self._menu_builder = MenuBuilder(
+                progress_bar_width=self._progress_bar_width,
+                screen_width=self._screen_width,
+                number_colors=curses.COLORS,
+                color_menu_item=self._color_menu_item,
+                ui_config=self._ui_config,
+            )
+            self._menu_builder_key = builder_key
+        menu_heading, menu_items = self._menu_builder.build(current, columns, indices)
         return menu_heading, menu_items
 
     def _show_menu(self, current: Sequence[Any], columns: list, await_input: bool) -> Interaction:
@@ -818,6 +1003,13 @@ class UserInterface(CursesWindow):
         :param await_input: Should we wait for user input?
         :returns: Interaction with the user
         """
+        # The menu can only change once this returns to the action, so filter it once
+        menu_filter = self.menu_filter()
+        if menu_filter:
+            self._menu_indices = self._filtered_menus.indices(menu_filter, current, columns)
+        else:
+            self._menu_indices = tuple(range(len(current)))
+
         while True:
             if self.scroll() == 0:
                 last_line_idx = min(len(current) - 1, self._screen_height - 3)
@@ -826,14 +1018,10 @@ class UserInterface(CursesWindow):
 
             first_line_idx = max(0, last_line_idx - (self._screen_height - 3))
 
-            if self.menu_filter():
-                self._menu_indices = tuple(
-                    idx for idx, mi in enumerate(current) if self._obj_match_filter(mi, columns)
-                )
+            if menu_filter:
                 line_numbers = tuple(range(last_line_idx - first_line_idx + 1))
                 self._scroll = min(len(self._menu_indices), self._scroll)
             else:
-                self._menu_indices = tuple(range(len(current)))
                 line_numbers = self._menu_indices[first_line_idx : last_line_idx + 1]
 
             showing_indices = self._menu_indices[first_line_idx : last_line_idx + 1]
@@ -882,7 +1070,7 @@ class UserInterface(CursesWindow):
 
         :param obj: The inbound object
         :param content_format: Set the content format
-        :param index: When obj is a list, show this entry
+        :param index: When obj is a list or other sequence, show this entry
         :param columns: When obj is a list of dicts, use these keys for menu columns
         :param await_input: Should we wait for user input?
         :param filter_content_keys: To show the filter content keys
@@ -896,7 +1084,7 @@ class UserInterface(CursesWindow):
         columns = columns or []
         self.content_format(content_format or self._default_content_format)
 
-        if index is not None and isinstance(obj, (list, tuple)):
+        if index is not None and isinstance(obj, Sequence) and not isinstance(obj, str):
             result = self._show_obj_from_list(obj, index, await_input)
         elif columns and isinstance(obj, (list, tuple)):
             result = self._show_menu(obj, columns, await_input)
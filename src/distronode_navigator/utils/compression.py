@@ -0,0 +1,95 @@
+"""Open text files compressed with gzip, lzma or zstandard.
+
+When writing, the compression is chosen from the suffix of the file name. When
+reading, the compression is detected from the start of the file, so a file can be
+read regardless of its name. The ``zstandard`` package is used for zstandard
+compression when it is installed, gzip and lzma are always available.
+"""
+
+from __future__ import annotations
+
+import gzip
+import lzma
+import os
+
+from typing import IO
+
+
+try:
+    import zstandard
+
+    HAS_ZSTANDARD = True
+except ImportError:
+    HAS_ZSTANDARD = False
+
+
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".lzma": "lzma",
+    ".xz": "lzma",
+    ".zst": "zstd",
+}
+
+MAGIC_NUMBERS = {
+    b"\x1f\x8b": "gzip",
+    b"\xfd7zXZ\x00": "lzma",
+    b"(\xb5/\xfd": "zstd",
+}
+
+GZIP_LEVEL = 6
+
+# Raised when reading a compressed file that is truncated or corrupt
+DECOMPRESSION_ERRORS: tuple[type[Exception], ...] = (EOFError, OSError, lzma.LZMAError)
+if HAS_ZSTANDARD:
+    DECOMPRESSION_ERRORS += (zstandard.ZstdError,)
+
+
+def compression_from_name(filename: str | os.PathLike[str]) -> str | None:
+    """Determine the compression for a file from the suffix of its name.
+
+    :param filename: The file name
+    :returns: The compression, or None if the file is not compressed
+    """
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(filename)[1].lower())
+
+
+def compression_from_content(filename: str | os.PathLike[str]) -> str | None:
+    """Detect the compression of an existing file from its start.
+
+    :param filename: The file name
+    :returns: The compression, or None if the file is not compressed
+    """
+    with open(filename, "rb") as fh:
+        start = fh.read(max(len(magic) for magic in MAGIC_NUMBERS))
+    return next(
+        (compression for magic, compression in MAGIC_NUMBERS.items() if start.startswith(magic)),
+        None,
+    )
+
+
+def open_text(
+    filename: str | os.PathLike[str],
+    mode: str,
+    compression: str | None,
+) -> IO[str]:
+    """Open a file for reading or writing text, compressed or not.
+
+    :param filename: The file name
+    :param mode: The mode, ``r``, ``w`` or ``a``
+    :param compression: The compression, or None if the file is not compressed
+    :raises ValueError: When the compression is not recognized or not available
+    :returns: The opened file
+    """
+    if compression is None:
+        return open(filename, mode, encoding="utf-8")  # noqa: SIM115
+    if compression == "gzip":
+        return gzip.open(filename, f"{mode}t", compresslevel=GZIP_LEVEL, encoding="utf-8")
+    if compression == "lzma":
+        return lzma.open(filename, f"{mode}t", encoding="utf-8")
+    if compression == "zstd":
+        if not HAS_ZSTANDARD:
+            msg = "Zstandard compression requires the 'zstandard' package"
+            raise ValueError(msg)
+        return zstandard.open(filename, f"{mode}t", encoding="utf-8")
+    msg = f"Unknown compression '{compression}'"
+    raise ValueError(msg)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 
 from collections.abc import ItemsView
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import KeysView
 from collections.abc import MutableMapping
@@ -12,6 +14,27 @@ from collections.abc import ValuesView
 from pathlib import Path
 
 
+# Stay below the lowest default limit of host parameters in a single statement
+MAX_VARIABLES = 900
+FETCH_SIZE = 1_000
+
+
+def _chunked(keys: Iterable[str]) -> Iterator[list[str]]:
+    """Split keys into lists small enough for a single statement.
+
+    :param keys: The keys to split
+    :yields: Lists of at most MAX_VARIABLES keys
+    """
+    chunk: list[str] = []
+    for key in keys:
+        chunk.append(key)
+        if len(chunk) == MAX_VARIABLES:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 class KVSKeysView(KeysView[str]):
     """A glorified KeysView specific to, and returned by, methods in KeyValueStore."""
 
@@ -25,17 +48,42 @@ class KVSValuesView(ValuesView[str]):
 
 
 class KeyValueStore(MutableMapping[str, str]):
-    """An interface to use a sqlite database as a key-value store."""
+    """An interface to use a sqlite database as a key-value store.
 
-    def __init__(self, filename: str | Path):
+    The connection may be shared across threads, all access to it is serialized
+    with a lock.
+    """
+
+    def __init__(self, filename: str | Path, journal_mode: str = "wal", table: str = "kv"):
         """Initialize the key-value store.
 
         :param filename: The full path to the sqlite database file
+        :param journal_mode: The sqlite journal mode, write-ahead logging by default
+        :param table: The table in the database to use for the key-value store
         """
         self._path = str(filename)
-        self.conn = sqlite3.connect(self._path)
-        cursor = self.conn.cursor()
-        cursor.execute("CREATE TABLE IF NOT EXISTS kv (key text unique, value text)")
+        self._table = table
+        self._journal_mode = journal_mode
+        self._lock = threading.RLock()
+        self._closed = True
+        self.conn = self._connect()
+        with self._lock:
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table} (key text unique, value text)",
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database and set the journal mode.
+
+        :returns: A connection to the database
+        """
+        conn = sqlite3.connect(self._path, check_same_thread=False)
+        conn.execute(f"PRAGMA journal_mode={self._journal_mode}")
+        if self._journal_mode.lower() == "wal":
+            # Durable at each checkpoint, which is enough for a cache
+            conn.execute("PRAGMA synchronous=NORMAL")
+        self._closed = False
+        return conn
 
     @property
     def path(self) -> str:
@@ -47,24 +95,50 @@ class KeyValueStore(MutableMapping[str, str]):
 
     def close(self) -> None:
         """Close the connection to the database."""
-        self.conn.commit()
-        self.conn.close()
+        with self._lock:
+            if self._closed:
+                return
+            self.conn.commit()
+            self.conn.close()
+            self._closed = True
+
+    def commit(self) -> None:
+        """Commit changes, so other connections to the database see them."""
+        with self._lock:
+            self.conn.commit()
 
     def open_(self) -> sqlite3.Connection:
-        """Establish the connection to the database.
+        """Establish the connection to the database, reusing it if already open.
 
         :returns: A connection to the database
         """
-        self.conn = sqlite3.connect(self.path)
-        return self.conn
+        with self._lock:
+            if self._closed:
+                self.conn = self._connect()
+            return self.conn
+
+    def _rows(self, sql: str) -> Iterator[tuple]:
+        """Yield rows for a query, fetching them in batches while holding the lock.
+
+        :param sql: The query to run
+        :yields: The rows of the result
+        """
+        with self._lock:
+            cursor = self.conn.execute(sql)
+            rows = cursor.fetchmany(FETCH_SIZE)
+        while rows:
+            yield from rows
+            with self._lock:
+                rows = cursor.fetchmany(FETCH_SIZE)
 
     def __len__(self) -> int:
         """Count the number of keys in the key-value store.
 
         :returns: The number of keys
         """
-        cursor = self.conn.cursor()
-        rows = cursor.execute("SELECT COUNT(*) FROM kv").fetchone()[0]
+        with self._lock:
+            sql = f"SELECT COUNT(*) FROM {self._table}"  # noqa: S608
+            rows = self.conn.execute(sql).fetchone()[0]
         return rows if rows is not None else 0
 
     def iterkeys(self) -> Iterator[str]:
@@ -72,8 +146,7 @@ class KeyValueStore(MutableMapping[str, str]):
 
         :yields: The keys in the key-value store
         """
-        cursor = self.conn.cursor()
-        for row in cursor.execute("SELECT key FROM kv"):
+        for row in self._rows(f"SELECT key FROM {self._table}"):  # noqa: S608
             yield row[0]
 
     def itervalues(self) -> Iterator[str]:
@@ -81,8 +154,7 @@ class KeyValueStore(MutableMapping[str, str]):
 
         :yields: The values in the key-value store
         """
-        cursor = self.conn.cursor()
-        for row in cursor.execute("SELECT value FROM kv"):
+        for row in self._rows(f"SELECT value FROM {self._table}"):  # noqa: S608
             yield row[0]
 
     def iteritems(self) -> Iterator[tuple[str, str]]:
@@ -90,10 +162,51 @@ class KeyValueStore(MutableMapping[str, str]):
 
         :yields: The key-value store as items (key, value)
         """
-        cursor = self.conn.cursor()
-        for row in cursor.execute("SELECT key, value FROM kv"):
+        for row in self._rows(f"SELECT key, value FROM {self._table}"):  # noqa: S608
             yield row[0], row[1]
 
+    def contains_many(self, keys: Iterable[str]) -> set[str]:
+        """Determine which of the given keys are in the key-value store.
+
+        The lookups use the index of the unique key column.
+
+        :param keys: The keys to search for
+        :returns: The keys found in the key-value store
+        """
+        found: set[str] = set()
+        with self._lock:
+            for chunk in _chunked(keys):
+                placeholders = ",".join("?" * len(chunk))
+                sql = f"SELECT key FROM {self._table} WHERE key IN ({placeholders})"  # noqa: S608
+                found.update(row[0] for row in self.conn.execute(sql, chunk))
+        return found
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Return the values for many keys from the key-value store.
+
+        :param keys: The keys to find
+        :returns: The found keys and their values, keys not found are omitted
+        """
+        found: dict[str, str] = {}
+        with self._lock:
+            for chunk in _chunked(keys):
+                placeholders = ",".join("?" * len(chunk))
+                sql = (
+                    f"SELECT key, value FROM {self._table}"  # noqa: S608
+                    f" WHERE key IN ({placeholders})"
+                )
+                found.update(self.conn.execute(sql, chunk))
+        return found
+
+    def set_many(self, items: Iterable[tuple[str, str]]) -> None:
+        """Place many key-value combinations in the key-value store in a single transaction.
+
+        :param items: The key-value combinations to set
+        """
+        with self._lock, self.conn:
+            sql = f"REPLACE INTO {self._table} (key, value) VALUES (?,?)"  # noqa: S608
+            self.conn.executemany(sql, items)
+
     def keys(self) -> KVSKeysView:
         """Return all keys in the key-value store.
 
@@ -128,8 +241,10 @@ class KeyValueStore(MutableMapping[str, str]):
         :param key: The key to search for
         :returns: An indication of the provided key's existence in the key-value store
         """
-        cursor = self.conn.cursor()
-        return cursor.execute("SELECT 1 FROM kv WHERE key = ?", (key,)).fetchone() is not None
+        with self._lock:
+            sql = f"SELECT 1 FROM {self._table} WHERE key = ?"  # noqa: S608
+            cursor = self.conn.execute(sql, (key,))
+            return cursor.fetchone() is not None
 
     def __getitem__(self, key: str) -> str:
         """Return a value from the key-value store given a key.
@@ -138,8 +253,9 @@ class KeyValueStore(MutableMapping[str, str]):
         :raises KeyError: When the key does not exist in the key-value store
         :returns: The value for the key provided
         """
-        cursor = self.conn.cursor()
-        item = cursor.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        with self._lock:
+            sql = f"SELECT value FROM {self._table} WHERE key = ?"  # noqa: S608
+            item = self.conn.execute(sql, (key,)).fetchone()
         if item is None:
             raise KeyError(key)
         return item[0]
@@ -150,8 +266,9 @@ class KeyValueStore(MutableMapping[str, str]):
         :param key: The key of the combination to set
         :param value: The value of the combination to set
         """
-        cursor = self.conn.cursor()
-        cursor.execute("REPLACE INTO kv (key, value) VALUES (?,?)", (key, value))
+        with self._lock:
+            sql = f"REPLACE INTO {self._table} (key, value) VALUES (?,?)"  # noqa: S608
+            self.conn.execute(sql, (key, value))
 
     def __delitem__(self, key: str) -> None:
         """Delete a key-value combination in the key-value store.
@@ -159,10 +276,11 @@ class KeyValueStore(MutableMapping[str, str]):
         :param key: The key of the entry to delete
         :raises KeyError: When the provided key does not exist in the key-value store
         """
-        if key not in self:
-            raise KeyError(key)
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM kv WHERE key = ?", (key,))
+        with self._lock:
+            if key not in self:
+                raise KeyError(key)
+            sql = f"DELETE FROM {self._table} WHERE key = ?"  # noqa: S608
+            self.conn.execute(sql, (key,))
 
     def __iter__(self) -> Iterator[str]:
         """Yield values extracted from the key-value store one by one.
@@ -0,0 +1,158 @@
+"""A sequence of lines, the most recent held in memory and older lines spilled to disk.
+
+Lines are only ever appended. Once more than the memory limit of lines are held,
+the oldest are appended to an anonymous temporary file and the offset of each is
+indexed, so any line or range of lines can be read back without reading the file.
+"""
+
+from __future__ import annotations
+
+import tempfile
+
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import IO
+from typing import overload
+
+
+DEFAULT_MEMORY_LINES = 10_000
+READ_SIZE = 1_000
+
+
+class LineBuffer(Sequence[str]):
+    """A sequence of lines, the most recent held in memory and older lines spilled to disk."""
+
+    def __init__(self, memory_lines: int = DEFAULT_MEMORY_LINES, lines: Iterable[str] = ()):
+        """Initialize the line buffer.
+
+        :param memory_lines: The most lines to hold in memory, half are kept after spilling
+        :param lines: Initial lines
+        :raises ValueError: If the number of lines to hold in memory is less than 1
+        """
+        if memory_lines < 1:
+            msg = f"The lines held in memory must be at least 1, got {memory_lines}"
+            raise ValueError(msg)
+        self.memory_lines = memory_lines
+        self._recent: list[str] = []
+        self._offsets = array("q")
+        self._file: IO[bytes] | None = None
+        self._file_size = 0
+        self.extend(lines)
+
+    @property
+    def spilled(self) -> int:
+        """Return the number of lines spilled to disk.
+
+        :returns: The number of spilled lines
+        """
+        return len(self._offsets)
+
+    def __len__(self) -> int:
+        """Return the number of lines.
+
+        :returns: The number of lines
+        """
+        return len(self._offsets) + len(self._recent)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Return one line or a list of lines.
+
+        :param index: The line number or a slice of line numbers
+        :raises IndexError: If the line number is out of range
+        :returns: The line or lines
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[idx] for idx in range(start, stop, step)]
+            return self._read(start, stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "line index out of range"
+            raise IndexError(msg)
+        return self._read(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the lines, reading spilled lines in batches.
+
+        :yields: Each line
+        """
+        for start in range(0, self.spilled, READ_SIZE):
+            yield from self._read(start, min(start + READ_SIZE, self.spilled))
+        yield from list(self._recent)
+
+    def _read(self, start: int, stop: int) -> list[str]:
+        """Read a range of lines.
+
+        :param start: The index of the first line
+        :param stop: The index after the last line
+        :returns: The lines
+        """
+        if start >= stop:
+            return []
+        spilled = self.spilled
+        lines: list[str] = []
+        if start < spilled and self._file is not None:
+            spill_stop = min(stop, spilled)
+            base = self._offsets[start]
+            ends = [*self._offsets[start + 1 : spill_stop], self._file_size]
+            if spill_stop < spilled:
+                ends[-1] = self._offsets[spill_stop]
+            self._file.seek(base)
+            data = self._file.read(ends[-1] - base)
+            starts = [base, *ends[:-1]]
+            # Each line is followed by a line feed, which is not part of the line
+            lines = [
+                data[line_start - base : line_end - base - 1].decode("utf-8")
+                for line_start, line_end in zip(starts, ends)
+            ]
+        if stop > spilled:
+            lines.extend(self._recent[max(start - spilled, 0) : stop - spilled])
+        return lines
+
+    def append(self, line: str) -> None:
+        """Append a line.
+
+        :param line: The line, without a line boundary
+        """
+        self.extend((line,))
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """Append lines.
+
+        :param lines: The lines, without line boundaries
+        """
+        self._recent.extend(lines)
+        if len(self._recent) > self.memory_lines:
+            self._spill(len(self._recent) - self.memory_lines // 2)
+
+    def _spill(self, count: int) -> None:
+        """Move the oldest lines held in memory to disk.
+
+        :param count: The number of lines to move
+        """
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()  # noqa: SIM115
+        self._file.seek(self._file_size)
+        for line in self._recent[:count]:
+            self._offsets.append(self._file_size)
+            encoded = f"{line}\n".encode()
+            self._file.write(encoded)
+            self._file_size += len(encoded)
+        self._file.flush()
+        del self._recent[:count]
+
+    def close(self) -> None:
+        """Remove the spilled lines from disk, the buffer must not be used afterwards."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,156 @@
+"""Write and read line-delimited playbook artifacts.
+
+A line-delimited artifact holds one JSON record per line, so it can be appended to
+while the playbook runs and read back one record at a time. The first record holds
+the version and settings, the last the status of the playbook run. Each record
+between holds one of:
+
+* ``stdout``: Lines of standard out
+* ``play``: A play, without its tasks
+* ``task``: A task, a later record for the same task replaces an earlier one
+
+A line-delimited artifact is only written when the name of the artifact file has
+the ``.jsonl`` suffix, since it can not be loaded as a single JSON document as
+earlier artifacts can. The artifact is compressed when the name of the artifact
+file has a compression suffix, and read regardless of its compression.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from .compression import COMPRESSION_SUFFIXES
+from .compression import DECOMPRESSION_ERRORS
+from .compression import compression_from_content
+from .compression import open_text
+
+
+ARTIFACT_VERSION = "3.0.0"
+LINE_DELIMITED_SUFFIX = ".jsonl"
+
+logger = logging.getLogger(__name__)
+
+
+def is_line_delimited_name(filename: str) -> bool:
+    """Determine if an artifact file name is that of a line-delimited artifact.
+
+    :param filename: The artifact file name
+    :returns: True if the name has the line-delimited suffix, before any compression suffix
+    """
+    root, suffix = os.path.splitext(filename)
+    if suffix.lower() in COMPRESSION_SUFFIXES:
+        suffix = os.path.splitext(root)[1]
+    return suffix.lower() == LINE_DELIMITED_SUFFIX
+
+
+def is_line_delimited(path: str) -> bool:
+    """Determine if an artifact file is line-delimited.
+
+    :param path: The path to the artifact file
+    :returns: True if the first line of the file is a line-delimited artifact header
+    """
+    try:
+        with open_text(path, "r", compression_from_content(path)) as fh:
+            first_line = fh.readline()
+        header = json.loads(first_line)
+    except (*DECOMPRESSION_ERRORS, ValueError):
+        return False
+    return isinstance(header, dict) and str(header.get("version", "")).startswith("3.")
+
+
+def read_records(path: str) -> Iterator[dict[str, Any]]:
+    """Read the records of a line-delimited artifact, one at a time.
+
+    An artifact written by a playbook run that was interrupted may end with a partial
+    record, and a compressed artifact may be truncated or corrupt, reading stops at
+    the first record that can not be read.
+
+    :param path: The path to the artifact file
+    :yields: Each record in the artifact
+    """
+    with open_text(path, "r", compression_from_content(path)) as fh:
+        line_number = 0
+        try:
+            for line in fh:
+                line_number += 1
+                if line.strip():
+                    yield json.loads(line)
+        except (*DECOMPRESSION_ERRORS, ValueError) as exc:
+            logger.warning(
+                "Artifact record on line %s incomplete, stopping: %s",
+                line_number,
+                str(exc),
+            )
+
+
+class ArtifactWriter:
+    """Append records to a line-delimited artifact while the playbook runs.
+
+    Records are written to a temporary file, which is moved to the artifact file
+    once the playbook run is finished and the name of the artifact file is known.
+    """
+
+    def __init__(
+        self,
+        header: dict[str, Any],
+        directory: str | None = None,
+        compression: str | None = None,
+    ) -> None:
+        """Initialize the artifact writer and write the header record.
+
+        :param header: The settings to include in the header record
+        :param directory: The directory for the temporary file, ideally that of the artifact
+        :param compression: The compression for the artifact, or None to write it uncompressed
+        """
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(
+            prefix=".distronode-navigator-artifact-",
+            suffix=".partial",
+            dir=directory or None,
+        )
+        os.close(fd)
+        self._fh = open_text(self.path, "w", compression)
+        self.write({"version": ARTIFACT_VERSION, **header})
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append a record to the artifact.
+
+        :param record: The record
+        """
+        self._fh.write(json.dumps(record, default=str))
+        self._fh.write("\n")
+
+    def flush(self) -> None:
+        """Flush the records written so far to the temporary file."""
+        self._fh.flush()
+
+    def finish(self, footer: dict[str, Any], filename: str) -> None:
+        """Write the footer record and move the temporary file to the artifact file.
+
+        :param footer: The status of the playbook run
+        :param filename: The full path of the artifact file
+        """
+        self.write(footer)
+        self._fh.close()
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        try:
+            Path(self.path).replace(filename)
+        except OSError:
+            # The temporary file may be on another file system
+            shutil.move(self.path, filename)
+
+    def discard(self) -> None:
+        """Close and remove the temporary file."""
+        self._fh.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
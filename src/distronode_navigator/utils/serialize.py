@@ -8,12 +8,15 @@ import os
 import re
 import tempfile
 
+from array import array
+from collections.abc import Sequence
 from dataclasses import is_dataclass
 from functools import partial
 from pathlib import Path
 from typing import IO
 from typing import Any
 from typing import NamedTuple
+from typing import overload
 
 import yaml
 
@@ -22,6 +25,7 @@ from distronode_navigator.content_defs import ContentFormat
 from distronode_navigator.content_defs import ContentType
 from distronode_navigator.content_defs import ContentView
 from distronode_navigator.content_defs import SerializationFormat
+from distronode_navigator.utils.compression import open_text
 
 
 logger = logging.getLogger(__name__)
@@ -67,12 +71,88 @@ def serialize(
     raise ValueError(msg)
 
 
+LINE_BOUNDARY = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+"""The line boundaries used by ``str.splitlines``"""
+
+
+class SerializedLines(Sequence[str]):
+    """Serialized content and the offsets of its lines.
+
+    Any line or range of lines can be retrieved without splitting the entire content. Lines
+    are split on the same boundaries as ``str.splitlines`` and do not include them.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Initialize the serialized lines by indexing the line offsets.
+
+        :param text: The serialized content
+        """
+        self.text = text
+        self._starts = array("q", [0])
+        self._ends = array("q")
+        for match in LINE_BOUNDARY.finditer(text):
+            self._ends.append(match.start())
+            self._starts.append(match.end())
+        if self._starts[-1] == len(text):
+            # The text ends with a line boundary, so no line follows it
+            self._starts.pop()
+        else:
+            self._ends.append(len(text))
+
+    def __len__(self) -> int:
+        """Return the number of lines.
+
+        :returns: The number of lines
+        """
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Return one line or a list of lines.
+
+        :param index: The line number or a slice of line numbers
+        :returns: The line or lines
+        """
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        return self.text[self._starts[index] : self._ends[index]]
+
+
+def serialize_lines(
+    content: ContentType,
+    content_view: ContentView,
+    serialization_format: SerializationFormat,
+) -> SerializedLines:
+    """Serialize content and index the lines of the result.
+
+    :param content: The content to serialize
+    :param content_view: The content view
+    :param serialization_format: The serialization format
+    :returns: The serialized content and its line offsets
+    """
+    return SerializedLines(
+        serialize(
+            content=content,
+            content_view=content_view,
+            serialization_format=serialization_format,
+        ),
+    )
+
+
 def serialize_write_file(
     content: ContentType,
     content_view: ContentView,
     file_mode: str,
     file: Path,
     serialization_format: SerializationFormat,
+    *,
+    compact: bool = False,
+    compression: str | None = None,
 ):
     """Serialize and write content to a file.
 
@@ -81,6 +161,8 @@ def serialize_write_file(
     :param file_mode: The file mode for the file
     :param file: The file to write to
     :param serialization_format: The serialization format
+    :param compact: Write ``JSON`` without indentation or whitespace between items
+    :param compression: The compression for the file, or None to write it uncompressed
     :raises ValueError: When serialization format is not recognized
     """
     dumpable = _prepare_content(
@@ -88,9 +170,9 @@ def serialize_write_file(
         content_view=content_view,
         serialization_format=serialization_format,
     )
-    with file.open(mode=file_mode, encoding="utf-8") as file_handle:
+    with open_text(file, file_mode, compression) as file_handle:
         if serialization_format == SerializationFormat.JSON:
-            _json_dump(dumpable=dumpable, file_handle=file_handle)
+            _json_dump(dumpable=dumpable, file_handle=file_handle, compact=compact)
             return
         if serialization_format == SerializationFormat.YAML:
             _yaml_dump(dumpable=dumpable, file_handle=file_handle)
@@ -192,19 +274,25 @@ def _prepare_content(
 class JsonParams(NamedTuple):
     """The parameters for json dump and dumps."""
 
-    indent: int = 4
+    indent: int | None = 4
     sort_keys: bool = True
     ensure_ascii: bool = False
+    separators: tuple[str, str] | None = None
+
+
+COMPACT_JSON_PARAMS = JsonParams(indent=None, separators=(",", ":"))
 
 
-def _json_dump(dumpable: ContentType, file_handle: IO) -> None:
+def _json_dump(dumpable: ContentType, file_handle: IO, compact: bool = False) -> None:
     """Serialize the dumpable to json and write to a file.
 
     :param dumpable: The object to dump
     :param file_handle: The file handle to write to
+    :param compact: Write without indentation or whitespace between items
     """
+    params = COMPACT_JSON_PARAMS if compact else JsonParams()
     try:
-        json.dump(dumpable, file_handle, **JsonParams()._asdict())
+        json.dump(dumpable, file_handle, **params._asdict())
         file_handle.write("\n")  # Add newline json does not
     except TypeError as exc:
         error_message = SERIALIZATION_FAILURE_MSG.format(
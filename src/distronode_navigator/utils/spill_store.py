@@ -0,0 +1,120 @@
+"""A store for JSON payloads, held in memory until a limit is reached then spilled to disk.
+
+Payloads are kept encoded, which is more compact than the objects they are created
+from. Once the encoded payloads held in memory exceed the memory limit, they are
+appended to an anonymous temporary file and read back from it when requested.
+The most recently requested payload is kept decoded, so requesting it again, as
+when the content shown is redrawn, returns the same object until it is replaced.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+
+from typing import IO
+from typing import Any
+
+
+DEFAULT_MEMORY_LIMIT = 32 * 1024 * 1024
+
+
+class SpillStore:
+    """A store for JSON payloads, spilled to disk when the memory limit is reached."""
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT) -> None:
+        """Initialize the spill store.
+
+        :param memory_limit: The number of encoded bytes to hold in memory before spilling
+        """
+        self.memory_limit = memory_limit
+        self._memory: dict[int, bytes] = {}
+        self._memory_size = 0
+        self._spilled: dict[int, tuple[int, int]] = {}
+        self._file: IO[bytes] | None = None
+        self._next_key = 0
+        self._recent: tuple[int, Any] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of payloads.
+
+        :returns: The number of payloads in the store
+        """
+        return len(self._memory) + len(self._spilled)
+
+    @property
+    def spilled(self) -> int:
+        """Return the number of payloads spilled to disk.
+
+        :returns: The number of spilled payloads
+        """
+        return len(self._spilled)
+
+    def add(self, payload: Any) -> int:
+        """Add a payload to the store.
+
+        :param payload: The payload, it must be serializable as JSON
+        :returns: The key for the payload
+        """
+        key = self._next_key
+        self._next_key += 1
+        self.replace(key, payload)
+        return key
+
+    def replace(self, key: int, payload: Any) -> None:
+        """Replace the payload for a key.
+
+        :param key: The key for the payload
+        :param payload: The payload, it must be serializable as JSON
+        """
+        encoded = json.dumps(payload, default=str).encode("utf-8")
+        if self._recent is not None and self._recent[0] == key:
+            self._recent = None
+        self._spilled.pop(key, None)
+        self._memory_size += len(encoded) - len(self._memory.get(key, b""))
+        self._memory[key] = encoded
+        if self._memory_size > self.memory_limit:
+            self._spill()
+
+    def get(self, key: int) -> Any:
+        """Get a payload from the store.
+
+        :param key: The key for the payload
+        :returns: The payload, the same object for the most recently requested key until
+            it is replaced, so it must not be modified
+        """
+        if self._recent is not None and self._recent[0] == key:
+            return self._recent[1]
+        try:
+            encoded = self._memory[key]
+        except KeyError:
+            offset, length = self._spilled[key]
+            assert self._file is not None
+            self._file.seek(offset)
+            encoded = self._file.read(length)
+        payload = json.loads(encoded)
+        self._recent = (key, payload)
+        return payload
+
+    def _spill(self) -> None:
+        """Move all payloads held in memory to disk."""
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()  # noqa: SIM115
+        offset = self._file.seek(0, 2)
+        for key, encoded in self._memory.items():
+            self._file.write(encoded)
+            self._spilled[key] = (offset, len(encoded))
+            offset += len(encoded)
+        self._file.flush()
+        self._memory = {}
+        self._memory_size = 0
+
+    def clear(self) -> None:
+        """Remove all payloads from the store."""
+        self._memory = {}
+        self._memory_size = 0
+        self._spilled = {}
+        self._recent = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,122 @@
+"""Keep results determined at startup, which only change when the environment does.
+
+Some of what is determined at startup takes a long time compared to the rest of
+startup, running a subprocess or reading the metadata of every installed package.
+These results are kept in a key-value store, keyed by a digest of the environment
+they depend on: the interpreter, the directories on the python path and the
+``PATH``, and anything else given, so a change to any of them is a cache miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .key_value_store import KeyValueStore
+
+
+STARTUP_CACHE_FILE = "startup_cache.db"
+# The cache is emptied when it holds more entries, environments come and go
+STARTUP_CACHE_ENTRIES = 64
+
+logger = logging.getLogger(__name__)
+
+
+def _modified(path: str | Path) -> str:
+    """Determine when a path was last modified.
+
+    :param path: The path
+    :returns: The modification time in nanoseconds, or an empty string if it does not exist
+    """
+    try:
+        return str(os.stat(path).st_mtime_ns)
+    except (OSError, ValueError):
+        return ""
+
+
+def environment_key(paths: Iterable[str | Path] = (), values: Iterable[str] = ()) -> str:
+    """Digest the environment a startup result depends on.
+
+    Installing, upgrading or removing a package modifies the directory it is
+    installed in, so the modification times of the directories on the python
+    path change along with the installed packages.
+
+    :param paths: Additional paths the result depends on, by modification time
+    :param values: Additional values the result depends on
+    :returns: The digest of the environment
+    """
+    parts = [sys.executable, sys.version, os.environ.get("PATH", "")]
+    parts.extend(f"{path}={_modified(path)}" for path in (*sys.path, *paths))
+    parts.extend(values)
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class StartupCache:
+    """Results determined at startup, keyed by name and environment."""
+
+    def __init__(self, cache_path: str | Path) -> None:
+        """Initialize the startup cache.
+
+        The key-value store is opened when first used, if it cannot be opened
+        nothing is cached.
+
+        :param cache_path: The directory holding the cache
+        """
+        self._path = Path(cache_path) / STARTUP_CACHE_FILE
+        self._store: KeyValueStore | None = None
+        self._available = True
+
+    def _open(self) -> KeyValueStore | None:
+        """Open the key-value store.
+
+        :returns: The key-value store, or None if it cannot be opened
+        """
+        if self._store is None and self._available:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._store = KeyValueStore(self._path)
+            except (OSError, sqlite3.Error) as exc:
+                logger.debug("Startup cache %s not available: %s", self._path, exc)
+                self._available = False
+        return self._store
+
+    def get(self, name: str, key: str) -> Any:
+        """Get a result.
+
+        :param name: The name of the result
+        :param key: The environment key of the result
+        :returns: The result, or None if not cached
+        """
+        store = self._open()
+        if store is None:
+            return None
+        try:
+            return json.loads(store[f"{name}:{key}"])
+        except (KeyError, ValueError, sqlite3.Error):
+            return None
+
+    def set(self, name: str, key: str, value: Any) -> None:
+        """Keep a result.
+
+        :param name: The name of the result
+        :param key: The environment key of the result
+        :param value: The result, which must be serializable as JSON
+        """
+        store = self._open()
+        if store is None:
+            return
+        try:
+            if len(store) >= STARTUP_CACHE_ENTRIES:
+                store.clear()
+            store[f"{name}:{key}"] = json.dumps(value)
+            store.commit()
+        except sqlite3.Error as exc:
+            logger.debug("Startup cache %s not updated: %s", self._path, exc)
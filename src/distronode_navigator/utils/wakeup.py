@@ -0,0 +1,73 @@
+"""Wake a thread waiting on file descriptors from another thread.
+
+A wakeup is a pipe, setting it writes to the pipe, so a thread waiting for the
+pipe to become readable, with ``select`` or a selector, returns. The pipe is only
+written to when the wakeup is not already set, so setting it for every one of many
+events writes once until it is cleared.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import select
+
+
+class Wakeup:
+    """Wake a thread waiting on file descriptors from another thread."""
+
+    def __init__(self) -> None:
+        """Initialize the wakeup."""
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        self._is_set = False
+
+    def fileno(self) -> int:
+        """Return the file descriptor that becomes readable when the wakeup is set.
+
+        :returns: The file descriptor
+        """
+        return self._read_fd
+
+    def is_set(self) -> bool:
+        """Return if the wakeup is set.
+
+        :returns: True if set
+        """
+        return self._is_set
+
+    def set(self) -> None:
+        """Set the wakeup, waking a waiting thread."""
+        if self._is_set:
+            return
+        self._is_set = True
+        # The pipe is full only if many wakeups were not cleared, the waiter will wake
+        with contextlib.suppress(BlockingIOError, OSError):
+            os.write(self._write_fd, b"\x00")
+
+    def clear(self) -> None:
+        """Clear the wakeup, before handling what it was set for."""
+        # Empty the pipe before clearing, so a wakeup set after it is not lost
+        with contextlib.suppress(BlockingIOError, OSError):
+            while os.read(self._read_fd, 512):
+                pass
+        self._is_set = False
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the wakeup to be set, then clear it.
+
+        :param timeout: The most seconds to wait, or None to wait indefinitely
+        :returns: True if the wakeup was set, False if the timeout passed
+        """
+        readable, _, _ = select.select([self._read_fd], [], [], timeout)
+        if readable:
+            self.clear()
+            return True
+        return False
+
+    def __del__(self) -> None:
+        """Close the pipe, once the wakeup can no longer be set from another thread."""
+        for fd in (self._read_fd, self._write_fd):
+            with contextlib.suppress(OSError):
+                os.close(fd)
@@ -22,6 +22,7 @@ from distronode_navigator.ui_framework.ui import Action as Ui_action
 from distronode_navigator.ui_framework.ui import Form
 from distronode_navigator.ui_framework.ui import Interaction
 from distronode_navigator.ui_framework.ui import Ui
+from distronode_navigator.utils.wakeup import Wakeup
 
 
 class ActionRunTest:
@@ -94,6 +95,12 @@ class ActionRunTest:
         :param value: The value to return
         """
 
+    def callable_pass_wakeup(self, wakeup: Wakeup) -> None:
+        """Do nothing callable.
+
+        :param wakeup: The wakeup to ignore
+        """
+
     def callable_pass(self, **kwargs) -> None:
         """Do nothing callable.
 
@@ -183,6 +190,8 @@ class ActionRunTest:
             show_form=self.show_form,
             update_status=self.callable_pass,
             content_format=self.content_format,
+            add_wakeup=self.callable_pass_wakeup,
+            remove_wakeup=self.callable_pass_wakeup,
         )
         match = re.match(self._app_action.Action.KEGEX, self._action_name)
         if not match:
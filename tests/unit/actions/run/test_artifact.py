@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
 
 from copy import deepcopy
 from dataclasses import dataclass
+from pathlib import Path
 from re import Pattern
 
 import pytest
@@ -18,8 +20,14 @@ from distronode_navigator.actions.run import Action as action
 from distronode_navigator.configuration_subsystem import NavigatorConfiguration
 from distronode_navigator.configuration_subsystem.definitions import Constants
 from distronode_navigator.initialization import parse_and_update
+from distronode_navigator.utils.compression import compression_from_content
+from distronode_navigator.utils.compression import open_text
+from distronode_navigator.utils.playbook_artifact import is_line_delimited
+from distronode_navigator.utils.playbook_artifact import read_records
 from tests.defaults import BaseScenario
 from tests.defaults import id_func
+from tests.unit.actions.run.test_handle_message import play_start
+from tests.unit.actions.run.test_handle_message import runner_event
 
 
 def make_dirs(*_args, **_kwargs):
@@ -240,3 +248,156 @@ def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixtur
 
     settings_sources = mocked_write.call_args[1]["content"]["settings_sources"]
     assert settings_sources["distronode-navigator.app"] == Constants.USER_CLI.value
+
+
+@pytest.mark.parametrize(("suffix", "compression"), ((".jsonl", None), (".jsonl.gz", "gzip")))
+def test_line_delimited_artifact(
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    suffix: str,
+    compression: str | None,
+):
+    """Test the artifact is written while the playbook runs and can be replayed.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param mocker: The mocker fixture
+    :param tmp_path: A temporary directory
+    :param suffix: The suffix of the artifact file
+    :param compression: The expected compression of the artifact file
+    """
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("mode").value.current = "stdout"
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("time_zone").value.current = "UTC"
+    args.entry("playbook_artifact_enable").value.current = True
+    save_as = tmp_path / f"{{playbook_status}}{suffix}"
+    args.entry("playbook_artifact_save_as").value.current = str(save_as)
+
+    run_action = action(args=args)
+    # pylint: disable=protected-access
+    run_action._start_artifact()
+    assert run_action._artifact_writer is not None
+    partial = Path(run_action._artifact_writer.path)
+    assert partial.parent == tmp_path
+
+    messages = [
+        {"event": "verbose", "event_data": {}, "stdout": "first\nsecond"},
+        play_start("p1"),
+        runner_event("start", "p1", "t1", "h1"),
+        runner_event("ok", "p1", "t1", "h1"),
+    ]
+    for message in messages:
+        run_action._handle_message(message)
+    run_action.write_artifact()
+
+    artifact = tmp_path / f"successful{suffix}"
+    assert not partial.exists()
+    assert compression_from_content(artifact) == compression
+    assert is_line_delimited(str(artifact))
+    records = list(read_records(str(artifact)))
+    assert records[0]["settings_entries"]
+    assert records[-1] == {"status": "successful", "status_color": 0}
+
+    with open_text(artifact, "a", compression) as fh:
+        fh.write('{"stdout": ["trunc')
+    assert list(read_records(str(artifact))) == records
+
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("mode").value.current = "interactive"
+    replay_action = action(args=args)
+    replay_action._interaction = mocker.MagicMock()
+    assert replay_action._replay_line_delimited(str(artifact))
+    replay_action._interaction.ui.update_status.assert_called_once_with("successful", 0)
+    assert list(replay_action.stdout) == ["first", "second"]
+    play = replay_action._plays.value[0]
+    assert (play["__ok"], play["__changed"], play["__progress"]) == (1, 1, "100%")
+    task = play["tasks"][0]
+    assert task["__result"] == "Ok"
+    assert replay_action._plays_with_payloads()[0]["tasks"][0]["res"] == {"changed": True}
+
+
+@pytest.mark.parametrize("compression", ("gzip", "lzma"))
+def test_read_corrupt_records(
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
+    compression: str,
+):
+    """Test reading a corrupt compressed artifact stops at the corruption.
+
+    :param caplog: The log capture fixture
+    :param tmp_path: A temporary directory
+    :param compression: The compression of the artifact file
+    """
+    artifact = tmp_path / "artifact.jsonl"
+    records = [{"version": "3.0.0"}, {"stdout": ["line"] * 1000}]
+    with open_text(artifact, "w", compression) as fh:
+        for record in records:
+            fh.write(json.dumps(record) + "\n")
+    content = bytearray(artifact.read_bytes())
+    # Corrupt the end of the compressed data, including the gzip checksum
+    content[-8:] = bytes(byte ^ 0xFF for byte in content[-8:])
+    artifact.write_bytes(content)
+
+    read = list(read_records(str(artifact)))
+    assert read == records[: len(read)]
+    assert "incomplete, stopping" in caplog.text
+
+
+@pytest.mark.parametrize("suffix", (".json", ".json.gz"))
+def test_single_document_artifact(tmp_path: Path, suffix: str):
+    """Test the artifact is not written while the playbook runs without the line-delimited suffix.
+
+    :param tmp_path: A temporary directory
+    :param suffix: The suffix of the artifact file
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("playbook_artifact_enable").value.current = True
+    args.entry("playbook_artifact_save_as").value.current = str(tmp_path / f"artifact{suffix}")
+
+    run_action = action(args=args)
+    # pylint: disable=protected-access
+    run_action._start_artifact()
+    assert run_action._artifact_writer is None
+
+
+@pytest.mark.parametrize("suffix", (".json", ".json.xz"))
+def test_replay_compressed(
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    suffix: str,
+):
+    """Test a complete artifact is replayed regardless of compression.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param mocker: The mocker fixture
+    :param tmp_path: A temporary directory
+    :param suffix: The suffix of the artifact file
+    """
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("mode").value.current = "stdout"
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("time_zone").value.current = "UTC"
+    run_action = action(args=args)
+    # pylint: disable=protected-access
+    run_action._handle_message(play_start("p1"))
+    run_action._handle_message(runner_event("start", "p1", "t1", "h1"))
+    run_action._handle_message(runner_event("ok", "p1", "t1", "h1"))
+    artifact = tmp_path / f"artifact{suffix}"
+    run_action.write_artifact(filename=str(artifact))
+    assert artifact.exists()
+
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("mode").value.current = "interactive"
+    args.entry("playbook_artifact_replay").value.current = str(artifact)
+    replay_action = action(args=args)
+    replay_action._interaction = mocker.MagicMock()
+    replay_action._interaction.action.match.groupdict.return_value = {"params_replay": ""}
+    mocker.patch.object(replay_action, "_update_args", return_value=True)
+    assert replay_action._init_replay()
+    task = replay_action._plays.value[0]["tasks"][0]
+    assert task["__result"] == "Ok"
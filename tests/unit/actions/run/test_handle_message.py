@@ -0,0 +1,165 @@
+"""Unit tests for runner message handling in the run action."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+
+from distronode_navigator.actions.run import Action as action
+from distronode_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+def play_start(play_uuid: str) -> dict:
+    """Build a play start message.
+
+    :param play_uuid: The uuid of the play
+    :returns: The message
+    """
+    return {
+        "event": "playbook_on_play_start",
+        "event_data": {"name": f"play_{play_uuid}", "uuid": play_uuid, "playbook": "site.yml"},
+    }
+
+
+def runner_event(event: str, play_uuid: str, task_uuid: str, host: str) -> dict:
+    """Build a runner on_* message.
+
+    :param event: The runner event
+    :param play_uuid: The uuid of the parent play
+    :param task_uuid: The uuid of the task
+    :param host: The host the task ran on
+    :returns: The message
+    """
+    return {
+        "event": f"runner_on_{event}",
+        "event_data": {
+            "duration": 1.5,
+            "host": host,
+            "ignore_errors": False,
+            "play_uuid": play_uuid,
+            "res": {"changed": event == "ok"},
+            "task": f"task_{task_uuid}",
+            "task_action": "debug",
+            "task_uuid": task_uuid,
+        },
+    }
+
+
+@pytest.fixture(name="run_action")
+def fixture_run_action() -> action:
+    """Provide a run action in stdout mode.
+
+    :returns: The run action
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("mode").value.current = "stdout"
+    args.entry("playbook_artifact_enable").value.current = False
+    return action(args=args)
+
+
+def test_tasks_updated_by_index(run_action: action):
+    """Ensure finished events update the task started for the same task and host.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    for play_uuid in ("p1", "p2"):
+        run_action._handle_message(play_start(play_uuid))
+        for task_uuid in ("t1", "t2"):
+            for host in ("h1", "h2"):
+                run_action._handle_message(runner_event("start", play_uuid, task_uuid, host))
+
+    run_action._handle_message(runner_event("ok", "p2", "t2", "h1"))
+    run_action._handle_message(runner_event("failed", "p1", "t1", "h2"))
+
+    plays = run_action._plays.value
+    results = [[t["__result"] for t in play["tasks"]] for play in plays]
+    assert results == [
+        ["In progress", "Failed", "In progress", "In progress"],
+        ["In progress", "In progress", "Ok", "In progress"],
+    ]
+    assert plays[1]["tasks"][2]["__changed"] is True
+    assert plays[1]["tasks"][2]["__number"] == 2
+
+
+def test_orphan_events_discarded(run_action: action):
+    """Ensure events without a parent play or task are discarded.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(runner_event("start", "missing", "t1", "h1"))
+    run_action._handle_message(play_start("p1"))
+    run_action._handle_message(runner_event("ok", "p1", "t1", "h1"))
+    assert run_action._plays.value[0]["tasks"] == []
+
+
+def test_index_rebuilt(run_action: action):
+    """Ensure the index can be rebuilt from existing plays, as with replay.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(play_start("p1"))
+    run_action._handle_message(runner_event("start", "p1", "t1", "h1"))
+    plays = deepcopy(run_action._plays.value)
+
+    run_action._plays.value = plays
+    run_action._index_plays()
+    run_action._handle_message(runner_event("ok", "p1", "t1", "h1"))
+    assert plays[0]["tasks"][0]["__result"] == "Ok"
+
+
+def test_play_stats_counted(run_action: action):
+    """Ensure play stats are maintained as tasks start and finish.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(play_start("p1"))
+    for task_uuid in ("t1", "t2"):
+        for host in ("h1", "h2"):
+            run_action._handle_message(runner_event("start", "p1", task_uuid, host))
+    play = run_action._plays.value[0]
+    assert (play["__in progress"], play["__task_count"], play["__progress"]) == (4, 4, "0%")
+
+    run_action._handle_message(runner_event("ok", "p1", "t1", "h1"))
+    run_action._handle_message(runner_event("failed", "p1", "t1", "h2"))
+    run_action._handle_message(runner_event("skipped", "p1", "t2", "h1"))
+    stats = {key: play[key] for key in ("__ok", "__failed", "__skipped", "__in progress")}
+    assert stats == {"__ok": 1, "__failed": 1, "__skipped": 1, "__in progress": 1}
+    assert play["__changed"] == 1
+    assert play["__progress"] == "75%"
+
+    expected = {key: value for key, value in play.items() if key.startswith("__")}
+    run_action._index_plays()
+    assert {key: value for key, value in play.items() if key.startswith("__")} == expected
+
+
+def test_task_payload_out_of_line(run_action: action):
+    """Ensure task rows hold the menu columns and the full event data is loaded on request.
+
+    :param run_action: The run action
+    """
+    # pylint: disable=protected-access
+    run_action._handle_message(play_start("p1"))
+    run_action._handle_message(runner_event("start", "p1", "t1", "h1"))
+    run_action._handle_message(runner_event("ok", "p1", "t1", "h1"))
+
+    row = run_action._plays.value[0]["tasks"][0]
+    assert "res" not in row
+    assert [row[column] for column in ("__result", "__host", "__changed")] == ["Ok", "h1", True]
+
+    run_action._plays.index = 0
+    run_action.steps.append(run_action._plays)
+    task_list = run_action._task_list_for_play()
+    task_list.index = 0
+    run_action.steps.append(task_list)
+    payloads = run_action._task_from_task_list().value
+    assert len(payloads) == 1
+    assert payloads[0]["res"] == {"changed": True}
+    assert payloads[0]["__result"] == "Ok"
+
+    plays = run_action._plays_with_payloads()
+    assert plays[0]["tasks"] == [payloads[0]]
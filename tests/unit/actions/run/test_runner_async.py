@@ -5,7 +5,6 @@ from __future__ import annotations
 from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
-from queue import Queue
 
 import pytest
 
@@ -13,6 +12,7 @@ from pytest_mock import MockerFixture
 
 from distronode_navigator.actions.run import Action as action
 from distronode_navigator.configuration_subsystem import NavigatorConfiguration
+from distronode_navigator.runner import EventChannel
 from tests.defaults import BaseScenario
 from tests.defaults import id_func
 
@@ -50,7 +50,7 @@ class Scenario(BaseScenario):
         return self.name
 
 
-TEST_QUEUE: Queue = Queue()
+TEST_QUEUE = EventChannel()
 
 test_data = [
     Scenario(
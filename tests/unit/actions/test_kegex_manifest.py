@@ -0,0 +1,107 @@
+"""Tests for matching actions without importing them."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from distronode_navigator.actions import _actions
+from distronode_navigator.actions import kegexes
+from distronode_navigator.actions import names
+
+
+PACKAGE = "distronode_navigator.actions"
+
+SOURCE = """
+from . import _actions as actions
+
+
+@actions.register
+class Action:
+    KEGEX = (
+        r"^s(?:ample)?"
+        r"(\\s(?P<params>.*))?$"
+    )
+"""
+
+
+def _import_times(code: str, cache_home: Path) -> dict[str, int]:
+    """Run python code, reporting the time each module took to import.
+
+    :param code: The python code to run
+    :param cache_home: The directory to use for caches
+    :returns: The cumulative import time of each module in microseconds, by module
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "XDG_CACHE_HOME": str(cache_home)}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _self, cumulative, module = line.split(":", 1)[1].split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_manifest_matches_registry(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Read the same kegex from the source of each action as it registers.
+
+    :param monkeypatch: The pytest monkeypatch fixture
+    :param tmp_path: The path to a test temporary directory
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(_actions, "_MANIFESTS", {})
+    kegexes_ = list(kegexes())
+    assert list(tmp_path.glob("*/startup_cache.db"))
+    for kegex in kegexes_:
+        importlib.import_module(f"{PACKAGE}.{kegex.name}")
+    registered = _actions._ACTIONS[PACKAGE]  # noqa: SLF001
+    assert names() == sorted(registered)
+    assert {kegex.name: kegex.kegex.pattern for kegex in kegexes_} == {
+        name: action.kegex.pattern for name, action in registered.items()
+    }
+
+
+def test_static_kegex() -> None:
+    """Read a kegex from the source, unless it is not a literal of a registered class."""
+    assert _actions._static_kegex(SOURCE) == r"^s(?:ample)?(\s(?P<params>.*))?$"  # noqa: SLF001
+    not_literal = SOURCE.replace("KEGEX = (", "KEGEX = PREFIX + (")
+    assert _actions._static_kegex(not_literal) is None  # noqa: SLF001
+    not_registered = SOURCE.replace("@actions.register\n", "")
+    assert _actions._static_kegex(not_registered) is None  # noqa: SLF001
+    assert _actions._static_kegex("class (:") is None  # noqa: SLF001
+
+
+def test_import_time(tmp_path: Path) -> None:
+    """Match actions without importing them, importing fewer modules than every action.
+
+    Only imports by the import statement or ``__import__`` are reported by ``-X importtime``.
+    The modules imported are compared rather than the time taken, which varies with load.
+
+    :param tmp_path: The path to a test temporary directory
+    """
+    code = (
+        f"from {PACKAGE} import kegexes;"
+        " kegex = next(kegex for kegex in kegexes() if kegex.kegex.match('images'));"
+        f" __import__('{PACKAGE}.' + kegex.name)"
+    )
+    every_action = f"from {PACKAGE} import names; [__import__('{PACKAGE}.' + n) for n in names()]"
+    # Matched without, then with, the manifest in the startup cache
+    runs = [set(_import_times(code, tmp_path)) for _run in ("cold", "warm")]
+    all_modules = set(_import_times(every_action, tmp_path))
+    for modules in runs:
+        actions = sorted(module for module in modules if module.startswith(f"{PACKAGE}."))
+        assert actions == [f"{PACKAGE}._actions", f"{PACKAGE}.images"]
+        assert modules < all_modules
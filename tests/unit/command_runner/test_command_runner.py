@@ -0,0 +1,91 @@
+"""Unit tests for the command runner."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from distronode_navigator.command_runner import Command
+from distronode_navigator.command_runner import CommandRunner
+from distronode_navigator.command_runner.command_runner import TIMEOUT_RETURN_CODE
+
+
+def parse(command: Command) -> None:
+    """Split the output of a command into lines.
+
+    :param command: The command that was run
+    """
+    command.details = command.stdout_lines
+
+
+def _commands(count: int, sleep: float = 0) -> list[Command]:
+    """Build commands that echo their number.
+
+    :param count: The number of commands
+    :param sleep: The seconds each command sleeps first
+    :returns: The commands
+    """
+    return [
+        Command(identity=str(idx), command=f"sleep {sleep}; echo {idx}", post_process=parse)
+        for idx in range(count)
+    ]
+
+
+@pytest.mark.parametrize("method", ("run_multi_thread", "run_multi_process"))
+def test_run_in_order(method: str) -> None:
+    """Run and post process all commands, returning them in the order given.
+
+    :param method: The command runner method
+    """
+    runner = CommandRunner(workers=3)
+    results = getattr(runner, method)(_commands(8))
+    assert [command.details for command in results] == [[str(idx)] for idx in range(8)]
+    assert all(command.duration > 0 for command in results)
+    assert runner.wall_time > 0
+
+
+def test_run_concurrently(tmp_path: Path) -> None:
+    """Run commands at the same time, no more than the workers configured.
+
+    Each command marks itself running while it sleeps and records how many are running.
+
+    :param tmp_path: A temporary directory
+    """
+    running = tmp_path / "running"
+    counts = tmp_path / "counts"
+    running.mkdir()
+    counts.mkdir()
+    commands = [
+        Command(
+            identity=str(idx),
+            command=(
+                f"touch {running}/{idx}; ls {running} | wc -l > {counts}/{idx};"
+                f" sleep 0.2; rm {running}/{idx}"
+            ),
+            post_process=parse,
+        )
+        for idx in range(8)
+    ]
+    runner = CommandRunner(workers=4)
+    results = runner.run_multi_thread(commands)
+    assert len(results) == 8
+    assert all(command.return_code == 0 for command in results)
+    assert max(int(count.read_text()) for count in counts.iterdir()) <= 4
+    # Commands ran at the same time, so together they ran longer than the runner
+    assert sum(command.duration for command in results) > runner.wall_time
+
+
+def test_timeout() -> None:
+    """Stop a command running longer than its timeout."""
+    command = Command(identity="slow", command="sleep 5", post_process=parse, timeout=0.2)
+    (result,) = CommandRunner().run_multi_thread([command])
+    assert result.return_code == TIMEOUT_RETURN_CODE
+    assert result.errors.startswith("Command timed out after 0.2 seconds")
+    assert result.duration < 5
+
+
+def test_no_commands() -> None:
+    """Run no commands without starting a pool."""
+    assert not CommandRunner().run_multi_thread([])
+    assert not CommandRunner().run_multi_process([])
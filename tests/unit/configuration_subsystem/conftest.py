@@ -21,6 +21,7 @@ from distronode_navigator.utils.functions import ExitMessage
 from distronode_navigator.utils.functions import LogMessage
 from distronode_navigator.utils.serialize import Loader
 from distronode_navigator.utils.serialize import yaml
+from distronode_navigator.utils.startup_cache import StartupCache
 from tests.defaults import FIXTURES_DIR
 
 
@@ -104,10 +105,13 @@ def fixture_generate_config():
 
 
 @pytest.fixture
-def distronode_version(monkeypatch):
+def distronode_version(monkeypatch, tmp_path):
     """Path the distronode --version call to avoid the subprocess calls.
 
+    The static output is cached in a temporary directory, rather than the user's cache.
+
     :param monkeypatch: Fixture for patching
+    :param tmp_path: The path to a test temporary directory
     """
     original_run_command = run_command
 
@@ -122,6 +126,10 @@ def distronode_version(monkeypatch):
         "distronode_navigator.command_runner.command_runner.run_command",
         static_distronode_version,
     )
+    monkeypatch.setattr(
+        "distronode_navigator.configuration_subsystem.utils.StartupCache",
+        lambda cache_path: StartupCache(tmp_path),
+    )
 
 
 @pytest.fixture(name="schema_dict")
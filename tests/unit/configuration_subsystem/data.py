@@ -235,6 +235,7 @@ ENV_VAR_DATA = [
         "/tmp:/test1:Z;/tmp:/test2:z",
         ["/tmp:/test1:Z", "/tmp:/test2:z"],
     ),
+    ("execution_environment_warm", "false", False),
     ("format", "json", "json"),
     ("help_builder", "false", False),
     ("help_config", "false", False),
@@ -242,6 +243,7 @@ ENV_VAR_DATA = [
     ("help_inventory", "false", False),
     ("help_playbook", "false", False),
     ("images_details", "distronode_version,python_version", ["distronode_version", "python_version"]),
+    ("images_prewarm", "false", False),
     ("inventory", "/tmp/test1.yaml,/tmp/test2.yml", ["/tmp/test1.yaml", "/tmp/test2.yml"]),
     ("inventory_column", "t1,t2,t3", ["t1", "t2", "t3"]),
     ("lint_config", "/tmp/ansible-lint-config.yml", "/tmp/ansible-lint-config.yml"),
@@ -265,6 +267,7 @@ ENV_VAR_DATA = [
     ("settings_sample", "false", False),
     ("settings_schema", "json", "json"),
     ("settings_sources", "false", False),
+    ("stdout_memory_lines", "5000", 5000),
     ("time_zone", "Japan", "Japan"),
     ("workdir", "/tmp/", "/tmp/"),
 ]
@@ -12,6 +12,7 @@ from distronode_navigator.configuration_subsystem import NavigatorConfiguration
 from distronode_navigator.configuration_subsystem.navigator_post_processor import (
     NavigatorPostProcessor,
 )
+from distronode_navigator.utils.compression import HAS_ZSTANDARD
 from tests.defaults import BaseScenario
 from tests.defaults import id_func
 
@@ -65,6 +66,20 @@ test_data = (
             " has unrecognized variables: 'name'"
         ),
     ),
+    Scenario(
+        name="4",
+        current="/tmp/artifact.json.gz",
+    ),
+    Scenario(
+        name="5",
+        current="/tmp/artifact.json.zst",
+        exit_message_substr=(
+            ""
+            if HAS_ZSTANDARD
+            else "The playbook artifact file name '/tmp/artifact.json.zst', set by command line,"
+            " requires the 'zstandard' package for compression"
+        ),
+    ),
 )
 
 
@@ -91,3 +106,5 @@ def test_pas(data: Scenario):
 
     if data.exit_message_substr:
         assert data.exit_message_substr in exit_messages[0].message
+    else:
+        assert not exit_messages
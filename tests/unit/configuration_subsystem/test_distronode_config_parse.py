@@ -219,3 +219,40 @@ def test_invalid_path(ee_enabled, tmp_path: Path, monkeypatch: pytest.MonkeyPatc
         )
     else:
         assert "does not exist" in parsed_cfg.messages[2].message
+
+
+def test_distronode_version_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Confirm the distronode --version output is cached until the environment changes.
+
+    :param tmp_path: The path to a test temporary directory
+    :param monkeypatch: The monkeypatch fixture
+    """
+    run = []
+
+    def static_distronode_version(command: Command):
+        run.append(command.command)
+        command.return_code = 0
+        command.stdout = "distronode [core 2.12.3]\nconfig file = None"
+
+    monkeypatch.setattr(
+        "distronode_navigator.command_runner.command_runner.run_command",
+        static_distronode_version,
+    )
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    monkeypatch.chdir(work_dir)
+    cache_path = tmp_path / "cache"
+
+    for _ in range(2):
+        parsed_cfg = parse_distronode_cfg(ee_enabled=False, cache_path=cache_path)
+        assert parsed_cfg.config.path is Constants.NONE
+        assert not parsed_cfg.exit_messages
+    assert len(run) == 1
+    assert "(cached)" in parsed_cfg.messages[1].message
+
+    (work_dir / "distronode.cfg").write_text(DISTRONODE_CFG_VALID)
+    parse_distronode_cfg(ee_enabled=False, cache_path=cache_path)
+    assert len(run) == 2
+
+    parse_distronode_cfg(ee_enabled=False)
+    assert len(run) == 3
@@ -0,0 +1,111 @@
+"""Unit tests for image inspection."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from distronode_navigator.command_runner import Command
+from distronode_navigator.command_runner import command_runner
+from distronode_navigator.image_manager import inspect_all
+from distronode_navigator.image_manager import inspector
+from distronode_navigator.image_manager.inspector import ImagesInspect
+from distronode_navigator.image_manager.inspector import ImagesList
+
+
+IMAGES = [
+    {
+        "repository": "quay.io/distronode/creator-ee",
+        "tag": "v0.9.2",
+        "image_id": "9ec3e1e2b6d4",
+        "created": "2 weeks ago",
+        "size": "1.2 GB",
+    },
+    {
+        "repository": "quay.io/distronode/creator-ee",
+        "tag": "<none>",
+        "image_id": "aaaaaaaaaaaa",
+        "created": "3 weeks ago",
+        "size": "1.1 GB",
+    },
+    {
+        "repository": "docker.io/library/alpine",
+        "tag": "latest",
+        "image_id": "c1aabb73d233",
+        "created": "3 months ago",
+        "size": "7.6MB",
+    },
+]
+
+
+def test_images_list_parse() -> None:
+    """Parse the image list, skipping untagged images."""
+    command = Command(
+        identity="images",
+        command="",
+        post_process=ImagesList.parse,
+        stdout="\n".join(json.dumps(image) for image in IMAGES) + "\n",
+    )
+    ImagesList.parse(command)
+    assert command.details == [IMAGES[0], IMAGES[2]]
+    assert not command.errors
+
+
+def test_images_list_unparsable() -> None:
+    """Report an image list that could not be parsed."""
+    command = Command(
+        identity="images",
+        command="",
+        post_process=ImagesList.parse,
+        stdout="REPOSITORY  TAG  IMAGE ID\n",
+    )
+    ImagesList.parse(command)
+    assert command.details == []
+    assert command.errors.startswith("Unable to parse the image list")
+
+
+def test_inspect_commands_chunked(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Inspect many images with each command, keeping commands short.
+
+    :param monkeypatch: The pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(inspector, "INSPECT_COMMAND_LENGTH", 40)
+    ids = [f"{idx:012x}" for idx in range(10)]
+    commands = ImagesInspect(container_engine="podman", ids=ids).commands
+    assert len(commands) == 4
+    assert [image_id for command in commands for image_id in command.identity.split()] == ids
+    assert all(len(command.identity) < 40 for command in commands)
+    assert commands[0].command == f"podman inspect {' '.join(ids[:3])}"
+
+
+def test_inspect_all(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Inspect all images with one command, matching the full and short image ids.
+
+    :param monkeypatch: The pytest monkeypatch fixture
+    """
+    run = []
+
+    def run_command(command: Command) -> None:
+        run.append(command.command)
+        if command.identity == "images":
+            command.stdout = "\n".join(json.dumps(image) for image in IMAGES)
+        else:
+            # The alpine image was removed since it was listed
+            command.stdout = json.dumps(
+                [{"Id": "sha256:9ec3e1e2b6d4" + "0" * 52, "Config": {"WorkingDir": "/runner"}}],
+            )
+            command.stderr = "Error: no such object: c1aabb73d233"
+            command.return_code = 1
+
+    monkeypatch.setattr(command_runner, "run_command", run_command)
+    images, error = inspect_all(container_engine="docker")
+    assert not error
+    assert len(run) == 2
+    assert run[1] == "docker inspect 9ec3e1e2b6d4 c1aabb73d233"
+
+    creator, alpine = images
+    assert creator["inspect"]["details"]["config"] == {"working_dir": "/runner"}
+    assert creator["inspect"]["errors"] == ""
+    assert alpine["inspect"]["details"] == {}
+    assert alpine["inspect"]["errors"] == "Error: no such object: c1aabb73d233"
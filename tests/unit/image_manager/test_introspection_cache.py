@@ -0,0 +1,136 @@
+"""Unit tests for the image introspection cache."""
+
+from __future__ import annotations
+
+import threading
+
+from concurrent.futures import wait
+from pathlib import Path
+
+import pytest
+
+from distronode_navigator.image_manager import IntrospectionCache
+from distronode_navigator.image_manager import image_digest
+from distronode_navigator.image_manager.introspection_cache import INTROSPECTION_SCRIPT
+
+
+INTROSPECTION = {"distronode_version": {"details": "2.0.0"}, "errors": []}
+
+
+@pytest.fixture(name="cache_path")
+def fixture_cache_path(tmp_path: Path) -> Path:
+    """Provide a cache path holding an introspection script.
+
+    :param tmp_path: The pytest tmp_path fixture
+    :returns: The cache path
+    """
+    (tmp_path / INTROSPECTION_SCRIPT).write_text("print('introspect')\n")
+    return tmp_path
+
+
+def test_image_digest() -> None:
+    """Prefer the inspected image id over the listed one."""
+    image = {"image_id": "abc", "inspect": {"details": {"id": "sha256:abcdef"}}}
+    assert image_digest(image) == "sha256:abcdef"
+    assert image_digest({"image_id": "abc", "inspect": {"details": []}}) == "abc"
+    assert image_digest({"image_id": "abc"}) == "abc"
+
+
+def test_get_set(cache_path: Path) -> None:
+    """Keep an introspection across instances.
+
+    :param cache_path: The cache path
+    """
+    cache = IntrospectionCache(cache_path)
+    assert cache.get("sha256:1") is None
+    cache.set("sha256:1", INTROSPECTION)
+    assert cache.get("sha256:1") == INTROSPECTION
+
+    reopened = IntrospectionCache(cache_path)
+    assert reopened.get("sha256:1") == INTROSPECTION
+    assert reopened.get("") is None
+    assert (reopened.hits, reopened.misses) == (1, 0)
+
+
+def test_errors_not_kept(cache_path: Path) -> None:
+    """Do not keep an introspection with errors, they may be transient.
+
+    :param cache_path: The cache path
+    """
+    cache = IntrospectionCache(cache_path)
+    errors = [{"path": "python_packages", "error": "pip failed"}]
+    cache.set("sha256:1", {**INTROSPECTION, "errors": errors})
+    assert cache.get("sha256:1") is None
+    assert cache.missing(["sha256:1"]) == ["sha256:1"]
+
+
+def test_script_change(cache_path: Path) -> None:
+    """Forget the introspection when the introspection script changes.
+
+    :param cache_path: The cache path
+    """
+    IntrospectionCache(cache_path).set("sha256:1", INTROSPECTION)
+    (cache_path / INTROSPECTION_SCRIPT).write_text("print('introspect more')\n")
+    assert IntrospectionCache(cache_path).get("sha256:1") is None
+
+
+def test_prewarm(cache_path: Path) -> None:
+    """Introspect only the images not yet cached, surviving a failure.
+
+    :param cache_path: The cache path
+    """
+    cache = IntrospectionCache(cache_path)
+    cache.set("sha256:1", INTROSPECTION)
+    images = {"sha256:1": "one:1", "sha256:2": "two:2", "sha256:3": "three:3", "sha256:4": "four:4"}
+    introspected = []
+    lock = threading.Lock()
+
+    def introspect(image_name: str) -> dict | None:
+        with lock:
+            introspected.append(image_name)
+        if image_name == "three:3":
+            msg = "container engine failed"
+            raise RuntimeError(msg)
+        if image_name == "four:4":
+            return None
+        return {**INTROSPECTION, "image": image_name}
+
+    futures = cache.prewarm(images=images, introspect=introspect, workers=2)
+    assert len(futures) == 3
+    wait(futures, timeout=10)
+
+    assert sorted(introspected) == ["four:4", "three:3", "two:2"]
+    assert cache.get("sha256:2") == {**INTROSPECTION, "image": "two:2"}
+    assert cache.missing(images) == ["sha256:3", "sha256:4"]
+
+    images = {"sha256:1": "one:1", "sha256:2": "two:2"}
+    assert cache.prewarm(images=images, introspect=introspect) == []
+    cache.close()
+
+
+def test_prewarm_once(cache_path: Path) -> None:
+    """Introspect an image in the background once, and wait for it when closed.
+
+    :param cache_path: The cache path
+    """
+    cache = IntrospectionCache(cache_path)
+    started = threading.Event()
+    release = threading.Event()
+    introspected = []
+
+    def introspect(image_name: str) -> dict:
+        introspected.append(image_name)
+        started.set()
+        release.wait(timeout=10)
+        return INTROSPECTION
+
+    images = {"sha256:1": "one:1"}
+    assert len(cache.prewarm(images=images, introspect=introspect)) == 1
+    assert started.wait(timeout=10)
+    assert cache.prewarm(images=images, introspect=introspect) == []
+
+    threading.Timer(0.1, release.set).start()
+    cache.close()
+    assert introspected == ["one:1"]
+    assert IntrospectionCache(cache_path).get("sha256:1") == INTROSPECTION
+    assert cache.prewarm(images={"sha256:2": "two:2"}, introspect=introspect) == []
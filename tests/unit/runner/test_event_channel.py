@@ -0,0 +1,96 @@
+"""Tests for the runner event channel."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from distronode_navigator.runner import EventChannel
+from distronode_navigator.utils.wakeup import Wakeup
+
+
+def test_drain_in_order():
+    """Ensure events are drained in bulk, in the order they were posted."""
+    channel = EventChannel()
+    events = [{"event": "verbose", "stdout": str(idx)} for idx in range(5)]
+    for event in events:
+        channel.put(event)
+    assert channel.stats.depth == 5
+    drained = channel.drain()
+    assert drained == events
+    assert drained[0] is events[0]
+    assert channel.empty()
+    assert channel.stats.drained == 5
+    assert channel.stats.max_depth == 5
+
+
+def test_coalesce_when_full():
+    """Ensure coalescible events are only merged into a coalescible pending event when full."""
+    channel = EventChannel(high_water_mark=2, coalescible=lambda e: e["event"] == "other")
+    channel.put({"event": "first", "stdout": "one"})
+    channel.put({"event": "second", "stdout": "two"})
+    channel.put({"event": "other", "stdout": "three"})
+    channel.put({"event": "other", "stdout": ""})
+    channel.put({"event": "other", "stdout": "four"})
+    drained = channel.drain()
+    assert [event["event"] for event in drained] == ["first", "second", "other"]
+    assert drained[1]["stdout"] == "two"
+    assert drained[-1]["stdout"] == "three\nfour"
+    assert channel.stats.coalesced == 2
+    assert channel.stats.max_depth == 3
+
+
+def test_block_when_full():
+    """Ensure the producer waits for the consumer when the channel is full."""
+    channel = EventChannel(high_water_mark=1)
+    channel.put({"event": "first"})
+    producer = threading.Thread(target=channel.put, args=({"event": "second"},))
+    producer.start()
+    producer.join(timeout=0.1)
+    assert producer.is_alive()
+    assert [event["event"] for event in channel.drain()] == ["first"]
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    assert [event["event"] for event in channel.drain()] == ["second"]
+
+
+def test_close_releases_producer():
+    """Ensure closing the channel releases a blocked producer and drops events."""
+    channel = EventChannel(high_water_mark=1)
+    channel.put({"event": "first"})
+    producer = threading.Thread(target=channel.put, args=({"event": "second"},))
+    producer.start()
+    channel.close()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    channel.put({"event": "third"})
+    assert channel.stats.dropped == 2
+    assert len(channel.drain()) == 1
+
+    channel.clear()
+    assert not channel.closed
+    channel.put({"event": "fourth"})
+    assert len(channel.drain()) == 1
+
+
+def test_invalid_high_water_mark():
+    """Ensure a high-water mark below 1 is rejected."""
+    with pytest.raises(ValueError, match="at least 1"):
+        EventChannel(high_water_mark=0)
+
+
+def test_wakeup():
+    """Ensure the wakeup is set when an event is posted or the consumer notified."""
+    wakeup = Wakeup()
+    channel = EventChannel(high_water_mark=1, coalescible=lambda _e: True, wakeup=wakeup)
+    channel.put({"event": "first", "stdout": "one"})
+    assert wakeup.wait(0)
+    channel.put({"event": "second", "stdout": "two"})
+    assert wakeup.wait(0)
+    assert channel.stats.coalesced == 1
+    channel.notify()
+    assert wakeup.wait(0)
+    channel.close()
+    channel.put({"event": "third", "stdout": "three"})
+    assert not wakeup.wait(0)
@@ -0,0 +1,116 @@
+"""Tests for the long-lived execution environment container."""
+
+from __future__ import annotations
+
+import subprocess
+
+from pathlib import Path
+
+import pytest
+
+from distronode_navigator.runner.distronode_doc import DistronodeDoc
+from distronode_navigator.runner.warm_container import WarmContainer
+from distronode_navigator.runner.warm_container import is_safe_to_mount
+
+
+@pytest.fixture(name="container")
+def fixture_container(tmp_path: Path) -> WarmContainer:
+    """Provide a warm container with a temporary directory mounted.
+
+    :param tmp_path: A temporary directory
+    :returns: The warm container
+    """
+    return WarmContainer(
+        container_engine="podman",
+        image="image:latest",
+        volume_mounts=[f"{tmp_path}:{tmp_path}:z", f"{tmp_path / 'lib'}:/opt/lib"],
+    )
+
+
+def test_covers(container: WarmContainer, tmp_path: Path):
+    """Ensure only mounts and paths within the container's mounts are covered.
+
+    :param container: The warm container
+    :param tmp_path: A temporary directory
+    """
+    (tmp_path / "project").mkdir()
+    assert container.covers([f"{tmp_path}/project:{tmp_path}/project:Z"], [str(tmp_path)])
+    assert container.covers([f"{tmp_path / 'lib'}/../lib:/opt/lib"], [])
+    assert container.covers([], ["host1,host2"])
+    assert not container.covers([f"{tmp_path}/project:/project"], [])
+    assert not container.covers([], [str(tmp_path.parent)])
+
+
+def test_commands(container: WarmContainer, monkeypatch: pytest.MonkeyPatch):
+    """Ensure the container is started, used and removed with the engine.
+
+    :param container: The warm container
+    :param monkeypatch: The monkeypatch fixture
+    """
+    commands = []
+
+    def run(cmd_parts: list[str], **_kwargs) -> subprocess.CompletedProcess:
+        """Record the command and report the container is running.
+
+        :param cmd_parts: The command
+        :param _kwargs: The keyword arguments
+        :returns: The completed process
+        """
+        commands.append(cmd_parts)
+        return subprocess.CompletedProcess(cmd_parts, 0, stdout="true\n", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    assert not container.running()
+    assert container.start()
+    assert container.ensure_running()
+    out, _err, ret_code = container.exec(["distronode-doc", "-j"], {"A": "1"}, "/work")
+    container.stop()
+
+    assert (out, ret_code) == ("true\n", 0)
+    assert commands[0][:2] == ["podman", "run"]
+    assert commands[0][-4:] == ["--user=root", "image:latest", "sleep", "infinity"]
+    assert commands[2] == [
+        "podman",
+        "exec",
+        "--workdir",
+        "/work",
+        "--env",
+        "A=1",
+        container.name,
+        "distronode-doc",
+        "-j",
+    ]
+    assert commands[3] == ["podman", "rm", "--force", container.name]
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    (("/", False), ("/home", False), ("/usr/", False), ("/home/user", True)),
+)
+def test_is_safe_to_mount(path: str, expected: bool):
+    """Ensure the paths ansible-runner refuses to mount are not mounted.
+
+    :param path: The path to mount
+    :param expected: The expected result
+    """
+    assert is_safe_to_mount(path) is expected
+
+
+@pytest.mark.parametrize(
+    ("out", "expected"),
+    (
+        ('[WARNING]: old\n{"debug": {}}\n', {"debug": {}}),
+        ("[WARNING]: old\n{truncated", "[WARNING]: old\n{truncated"),
+    ),
+    ids=("json", "unparsable"),
+)
+def test_doc_in_container(monkeypatch: pytest.MonkeyPatch, out: str, expected: dict | str):
+    """Ensure documentation from the warm container is parsed, or left as text.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param out: The output of distronode-doc
+    :param expected: The expected response
+    """
+    doc = DistronodeDoc()
+    monkeypatch.setattr(doc, "_warm_exec", lambda *_args, **_kwargs: (out, "error", 0))
+    assert doc.fetch_plugin_doc(["debug"]) == (expected, "error")
@@ -0,0 +1,145 @@
+"""Compare the conversion of ansi colored lines to curses lines with the original."""
+
+from __future__ import annotations
+
+import re
+
+from itertools import chain
+
+import pytest
+
+from distronode_navigator.ui_framework.colorize import CURSES_STYLES
+from distronode_navigator.ui_framework.colorize import ansi_to_curses
+from distronode_navigator.ui_framework.curses_defs import CursesLine
+from distronode_navigator.ui_framework.curses_defs import CursesLinePart
+from distronode_navigator.ui_framework.ui_constants import Color
+from distronode_navigator.ui_framework.ui_constants import Decoration
+
+
+def reference_ansi_to_curses(line: str) -> CursesLine:
+    """Convert distronode color codes to curses colors, compiling the patterns each call.
+
+    This is the original implementation, used as the reference for the results
+    of ``ansi_to_curses``.
+
+    :param line: A string with ansi colors
+    :returns: A line ready for presentation in the TUI
+    """
+    if line == "":
+        line_part = CursesLinePart(
+            column=0,
+            string="",
+            color=Color.BLACK,
+            decoration=Decoration.NORMAL,
+        )
+        return CursesLine((line_part,))
+
+    printable = []
+    ansi_regex = re.compile(r"(\x1b\[[\d;]*m)")
+    color_regex = re.compile(
+        r"""(?x)
+            \x1b\[                              # Control Sequence Introducer
+            (?P<fg_action>(38;5|39);)?          # optional FG color action
+            (?P<_bg_action>(48;5|49);)?         # optional BG color action
+            (?P<one>\d+)                        # required, one number
+            (;(?P<two>\d+))?                    # optional 2nd number
+            m
+        """,
+    )
+    parts = ansi_regex.split(line)
+    colno = 0
+    color = 0
+    style = 0
+    while parts:
+        part = parts.pop(0)
+        if part:
+            match = color_regex.match(part)
+            if match:
+                cap = match.groupdict()
+                one = cap["one"]
+                two = cap["two"]
+                if cap["fg_action"] == "39;" or (one == "0" and two is None):
+                    pass  # default color
+                elif cap["fg_action"] == "38;5;":
+                    color = int(one)
+                    if two:
+                        style = CURSES_STYLES.get(int(two), None) or 0
+                elif not cap["fg_action"]:
+                    ansi_16 = list(chain(range(30, 38), range(90, 98)))
+                    if two is None:
+                        color = ansi_16.index(int(one)) if int(one) in ansi_16 else int(one)
+                    else:
+                        color = ansi_16.index(int(two)) if int(two) in ansi_16 else int(two)
+                        style = CURSES_STYLES.get(int(one), None) or 0
+            else:
+                curses_line = CursesLinePart(
+                    column=colno,
+                    string=part,
+                    color=color,
+                    decoration=style,
+                )
+                printable.append(curses_line)
+                colno += len(part)
+                color = 0
+                style = 0
+    return CursesLine(tuple(printable))
+
+
+PLAYBOOK_OUTPUT = (
+    "",
+    "PLAY [Configure the web servers] ***********************************************",
+    "",
+    "TASK [Gathering Facts] *********************************************************",
+    "\x1b[0;32mok: [host01]\x1b[0m",
+    "",
+    "TASK [Ensure the package is installed] *****************************************",
+    "\x1b[0;33mchanged: [host01]\x1b[0m",
+    "\x1b[0;36mskipping: [host02]\x1b[0m",
+    '\x1b[0;31mfatal: [host03]: FAILED! => {"changed": false, "msg": "No package"}\x1b[0m',
+    "\x1b[0;36m...ignoring\x1b[0m",
+    "\x1b[1;35m[WARNING]: Could not match supplied host pattern, ignoring: db\x1b[0m",
+    '\x1b[0;31mfatal: [host04]: UNREACHABLE! => {"changed": false, "unreachable": true}\x1b[0m',
+    "\x1b[38;5;208mdeprecated: the option is deprecated\x1b[0m",
+    "\x1b[38;5;33;1mbold 256 color\x1b[0m \x1b[39;49mdefault\x1b[0m",
+    "\x1b[48;5;200mbackground\x1b[0m \x1b[94mbright blue\x1b[0m \x1b[1;97mbright white\x1b[0m",
+    "\x1b[mreset without parameters\x1b[0m",
+    "",
+    "PLAY RECAP *********************************************************************",
+    (
+        "\x1b[0;32mhost01\x1b[0m                     : \x1b[0;32mok=2   \x1b[0m"
+        " \x1b[0;33mchanged=1   \x1b[0m unreachable=0    failed=0    \x1b[0;36mskipped=0"
+        "   \x1b[0m rescued=0    ignored=0"
+    ),
+    (
+        "\x1b[0;31mhost03\x1b[0m                     : \x1b[0;32mok=1   \x1b[0m changed=0"
+        "    unreachable=0    \x1b[0;31mfailed=1   \x1b[0m skipped=0    rescued=0    ignored=1"
+    ),
+)
+
+
+@pytest.mark.parametrize("line", PLAYBOOK_OUTPUT)
+def test_ansi_to_curses(line: str):
+    """Ensure the result matches the reference implementation.
+
+    :param line: A line of colored playbook output
+    """
+    assert ansi_to_curses(line) == reference_ansi_to_curses(line)
+
+
+def test_ansi_to_curses_cached():
+    """Convert colored playbook output once, reusing the conversion when redrawn."""
+    lines = [f"{line} {idx}" if line else line for idx in range(500) for line in PLAYBOOK_OUTPUT]
+    unique = len(set(lines))
+    ansi_to_curses.cache_clear()
+
+    expected = [reference_ansi_to_curses(line) for line in lines]
+    assert [ansi_to_curses(line) for line in lines] == expected
+    first = ansi_to_curses.cache_info()
+    assert first.misses == unique
+    assert first.hits == len(lines) - unique
+
+    # The lines are converted again each time the screen is redrawn
+    assert [ansi_to_curses(line) for line in lines] == expected
+    second = ansi_to_curses.cache_info()
+    assert second.misses == first.misses
+    assert second.hits == first.hits + len(lines)
@@ -12,6 +12,7 @@ from distronode_navigator.content_defs import ContentView
 from distronode_navigator.ui_framework.colorize import Colorize
 from distronode_navigator.ui_framework.curses_defs import SimpleLinePart
 from distronode_navigator.utils.serialize import SerializationFormat
+from distronode_navigator.utils.serialize import SerializedLines
 from distronode_navigator.utils.serialize import serialize
 
 
@@ -182,3 +183,33 @@ def test_styled_markdown():
     assert result == [
         [SimpleLinePart(chars="This is a header\n", column=0, color=(86, 156, 214), style="bold")],
     ]
+
+
+def test_render_window():
+    """Ensure a window of lines is colored the same as when the whole document is rendered."""
+    content_format = ContentFormat.YAML_TXT
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    doc = YAML_TXT * 200
+    expected = colorize.render(doc=doc, scope=content_format.value.scope)
+    lines = SerializedLines(doc)
+
+    for start, stop in ((1000, 1010), (0, 5), (1595, 1700), (300, 320)):
+        result = colorize.render_window(lines, content_format.value.scope, start, stop)
+        assert result == expected[start:stop]
+
+
+def test_line_cache():
+    """Ensure unchanged lines are not tokenized again when a document changes."""
+    # pylint: disable=protected-access
+    content_format = ContentFormat.YAML_TXT
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    colorize._tokenize_line.cache_clear()
+    colorize.render(doc=YAML_TXT, scope=content_format.value.scope)
+    misses = colorize._tokenize_line.cache_info().misses
+    # Repeated lines with the same starting state are only tokenized once
+    assert misses < len(YAML_TXT.splitlines())
+
+    changed = YAML_TXT.replace("after", "changed")
+    result = colorize.render(doc=changed, scope=content_format.value.scope)
+    assert colorize._tokenize_line.cache_info().misses == misses + 1
+    assert result[-1][3].chars == "changed"
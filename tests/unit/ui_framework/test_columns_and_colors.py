@@ -0,0 +1,112 @@
+"""Compare the conversion of regions to colors and columns with the original."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from distronode_navigator.constants import DATA_DIR
+from distronode_navigator.constants import GRAMMAR_DIR
+from distronode_navigator.constants import THEME_PATH
+from distronode_navigator.tm_tokenize.grammars import Grammars
+from distronode_navigator.tm_tokenize.region import Regions
+from distronode_navigator.tm_tokenize.tokenize import tokenize
+from distronode_navigator.ui_framework.colorize import ColorSchema
+from distronode_navigator.ui_framework.colorize import columns_and_colors
+from distronode_navigator.ui_framework.curses_defs import SimpleLinePart
+
+
+def reference_columns_and_colors(
+    lines: list[tuple[Regions, str]],
+    schema: ColorSchema,
+) -> list[list[SimpleLinePart]]:
+    """Convert to colors and columns one character at a time.
+
+    This is the original implementation, used as the reference for the results
+    of ``columns_and_colors``.
+
+    :param lines: Lines of text and their regions
+    :param schema: An instance of the ColorSchema
+    :returns: Lines of text, each broken into sections
+    """
+    results: list[list[SimpleLinePart]] = []
+
+    for line in lines:
+        line_parts = [
+            SimpleLinePart(chars=character, color=None, column=0, style=None)
+            for character in line[1]
+        ]
+
+        for region in line[0]:
+            color, style = schema.get_color_and_style(region.scope)
+            if color:
+                for idx in range(region.start, region.end):
+                    line_parts[idx].color = color
+            if style:
+                for idx in range(region.start, region.end):
+                    line_parts[idx].style = style
+
+        if line_parts:
+            grouped = [line_parts.pop(0)]
+            while line_parts:
+                entry = line_parts.pop(0)
+                if entry.color == grouped[-1].color and entry.style == grouped[-1].style:
+                    grouped[-1].chars += entry.chars
+                else:
+                    grouped.append(entry)
+            results.append(grouped)
+        else:
+            results.append([SimpleLinePart(chars=line[1], color=None, column=0, style=None)])
+
+    for result in results:
+        column = 0
+        for line_part in result:
+            line_part.column = column
+            column += len(line_part.chars)
+
+    return results
+
+
+def bundled_scopes() -> list[str]:
+    """Collect the scope names of all bundled grammars.
+
+    :returns: The sorted scope names
+    """
+    scopes = set()
+    for grammar in GRAMMAR_DIR.iterdir():
+        with grammar.open(encoding="utf-8") as fh:
+            scopes.add(json.load(fh)["scopeName"])
+    return sorted(scopes)
+
+
+SAMPLE_FILES = ("help.md", "settings-sample.template.yml", "settings-schema.partial.json")
+
+
+@pytest.fixture(scope="module", name="schema")
+def fixture_schema() -> ColorSchema:
+    """Provide the color schema for the default theme.
+
+    :returns: The color schema
+    """
+    with THEME_PATH.open(encoding="utf-8") as fh:
+        return ColorSchema(json.load(fh))
+
+
+@pytest.mark.parametrize("scope", bundled_scopes())
+def test_columns_and_colors(scope: str, schema: ColorSchema):
+    """Ensure the results match the reference implementation.
+
+    :param scope: The scope of the grammar
+    :param schema: The color schema
+    """
+    sample = "".join(DATA_DIR.joinpath(name).read_text(encoding="utf-8") for name in SAMPLE_FILES)
+    compiler = Grammars(str(GRAMMAR_DIR)).compiler_for_scope(scope)
+    state = compiler.root_state
+    lines = []
+    for line_idx, line in enumerate(sample.splitlines()):
+        line += "\n"
+        state, regions = tokenize(compiler, state, line, line_idx == 0)
+        lines.append((regions, line))
+
+    assert columns_and_colors(lines, schema) == reference_columns_and_colors(lines, schema)
@@ -0,0 +1,82 @@
+"""Tests for tracking the rows drawn on the screen."""
+
+from __future__ import annotations
+
+from distronode_navigator.ui_framework.curses_defs import CursesLine
+from distronode_navigator.ui_framework.curses_defs import CursesLinePart
+from distronode_navigator.ui_framework.frame import Frame
+from distronode_navigator.ui_framework.frame import FrameTracker
+
+
+SIZE = (24, 80)
+
+
+def line(text: str) -> CursesLine:
+    """Build a line of text.
+
+    :param text: The text
+    :returns: The line
+    """
+    return CursesLine((CursesLinePart(column=0, string=text, color=0, decoration=0),))
+
+
+def frame(*texts: str, footer: str = "esc: back") -> Frame:
+    """Build a frame with one content line for each text and a footer.
+
+    :param texts: The text of each content line
+    :param footer: The text of the footer
+    :returns: The frame
+    """
+    rows: Frame = {idx: ((f"{idx}│", line(text)),) for idx, text in enumerate(texts)}
+    rows[SIZE[0] - 1] = ((None, line(footer)),)
+    return rows
+
+
+def test_first_frame_drawn_in_full():
+    """Ensure the first frame erases the screen and draws every row."""
+    tracker = FrameTracker()
+    damage = tracker.damage(frame("one", "two"), SIZE)
+    assert damage.erase
+    assert list(damage.rows) == [0, 1, 23]
+    assert damage.characters == len("0│one1│twoesc: back")
+
+
+def test_unchanged_frame_draws_nothing():
+    """Ensure a frame identical to the last draws no rows."""
+    tracker = FrameTracker()
+    tracker.damage(frame("one", "two"), SIZE)
+    damage = tracker.damage(frame("one", "two"), SIZE)
+    assert not damage.erase
+    assert damage.rows == {}
+    assert damage.characters == 0
+    assert (tracker.frames, tracker.rows) == (2, 3)
+
+
+def test_changed_rows_drawn():
+    """Ensure only changed rows are drawn and rows no longer drawn are cleared."""
+    tracker = FrameTracker()
+    tracker.damage(frame("one", "two", "three"), SIZE)
+    damage = tracker.damage(frame("one", "2"), SIZE)
+    assert not damage.erase
+    assert damage.rows == {1: (("1│", line("2")),), 2: ()}
+
+
+def test_resize_and_invalidate():
+    """Ensure a resized or invalidated screen is drawn in full."""
+    tracker = FrameTracker()
+    tracker.damage(frame("one"), SIZE)
+    damage = tracker.damage(frame("one"), (30, 100))
+    assert damage.erase
+    assert list(damage.rows) == [0, 23]
+    tracker.invalidate()
+    assert tracker.damage(frame("one"), (30, 100)).erase
+
+
+def test_forget_row():
+    """Ensure a forgotten row is drawn with the next frame, even if it did not change."""
+    tracker = FrameTracker()
+    tracker.damage(frame("one"), SIZE)
+    tracker.forget_row(23)
+    tracker.forget_row(10)
+    damage = tracker.damage(frame("one"), SIZE)
+    assert damage.rows == {10: (), 23: ((None, line("esc: back")),)}
@@ -0,0 +1,119 @@
+"""Tests for the menu layout kept between frames by the menu builder."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from distronode_navigator.constants import GRAMMAR_DIR
+from distronode_navigator.constants import TERMINAL_COLORS_PATH
+from distronode_navigator.constants import THEME_PATH
+from distronode_navigator.ui_framework.menu_builder import MenuBuilder
+from distronode_navigator.ui_framework.ui_config import UIConfig
+
+
+COLUMNS = ["__play_name", "__ok", "__changed", "__progress"]
+
+UI_CONFIG = UIConfig(
+    color=False,
+    colors_initialized=True,
+    grammar_dir=GRAMMAR_DIR,
+    osc4=False,
+    terminal_colors_path=TERMINAL_COLORS_PATH,
+    theme_path=THEME_PATH,
+)
+
+
+class ColorMenuItem:
+    """A color callback counting the menu items colored."""
+
+    def __init__(self) -> None:
+        """Initialize the color callback."""
+        self.calls = 0
+
+    def __call__(self, _colno: int, colname: str, entry: dict[str, Any]) -> tuple[int, int]:
+        """Color a menu item.
+
+        :param colname: The column name
+        :param entry: The menu entry
+        :returns: The color and decoration
+        """
+        self.calls += 1
+        return (9 if entry.get("__failed") else 0), 0
+
+
+def menu_builder(color_menu_item: ColorMenuItem) -> MenuBuilder:
+    """Create a menu builder.
+
+    :param color_menu_item: The color callback
+    :returns: The menu builder
+    """
+    return MenuBuilder(
+        progress_bar_width=8,
+        screen_width=80,
+        number_colors=256,
+        color_menu_item=color_menu_item,
+        ui_config=UI_CONFIG,
+    )
+
+
+def plays(count: int) -> list[dict[str, Any]]:
+    """Create rows for a menu of plays.
+
+    :param count: The number of plays
+    :returns: The plays
+    """
+    return [
+        {"__play_name": f"Play {idx}", "__ok": idx, "__changed": 0, "__progress": "0%"}
+        for idx in range(count)
+    ]
+
+
+def test_unchanged_rows_reused():
+    """Ensure only changed rows are rendered again, matching a menu built without a cache."""
+    color_menu_item = ColorMenuItem()
+    builder = menu_builder(color_menu_item)
+    rows = plays(20)
+    indices = range(5, 15)
+
+    first = builder.build(rows, COLUMNS, indices)
+    assert color_menu_item.calls == len(indices) * len(COLUMNS)
+    assert builder.build(rows, COLUMNS, indices) == first
+    assert color_menu_item.calls == len(indices) * len(COLUMNS)
+
+    rows[7]["__changed"] = 3
+    rows[8]["__failed"] = 1
+    heading, lines = builder.build(rows, COLUMNS, indices)
+    assert color_menu_item.calls == (len(indices) + 2) * len(COLUMNS)
+    assert (heading, lines) == menu_builder(ColorMenuItem()).build(rows, COLUMNS, indices)
+    assert lines[2][2].string == "3"
+    assert lines[2][0].color == 0
+    assert lines[3][0].color == 9
+
+
+def test_column_widths_follow_changed_rows():
+    """Ensure a changed row that widens a column lays out every row again."""
+    color_menu_item = ColorMenuItem()
+    builder = menu_builder(color_menu_item)
+    rows = plays(10)
+    indices = range(10)
+    builder.build(rows, COLUMNS, indices)
+
+    rows[2]["__play_name"] = "A play with a much longer name"
+    rows[4]["__progress"] = "50%"
+    heading, lines = builder.build(rows, COLUMNS, indices)
+    assert color_menu_item.calls == 2 * len(indices) * len(COLUMNS)
+    assert (heading, lines) == menu_builder(ColorMenuItem()).build(rows, COLUMNS, indices)
+    assert rows[4]["___progress"] == "50%"
+    assert lines[4][3].string == "▇▇▇▇    "
+
+
+def test_new_rows_for_same_menu():
+    """Ensure rows replaced or appended in the same menu are rendered."""
+    builder = menu_builder(ColorMenuItem())
+    rows = plays(3)
+    builder.build(rows, COLUMNS, range(3))
+    rows[1] = {"__play_name": "Replaced", "__ok": 1, "__changed": 0, "__progress": "0%"}
+    rows.extend(plays(2))
+    _heading, lines = builder.build(rows, COLUMNS, range(5))
+    names = [line[0].string for line in lines]
+    assert names == ["Play 0", "Replaced", "Play 2", "Play 0", "Play 1"]
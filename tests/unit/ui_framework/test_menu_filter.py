@@ -0,0 +1,82 @@
+"""Tests for filtering the rows of a menu."""
+
+from __future__ import annotations
+
+import re
+
+from typing import Any
+
+from distronode_navigator.ui_framework.menu_filter import MenuFilter
+
+
+COLUMNS = ["__name", "__type"]
+
+
+def hosts(count: int) -> list[dict[str, Any]]:
+    """Create rows for a menu of hosts.
+
+    :param count: The number of hosts
+    :returns: The hosts
+    """
+    return [{"__name": f"host{idx}", "__type": "host", "vars": {}} for idx in range(count)]
+
+
+def test_filter_evaluated_once_per_row():
+    """Ensure the filter is evaluated for each row only until the row changes."""
+    menu_filter = MenuFilter()
+    rows = hosts(100)
+    regex = re.compile("host1")
+    expected = tuple(idx for idx in range(100) if str(idx).startswith("1"))
+    assert menu_filter.indices(regex, rows, COLUMNS) == expected
+    assert menu_filter.evaluated == 100
+    assert menu_filter.indices(regex, rows, COLUMNS) == expected
+    assert menu_filter.evaluated == 100
+
+    rows[50]["__name"] = "host150"
+    rows[10]["vars"] = {"changed": "not a filtered column"}
+    assert menu_filter.indices(regex, rows, COLUMNS) == tuple(sorted((*expected, 50)))
+    assert menu_filter.evaluated == 101
+
+
+def test_rows_appended_and_removed():
+    """Ensure appended rows are filtered and removed rows dropped from the indices."""
+    menu_filter = MenuFilter()
+    rows = hosts(20)
+    regex = re.compile("host1")
+    menu_filter.indices(regex, rows, COLUMNS)
+    rows.extend(hosts(12))
+    assert menu_filter.indices(regex, rows, COLUMNS) == (1, *range(10, 20), 21, 30, 31)
+    assert menu_filter.evaluated == 32
+    del rows[15:]
+    assert menu_filter.indices(regex, rows, COLUMNS) == (1, *range(10, 15))
+
+
+def test_versioned_rows():
+    """Ensure rows with a version are filtered again only when the version changes."""
+
+    class Row(dict):
+        """A row with a version."""
+
+        row_version = 0
+
+    menu_filter = MenuFilter()
+    rows = [Row(__name="alpha"), Row(__name="beta")]
+    regex = re.compile("alpha")
+    assert menu_filter.indices(regex, rows, COLUMNS) == (0,)
+    rows[1]["__name"] = "alpha"
+    assert menu_filter.indices(regex, rows, COLUMNS) == (0,)
+    rows[1].row_version = 1
+    assert menu_filter.indices(regex, rows, COLUMNS) == (0, 1)
+
+
+def test_cache_bounded():
+    """Ensure the filtered menus kept are limited to the cache size."""
+    menu_filter = MenuFilter(cache_size=2)
+    rows = hosts(10)
+    for pattern in ("host1", "host2", "host3"):
+        menu_filter.indices(re.compile(pattern), rows, COLUMNS)
+    assert menu_filter.evaluated == 30
+    menu_filter.indices(re.compile("host1"), rows, COLUMNS)
+    assert menu_filter.evaluated == 40
+    menu_filter.indices(re.compile("host3"), rows, COLUMNS)
+    assert menu_filter.evaluated == 40
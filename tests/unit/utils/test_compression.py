@@ -0,0 +1,130 @@
+"""Tests for compressed files, with a comparison of artifact size."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from distronode_navigator.content_defs import ContentView
+from distronode_navigator.content_defs import SerializationFormat
+from distronode_navigator.utils.compression import HAS_ZSTANDARD
+from distronode_navigator.utils.compression import compression_from_content
+from distronode_navigator.utils.compression import compression_from_name
+from distronode_navigator.utils.compression import open_text
+from distronode_navigator.utils.serialize import serialize_write_file
+
+
+COMPRESSIONS = ("gzip", "lzma", *(("zstd",) if HAS_ZSTANDARD else ()))
+
+
+@pytest.mark.parametrize(
+    ("filename", "compression"),
+    (
+        ("artifact.json", None),
+        ("artifact.json.gz", "gzip"),
+        ("artifact.json.xz", "lzma"),
+        ("artifact.JSON.XZ", "lzma"),
+        ("artifact.json.zst", "zstd"),
+    ),
+)
+def test_compression_from_name(filename: str, compression: str | None):
+    """Ensure the compression is chosen from the suffix of the file name.
+
+    :param filename: The file name
+    :param compression: The expected compression
+    """
+    assert compression_from_name(filename) == compression
+
+
+@pytest.mark.parametrize("compression", (None, *COMPRESSIONS))
+def test_round_trip(tmp_path: Path, compression: str | None):
+    """Ensure text is read back as written and the compression detected from the content.
+
+    :param tmp_path: A temporary directory
+    :param compression: The compression
+    """
+    path = tmp_path / "artifact"
+    with open_text(path, "w", compression) as fh:
+        fh.write("first\n")
+    with open_text(path, "a", compression) as fh:
+        fh.write("second\n")
+    assert compression_from_content(path) == compression
+    with open_text(path, "r", compression_from_content(path)) as fh:
+        assert fh.read() == "first\nsecond\n"
+
+
+def test_unknown_compression(tmp_path: Path):
+    """Ensure an unknown compression is rejected.
+
+    :param tmp_path: A temporary directory
+    """
+    with pytest.raises(ValueError, match="Unknown compression 'bz2'"):
+        open_text(tmp_path / "artifact", "w", "bz2")
+
+
+def sample_artifact(task_count: int) -> dict:
+    """Build an artifact resembling that of a large playbook run.
+
+    :param task_count: The number of tasks in the play
+    :returns: The artifact
+    """
+    tasks = [
+        {
+            "__changed": idx % 3 == 0,
+            "__duration": "1s",
+            "__host": f"host{idx % 50}",
+            "__number": idx,
+            "__result": "Ok",
+            "host": f"host{idx % 50}",
+            "play": "Configure the web servers",
+            "res": {
+                "changed": idx % 3 == 0,
+                "msg": f"All items completed for task {idx}",
+                "results": [{"item": item, "stdout": "done " * 10} for item in range(5)],
+            },
+            "task": f"Ensure package {idx} is installed",
+            "task_uuid": f"00000000-0000-0000-0000-{idx:012d}",
+        }
+        for idx in range(task_count)
+    ]
+    play = {"__play_name": "Configure the web servers", "tasks": tasks}
+    return {"version": "2.0.0", "plays": [play], "stdout": ["ok: [host]"] * task_count}
+
+
+@pytest.mark.parametrize(
+    ("compression", "compact"),
+    ((None, False), (None, True), *((compression, True) for compression in COMPRESSIONS)),
+)
+def test_artifact_size(tmp_path: Path, compression: str | None, compact: bool):
+    """Compare the size of an artifact with that written uncompressed, and read it back.
+
+    :param tmp_path: A temporary directory
+    :param compression: The compression
+    :param compact: Write compact JSON
+    """
+    artifact = sample_artifact(task_count=2_000)
+
+    def write(path: Path, compression: str | None, compact: bool) -> int:
+        serialize_write_file(
+            content=artifact,
+            content_view=ContentView.NORMAL,
+            file_mode="w",
+            file=path,
+            serialization_format=SerializationFormat.JSON,
+            compact=compact,
+            compression=compression,
+        )
+        with open_text(path, "r", compression_from_content(path)) as fh:
+            assert json.load(fh) == artifact
+        return path.stat().st_size
+
+    reference = write(tmp_path / "reference.json", compression=None, compact=False)
+    result = write(tmp_path / "artifact", compression=compression, compact=compact)
+
+    if compact:
+        assert result < reference
+    if compression:
+        assert result < reference / 5
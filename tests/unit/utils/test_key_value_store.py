@@ -1,5 +1,6 @@
 """Test KVS from distronode_navigator.utils."""
 
+import threading
 import types
 
 from distronode_navigator.utils.key_value_store import KeyValueStore
@@ -135,3 +136,73 @@ def test_kvs_repr(kvs: KeyValueStore, empty_kvs: KeyValueStore):
     )
 
     assert repr(empty_kvs) == "KeyValueStore()"
+
+
+def test_kvs_bulk(empty_kvs: KeyValueStore):
+    """Test KVS set_many(), get_many() and contains_many() across statement chunks.
+
+    :param empty_kvs: An empty key-value store
+    """
+    items = [(f"key_{idx}", f"value_{idx}") for idx in range(2_000)]
+    empty_kvs.set_many(items)
+    assert len(empty_kvs) == 2_000
+
+    keys = [f"key_{idx}" for idx in range(0, 4_000, 2)]
+    found = empty_kvs.get_many(keys)
+    assert found == {f"key_{idx}": f"value_{idx}" for idx in range(0, 2_000, 2)}
+    assert empty_kvs.contains_many(keys) == set(found)
+    assert empty_kvs.get_many([]) == {}
+
+
+def test_kvs_wal_reopen(empty_kvs: KeyValueStore):
+    """Test KVS uses write-ahead logging and reuses an open connection.
+
+    :param empty_kvs: An empty key-value store
+    """
+    conn = empty_kvs.open_()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert empty_kvs.open_() is conn
+
+    empty_kvs["hello"] = "whoop"
+    empty_kvs.close()
+    empty_kvs.close()
+    assert empty_kvs.open_() is not conn
+    assert empty_kvs["hello"] == "whoop"
+
+
+def test_kvs_threads(empty_kvs: KeyValueStore):
+    """Test KVS connection shared across threads.
+
+    :param empty_kvs: An empty key-value store
+    """
+
+    def write(thread: int) -> None:
+        """Write keys from a thread.
+
+        :param thread: The thread number
+        """
+        for idx in range(100):
+            empty_kvs[f"{thread}_{idx}"] = str(idx)
+        assert len(list(empty_kvs.iteritems())) >= 100
+
+    threads = [threading.Thread(target=write, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(empty_kvs) == 400
+
+
+def test_kvs_tables(empty_kvs: KeyValueStore):
+    """Test KVS tables sharing one database file are independent.
+
+    :param empty_kvs: An empty key-value store
+    """
+    empty_kvs["hello"] = "whoop"
+    empty_kvs.close()
+    side_table = KeyValueStore(empty_kvs.path, table="side")
+    side_table["hello"] = "world"
+    side_table.close()
+
+    assert KeyValueStore(empty_kvs.path)["hello"] == "whoop"
+    assert dict(KeyValueStore(empty_kvs.path, table="side").items()) == {"hello": "world"}
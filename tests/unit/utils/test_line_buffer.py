@@ -0,0 +1,44 @@
+"""Tests for the line buffer."""
+
+from __future__ import annotations
+
+import pytest
+
+from distronode_navigator.utils.line_buffer import LineBuffer
+
+
+def test_in_memory():
+    """Ensure lines below the memory limit are held in memory."""
+    buffer = LineBuffer(memory_lines=10, lines=["first", "second"])
+    buffer.append("third")
+    assert list(buffer) == ["first", "second", "third"]
+    assert (len(buffer), buffer.spilled) == (3, 0)
+
+
+def test_spilled():
+    """Ensure older lines are spilled to disk and any line or range can be read back."""
+    lines = [f"line {idx} \x1b[0;32mok\x1b[0m é" if idx % 7 else "" for idx in range(1_000)]
+    buffer = LineBuffer(memory_lines=100)
+    for start in range(0, len(lines), 33):
+        buffer.extend(lines[start : start + 33])
+    assert len(buffer) == len(lines)
+    assert 0 < buffer.spilled <= len(lines) - 50
+    assert list(buffer) == lines
+    assert buffer[0] == lines[0]
+    assert buffer[-1] == lines[-1]
+    assert buffer[buffer.spilled - 1] == lines[buffer.spilled - 1]
+    around = slice(buffer.spilled - 5, buffer.spilled + 5)
+    assert buffer[around] == lines[around]
+    assert buffer[10:20] == lines[10:20]
+    assert buffer[::100] == lines[::100]
+    assert buffer[5:3] == lines[5:3] == []
+    assert buffer[buffer.spilled + 5 : buffer.spilled] == []
+    assert buffer[len(lines) :] == []
+    with pytest.raises(IndexError):
+        buffer[len(lines)]  # pylint: disable=pointless-statement
+
+
+def test_invalid_memory_lines():
+    """Ensure holding less than one line in memory is rejected."""
+    with pytest.raises(ValueError, match="at least 1"):
+        LineBuffer(memory_lines=0)
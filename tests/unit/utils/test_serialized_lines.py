@@ -0,0 +1,54 @@
+"""Tests for indexing the lines of serialized content."""
+
+from __future__ import annotations
+
+import pytest
+
+from distronode_navigator.content_defs import ContentView
+from distronode_navigator.content_defs import SerializationFormat
+from distronode_navigator.utils.serialize import SerializedLines
+from distronode_navigator.utils.serialize import serialize
+from distronode_navigator.utils.serialize import serialize_lines
+
+
+@pytest.mark.parametrize(
+    "text",
+    (
+        "",
+        "one",
+        "one\n",
+        "\n",
+        "one\r\ntwo\rthree\x85four\n\nfive",
+        "one\u2028two\n\n",
+    ),
+    ids=("empty", "no-newline", "newline", "only-newline", "mixed", "unicode"),
+)
+def test_lines_match_splitlines(text: str):
+    """Ensure lines are split on the same boundaries as ``str.splitlines``.
+
+    :param text: The text to index
+    """
+    lines = SerializedLines(text)
+    expected = text.splitlines()
+    assert len(lines) == len(expected)
+    assert list(lines) == expected
+    assert lines[1:3] == expected[1:3]
+    if expected:
+        assert lines[-1] == expected[-1]
+
+
+@pytest.mark.parametrize("serialization_format", SerializationFormat)
+def test_serialize_lines(serialization_format: SerializationFormat):
+    """Ensure serialized lines match the serialized content.
+
+    :param serialization_format: The serialization format
+    """
+    content = {"stdout_lines": [f"line {idx}" for idx in range(100)], "msg": "one\ntwo"}
+    kwargs = {
+        "content": content,
+        "content_view": ContentView.NORMAL,
+        "serialization_format": serialization_format,
+    }
+    lines = serialize_lines(**kwargs)
+    assert lines.text == serialize(**kwargs)
+    assert list(lines) == serialize(**kwargs).splitlines()
@@ -0,0 +1,47 @@
+"""Tests for the spill store."""
+
+from __future__ import annotations
+
+from distronode_navigator.utils.spill_store import SpillStore
+
+
+def test_in_memory():
+    """Ensure payloads below the memory limit are held in memory and decoded when requested."""
+    store = SpillStore()
+    payload = {"task": "one", "res": {"changed": True}}
+    key = store.add(payload)
+    assert store.get(key) == payload
+    assert store.get(key) is not payload
+    assert (len(store), store.spilled) == (1, 0)
+
+
+def test_recent():
+    """Ensure the most recently requested payload is decoded once, until replaced."""
+    store = SpillStore()
+    first = store.add({"task": "one"})
+    second = store.add({"task": "two"})
+    recent = store.get(first)
+    assert store.get(first) is recent
+
+    store.replace(first, {"task": "one", "res": {}})
+    replaced = store.get(first)
+    assert replaced == {"task": "one", "res": {}}
+    assert replaced is not recent
+
+    assert store.get(second) == {"task": "two"}
+    assert store.get(first) is not replaced
+
+
+def test_spilled():
+    """Ensure payloads are spilled to disk once the memory limit is reached."""
+    store = SpillStore(memory_limit=100)
+    keys = [store.add({"number": idx, "res": "x" * 40}) for idx in range(10)]
+    assert store.spilled > 0
+    assert [store.get(key)["number"] for key in keys] == list(range(10))
+
+    store.replace(keys[0], {"number": 100})
+    assert store.get(keys[0]) == {"number": 100}
+    assert len(store) == 10
+
+    store.clear()
+    assert (len(store), store.spilled) == (0, 0)
@@ -0,0 +1,80 @@
+"""Tests for the startup cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from distronode_navigator.utils import startup_cache
+from distronode_navigator.utils.startup_cache import StartupCache
+from distronode_navigator.utils.startup_cache import environment_key
+
+
+def test_get_set(tmp_path: Path) -> None:
+    """Keep a result across instances.
+
+    :param tmp_path: The path to a test temporary directory
+    """
+    key = environment_key()
+    cache = StartupCache(tmp_path / "cache")
+    assert cache.get("dependencies", key) is None
+    cache.set("dependencies", key, ["pkg==1.0 /site-packages/pkg"])
+    assert StartupCache(tmp_path / "cache").get("dependencies", key) == [
+        "pkg==1.0 /site-packages/pkg",
+    ]
+    assert cache.get("other", key) is None
+
+
+def test_environment_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Change the key when the environment changes.
+
+    :param tmp_path: The path to a test temporary directory
+    :param monkeypatch: The monkeypatch fixture
+    """
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    monkeypatch.syspath_prepend(str(site_packages))
+    key = environment_key()
+    assert environment_key() == key
+
+    (site_packages / "pkg").mkdir()
+    installed = environment_key()
+    assert installed != key
+
+    monkeypatch.setenv("PATH", f"{tmp_path}:/usr/bin")
+    assert environment_key() != installed
+
+    cfg = tmp_path / "distronode.cfg"
+    assert environment_key(paths=[cfg]) != environment_key()
+    no_cfg = environment_key(paths=[cfg])
+    cfg.write_text("[defaults]\n")
+    assert environment_key(paths=[cfg]) != no_cfg
+    assert environment_key(values=["/cwd"]) != environment_key(values=["/other"])
+
+
+def test_emptied_when_full(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Empty the cache once it holds too many entries.
+
+    :param tmp_path: The path to a test temporary directory
+    :param monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(startup_cache, "STARTUP_CACHE_ENTRIES", 3)
+    cache = StartupCache(tmp_path)
+    for idx in range(3):
+        cache.set("result", str(idx), idx)
+    assert [cache.get("result", str(idx)) for idx in range(3)] == [0, 1, 2]
+    cache.set("result", "3", 3)
+    assert [cache.get("result", str(idx)) for idx in range(4)] == [None, None, None, 3]
+
+
+def test_unavailable(tmp_path: Path) -> None:
+    """Cache nothing when the cache cannot be opened.
+
+    :param tmp_path: The path to a test temporary directory
+    """
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    cache = StartupCache(not_a_directory)
+    cache.set("result", "key", 1)
+    assert cache.get("result", "key") is None
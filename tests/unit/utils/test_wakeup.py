@@ -0,0 +1,33 @@
+"""Tests for waking a thread waiting on file descriptors."""
+
+from __future__ import annotations
+
+import select
+import threading
+
+from distronode_navigator.utils.wakeup import Wakeup
+
+
+def test_set_and_clear():
+    """Ensure the wakeup is readable once set, however often, until cleared."""
+    wakeup = Wakeup()
+    assert not wakeup.is_set()
+    assert select.select([wakeup], [], [], 0)[0] == []
+    for _ in range(10_000):
+        wakeup.set()
+    assert wakeup.is_set()
+    assert select.select([wakeup], [], [], 0)[0] == [wakeup]
+    wakeup.clear()
+    assert not wakeup.is_set()
+    assert select.select([wakeup], [], [], 0)[0] == []
+
+
+def test_wait():
+    """Ensure waiting returns when set from another thread, or after the timeout."""
+    wakeup = Wakeup()
+    assert not wakeup.wait(0.01)
+    thread = threading.Timer(0.01, wakeup.set)
+    thread.start()
+    assert wakeup.wait(5)
+    thread.join()
+    assert not wakeup.is_set()